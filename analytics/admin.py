@@ -0,0 +1,20 @@
+from django.contrib import admin
+
+from analytics.models import HotelDailyStats
+from booking_clone.admin import AutocompleteFilter, LargeTableAdmin
+
+
+@admin.register(HotelDailyStats)
+class HotelDailyStatsAdmin(LargeTableAdmin):
+    list_display = [
+        "hotel",
+        "room_type",
+        "date",
+        "rooms_sold",
+        "revenue",
+        "cancellations",
+    ]
+    list_filter = ["date", ("hotel", AutocompleteFilter), "room_type"]
+    list_select_related = ["hotel", "room_type"]
+    search_fields = ["hotel__name"]
+    date_hierarchy = "date"
@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from analytics.rollups import reconcile_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute hotel analytics rollups from bookings and payments"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="start",
+            help="First date to recompute (default: 30 days ago)",
+        )
+        parser.add_argument(
+            "--to",
+            dest="end",
+            help="Last date to recompute (default: one year ahead)",
+        )
+        parser.add_argument(
+            "--hotel",
+            type=int,
+            action="append",
+            dest="hotels",
+            help="Only this hotel id (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        start = self.parse(options["start"], today - timedelta(days=30))
+        end = self.parse(options["end"], today + timedelta(days=365))
+        if start > end:
+            raise CommandError("--from must not be after --to.")
+
+        checked, rewritten = reconcile_stats(
+            start, end + timedelta(days=1), options["hotels"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled {checked} hotels from {start} to {end}, "
+                f"{rewritten} rollup rows rewritten."
+            )
+        )
+
+    def parse(self, value, default):
+        if value is None:
+            return default
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        if date is None:
+            raise CommandError(f"Invalid date: {value}")
+        return date
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("hotels", "0005_room_hotel_avail_guests_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HotelDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("rooms_sold", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2, default=0, max_digits=12
+                    ),
+                ),
+                ("cancellations", models.PositiveIntegerField(default=0)),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_stats",
+                        to="hotels.hotel",
+                    ),
+                ),
+                (
+                    "room_type",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="daily_stats",
+                        to="hotels.roomtype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "hotel daily stats",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("hotel", "date", "room_type"),
+                        name="hotel_daily_stats_unique",
+                    )
+                ],
+            },
+        ),
+    ]
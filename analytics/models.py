@@ -0,0 +1,37 @@
+from django.db import models
+
+from hotels.models import Hotel, RoomType
+
+
+class HotelDailyStats(models.Model):
+    """
+    Daily rollup of a hotel's confirmed room-nights, paid revenue and
+    cancellations per room type, maintained from Booking and Payment
+    changes by analytics.rollups.
+    """
+
+    hotel = models.ForeignKey(
+        Hotel, on_delete=models.CASCADE, related_name="daily_stats"
+    )
+    room_type = models.ForeignKey(
+        RoomType,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="daily_stats",
+    )
+    date = models.DateField()
+    rooms_sold = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cancellations = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = "hotel daily stats"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["hotel", "date", "room_type"],
+                name="hotel_daily_stats_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.hotel_id} / {self.room_type_id} - {self.date}"
@@ -0,0 +1,218 @@
+import calendar
+from collections import defaultdict
+from datetime import timedelta
+from decimal import ROUND_DOWN, Decimal
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth
+
+from analytics.models import HotelDailyStats
+from bookings.models import Booking
+from hotels.models import Hotel
+from payments.models import PaymentStatus
+
+CENT = Decimal("0.01")
+ROLLUP_STATUSES = ("CONFIRMED", "CANCELLED")
+STATS_FIELDS = ["rooms_sold", "revenue", "cancellations"]
+
+
+def stay_dates(check_in, check_out):
+    for offset in range((check_out - check_in).days):
+        yield check_in + timedelta(days=offset)
+
+
+def split_revenue(amount, nights):
+    """Split a payment over the nights of a stay, to the cent."""
+    per_night = (amount / nights).quantize(CENT, rounding=ROUND_DOWN)
+    shares = [per_night] * nights
+    shares[0] += amount - per_night * nights
+    return shares
+
+
+def compute_stats(hotel_id, start, end):
+    """
+    Compute the rollup values of a hotel for dates in [start, end) from
+    its bookings, keyed by (room_type_id, date).
+
+    Confirmed bookings count one room sold per night and spread their paid
+    payment over the nights; cancelled bookings count on their check-in.
+    """
+    bookings = Booking.objects.filter(
+        room__hotel_id=hotel_id,
+        status__in=ROLLUP_STATUSES,
+        check_in__lt=end,
+        check_out__gt=start,
+    ).values_list(
+        "room__room_type_id",
+        "status",
+        "check_in",
+        "check_out",
+        "payment__status",
+        "payment__amount",
+    )
+
+    stats = defaultdict(lambda: [0, Decimal("0.00"), 0])
+    for room_type_id, status, check_in, check_out, paid, amount in bookings:
+        if status == "CANCELLED":
+            if start <= check_in < end:
+                stats[(room_type_id, check_in)][2] += 1
+            continue
+
+        nights = list(stay_dates(check_in, check_out))
+        if paid == PaymentStatus.PAID and nights:
+            shares = split_revenue(amount, len(nights))
+        else:
+            shares = [Decimal("0.00")] * len(nights)
+        for night, share in zip(nights, shares):
+            if start <= night < end:
+                row = stats[(room_type_id, night)]
+                row[0] += 1
+                row[1] += share
+    return {key: tuple(values) for key, values in stats.items()}
+
+
+@transaction.atomic
+def refresh_hotel_stats(hotel_id, start, end):
+    """
+    Bring the rollup rows of a hotel for dates in [start, end) in line
+    with its bookings, touching only rows whose values changed. Returns
+    the number of rows created, updated or deleted.
+    """
+    # Lock the hotel so concurrent refreshes of it cannot interleave.
+    if not list(
+        Hotel.objects.select_for_update()
+        .filter(pk=hotel_id)
+        .values_list("pk", flat=True)
+    ):
+        return 0
+
+    expected = compute_stats(hotel_id, start, end)
+    stale = []
+    changed = []
+    for row in HotelDailyStats.objects.filter(
+        hotel_id=hotel_id, date__gte=start, date__lt=end
+    ):
+        values = expected.pop((row.room_type_id, row.date), None)
+        if values is None:
+            stale.append(row.pk)
+        elif (row.rooms_sold, row.revenue, row.cancellations) != values:
+            row.rooms_sold, row.revenue, row.cancellations = values
+            changed.append(row)
+
+    if stale:
+        HotelDailyStats.objects.filter(pk__in=stale).delete()
+    if changed:
+        HotelDailyStats.objects.bulk_update(changed, STATS_FIELDS)
+    HotelDailyStats.objects.bulk_create(
+        HotelDailyStats(
+            hotel_id=hotel_id,
+            room_type_id=room_type_id,
+            date=date,
+            rooms_sold=rooms_sold,
+            revenue=revenue,
+            cancellations=cancellations,
+        )
+        for (room_type_id, date), (
+            rooms_sold,
+            revenue,
+            cancellations,
+        ) in expected.items()
+    )
+    return len(stale) + len(changed) + len(expected)
+
+
+def schedule_refresh(hotel_id, start, end):
+    """Refresh a hotel's rollups once the current transaction commits."""
+    transaction.on_commit(lambda: refresh_hotel_stats(hotel_id, start, end))
+
+
+def reconcile_stats(start, end, hotel_ids=None):
+    """
+    Recompute the rollups of every hotel (or of ``hotel_ids``) for dates
+    in [start, end), repairing drift left by changes the signals do not
+    see, such as queryset updates or rooms changing type. Returns the
+    number of hotels checked and of rows rewritten.
+    """
+    hotels = Hotel.objects.order_by("pk").values_list("pk", flat=True)
+    if hotel_ids:
+        hotels = hotels.filter(pk__in=hotel_ids)
+    checked = rewritten = 0
+    for hotel_id in hotels.iterator():
+        checked += 1
+        rewritten += refresh_hotel_stats(hotel_id, start, end)
+    return checked, rewritten
+
+
+def periods(start, end, granularity):
+    """Yield (period, first_day, last_day) covering [start, end]."""
+    if granularity == "day":
+        for day in stay_dates(start, end + timedelta(days=1)):
+            yield day, day, day
+        return
+
+    month = start.replace(day=1)
+    while month <= end:
+        last = month.replace(
+            day=calendar.monthrange(month.year, month.month)[1]
+        )
+        yield month, max(month, start), min(last, end)
+        month = last + timedelta(days=1)
+
+
+def period_stats(rooms_sold, revenue, cancellations, capacity):
+    return {
+        "rooms_sold": rooms_sold,
+        "revenue": revenue,
+        "cancellations": cancellations,
+        "occupancy_rate": (
+            round(rooms_sold / capacity, 4) if capacity else 0.0
+        ),
+        "adr": (revenue / rooms_sold).quantize(CENT) if rooms_sold else None,
+    }
+
+
+def hotel_report(hotel_id, start, end, granularity):
+    """
+    Occupancy, ADR (average daily rate) and revenue of a hotel for the
+    dates in [start, end] per day or month, read from the rollups only.
+    Occupancy is measured against the hotel's current number of rooms.
+    """
+    rooms = Hotel.objects.get(pk=hotel_id).rooms.count()
+    period = TruncMonth("date") if granularity == "month" else F("date")
+    sums = {
+        row["period"]: row
+        for row in HotelDailyStats.objects.filter(
+            hotel_id=hotel_id, date__range=(start, end)
+        )
+        .annotate(period=period)
+        .values("period")
+        .annotate(
+            rooms_sold_sum=Sum("rooms_sold"),
+            revenue_sum=Sum("revenue"),
+            cancellations_sum=Sum("cancellations"),
+        )
+        .order_by()
+    }
+
+    results = []
+    totals = [0, Decimal("0.00"), 0]
+    for key, first_day, last_day in periods(start, end, granularity):
+        row = sums.get(key, {})
+        values = (
+            row.get("rooms_sold_sum") or 0,
+            row.get("revenue_sum") or Decimal("0.00"),
+            row.get("cancellations_sum") or 0,
+        )
+        days = (last_day - first_day).days + 1
+        results.append({"period": key, **period_stats(*values, rooms * days)})
+        totals = [total + value for total, value in zip(totals, values)]
+
+    days = (end - start).days + 1
+    return {
+        "hotel": hotel_id,
+        "granularity": granularity,
+        "rooms": rooms,
+        "totals": period_stats(*totals, rooms * days),
+        "results": results,
+    }
@@ -0,0 +1,59 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+
+ANALYTICS_MAX_DAYS = 731
+ANALYTICS_DEFAULT_DAYS = 30
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """Validates the ``from``, ``to`` and ``granularity`` query params."""
+
+    def get_fields(self):
+        # "from" is a keyword, so the fields cannot be class attributes.
+        return {
+            "from": serializers.DateField(required=False),
+            "to": serializers.DateField(required=False),
+            "granularity": serializers.ChoiceField(
+                choices=["day", "month"], default="day"
+            ),
+        }
+
+    def validate(self, attrs):
+        end = attrs.get("to") or timezone.localdate()
+        start = attrs.get("from") or end - timedelta(
+            days=ANALYTICS_DEFAULT_DAYS - 1
+        )
+        if start > end:
+            raise serializers.ValidationError(
+                {"to": "The end date must not be before the start date."}
+            )
+        if (end - start).days >= ANALYTICS_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"The date range cannot exceed {ANALYTICS_MAX_DAYS} days."
+            )
+        attrs["from"], attrs["to"] = start, end
+        return attrs
+
+
+class AnalyticsTotalsSerializer(serializers.Serializer):
+    rooms_sold = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+    cancellations = serializers.IntegerField()
+    occupancy_rate = serializers.FloatField()
+    adr = serializers.DecimalField(
+        max_digits=12, decimal_places=2, allow_null=True
+    )
+
+
+class AnalyticsPeriodSerializer(AnalyticsTotalsSerializer):
+    period = serializers.DateField()
+
+
+class HotelAnalyticsSerializer(serializers.Serializer):
+    hotel = serializers.IntegerField()
+    granularity = serializers.CharField()
+    rooms = serializers.IntegerField()
+    totals = AnalyticsTotalsSerializer()
+    results = AnalyticsPeriodSerializer(many=True)
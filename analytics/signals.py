@@ -0,0 +1,65 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from analytics.rollups import ROLLUP_STATUSES, schedule_refresh
+from bookings.models import Booking
+from payments.models import Payment
+
+
+def booking_stay(booking_id):
+    """Return (hotel_id, check_in, check_out, status) as stored."""
+    return (
+        Booking.objects.filter(pk=booking_id)
+        .values_list("room__hotel_id", "check_in", "check_out", "status")
+        .first()
+    )
+
+
+def refresh_stay(stay):
+    hotel_id, check_in, check_out, status = stay
+    if status in ROLLUP_STATUSES:
+        schedule_refresh(hotel_id, check_in, check_out)
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_stay(sender, instance, raw=False, **kwargs):
+    instance._stored_stay = None
+    if instance.pk and not raw:
+        instance._stored_stay = booking_stay(instance.pk)
+
+
+@receiver(post_save, sender=Booking)
+def refresh_booking_stats(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    dates = (instance.room.hotel_id, instance.check_in, instance.check_out)
+    statuses = {instance.status}
+    stored = getattr(instance, "_stored_stay", None)
+    if stored and stored[:3] != dates:
+        refresh_stay(stored)
+    elif stored:
+        statuses.add(stored[3])
+    if statuses.intersection(ROLLUP_STATUSES):
+        schedule_refresh(*dates)
+
+
+@receiver(post_delete, sender=Booking)
+def refresh_deleted_booking_stats(sender, instance, **kwargs):
+    refresh_stay(
+        (
+            instance.room.hotel_id,
+            instance.check_in,
+            instance.check_out,
+            instance.status,
+        )
+    )
+
+
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+def refresh_payment_stats(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    stay = booking_stay(instance.booking_id)
+    if stay is not None:
+        refresh_stay(stay)
@@ -0,0 +1,116 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from analytics.models import HotelDailyStats
+from analytics.rollups import split_revenue
+from bookings.models import Booking
+from hotels.models import Hotel, Room, RoomType
+from payments.models import Payment, PaymentStatus
+
+
+class HotelDailyStatsTest(TestCase):
+    def setUp(self):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel", owner=owner)
+        self.room_type = RoomType.objects.create(
+            name="Double", max_guests=2, size=20, bed_count=1
+        )
+        self.room = Room.objects.create(
+            hotel=self.hotel, number="1", room_type=self.room_type, price=100
+        )
+        self.check_in = date(2025, 3, 1)
+
+    def book(self, nights=3, amount="100.00"):
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = Booking.objects.create(
+                user=self.guest,
+                room=self.room,
+                check_in=self.check_in,
+                check_out=self.check_in + timedelta(days=nights),
+            )
+            Payment.objects.create(booking=booking, amount=Decimal(amount))
+        return booking
+
+    def confirm(self, booking):
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.payment.status = PaymentStatus.PAID
+            booking.payment.save()
+            booking.status = "CONFIRMED"
+            booking.save()
+
+    def stats(self):
+        return list(
+            HotelDailyStats.objects.order_by("date").values_list(
+                "room_type", "date", "rooms_sold", "revenue", "cancellations"
+            )
+        )
+
+    def test_split_revenue_keeps_every_cent(self):
+        shares = split_revenue(Decimal("100.00"), 3)
+        self.assertEqual(
+            shares, [Decimal("33.34"), Decimal("33.33"), Decimal("33.33")]
+        )
+        self.assertEqual(sum(shares), Decimal("100.00"))
+
+    def test_pending_booking_is_not_rolled_up(self):
+        self.book()
+        self.assertEqual(self.stats(), [])
+
+    def test_confirmed_then_cancelled_booking(self):
+        booking = self.book(nights=2)
+        self.confirm(booking)
+        self.assertEqual(
+            self.stats(),
+            [
+                (self.room_type.id, date(2025, 3, 1), 1, Decimal("50.00"), 0),
+                (self.room_type.id, date(2025, 3, 2), 1, Decimal("50.00"), 0),
+            ],
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.status = "CANCELLED"
+            booking.save()
+        self.assertEqual(
+            self.stats(),
+            [(self.room_type.id, date(2025, 3, 1), 0, Decimal("0.00"), 1)],
+        )
+
+    def test_moved_booking_clears_old_dates(self):
+        booking = self.book(nights=1)
+        self.confirm(booking)
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.check_in = date(2025, 4, 1)
+            booking.check_out = date(2025, 4, 2)
+            booking.save()
+        self.assertEqual([row[1] for row in self.stats()], [date(2025, 4, 1)])
+
+    def test_reconcile_repairs_drift(self):
+        booking = self.book(nights=2)
+        self.confirm(booking)
+        Booking.objects.filter(pk=booking.pk).update(status="CANCELLED")
+        HotelDailyStats.objects.create(
+            hotel=self.hotel, date=date(2025, 5, 1), rooms_sold=9
+        )
+
+        out = StringIO()
+        call_command(
+            "reconcile_analytics",
+            "--from=2025-01-01",
+            "--to=2025-12-31",
+            stdout=out,
+        )
+        self.assertIn("3 rollup rows rewritten", out.getvalue())
+        self.assertEqual(
+            self.stats(),
+            [(self.room_type.id, date(2025, 3, 1), 0, Decimal("0.00"), 1)],
+        )
@@ -0,0 +1,73 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from analytics.models import HotelDailyStats
+from hotels.models import Hotel, Room
+
+
+class HotelAnalyticsViewTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel", owner=self.owner)
+        for number in ["1", "2"]:
+            Room.objects.create(hotel=self.hotel, number=number, price=100)
+        for day, rooms_sold, revenue in [(30, 2, "200.00"), (31, 1, "90.00")]:
+            HotelDailyStats.objects.create(
+                hotel=self.hotel,
+                date=date(2025, 1, day),
+                rooms_sold=rooms_sold,
+                revenue=Decimal(revenue),
+            )
+        HotelDailyStats.objects.create(
+            hotel=self.hotel, date=date(2025, 2, 1), cancellations=1
+        )
+        self.url = reverse("hotels:hotel-analytics", args=[self.hotel.id])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def test_daily_analytics(self):
+        response = self.client.get(
+            self.url, {"from": "2025-01-30", "to": "2025-02-01"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["rooms"], 2)
+        first, second, third = response.data["results"]
+        self.assertEqual(first["period"], "2025-01-30")
+        self.assertEqual(first["occupancy_rate"], 1.0)
+        self.assertEqual(first["adr"], "100.00")
+        self.assertEqual(second["occupancy_rate"], 0.5)
+        self.assertIsNone(third["adr"])
+        self.assertEqual(third["cancellations"], 1)
+        self.assertEqual(response.data["totals"]["revenue"], "290.00")
+        self.assertEqual(response.data["totals"]["occupancy_rate"], 0.5)
+
+    def test_monthly_analytics(self):
+        response = self.client.get(
+            self.url,
+            {"from": "2025-01-01", "to": "2025-02-28", "granularity": "month"},
+        )
+        january, february = response.data["results"]
+        self.assertEqual(january["period"], "2025-01-01")
+        self.assertEqual(january["rooms_sold"], 3)
+        self.assertEqual(january["occupancy_rate"], round(3 / 62, 4))
+        self.assertEqual(february["cancellations"], 1)
+
+    def test_only_owner_or_staff(self):
+        other = get_user_model().objects.create_user(
+            username="other", password="pass", role="owner"
+        )
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_invalid_range(self):
+        response = self.client.get(
+            self.url, {"from": "2025-02-01", "to": "2025-01-01"}
+        )
+        self.assertEqual(response.status_code, 400)
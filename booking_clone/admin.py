@@ -0,0 +1,82 @@
+from django import forms
+from django.contrib import admin
+from django.contrib.admin.exceptions import NotRegistered
+from django.contrib.admin.widgets import AutocompleteSelect
+
+from booking_clone.pagination import EstimatedCountPaginator
+
+
+class AutocompleteFilter(admin.FieldListFilter):
+    """
+    Filter on a foreign key with an autocomplete box instead of a link per
+    related row, for relations to large tables:
+    ``list_filter = [("hotel", AutocompleteFilter)]``. The related model
+    admin needs ``search_fields``.
+    """
+
+    template = "admin/autocomplete_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.lookup_kwarg = f"{field_path}__{field.target_field.name}__exact"
+        self.lookup_val = params.get(self.lookup_kwarg)
+        super().__init__(
+            field, request, params, model, model_admin, field_path
+        )
+        remote_model = field.remote_field.model
+        try:
+            queryset = model_admin.admin_site.get_model_admin(
+                remote_model
+            ).get_queryset(request)
+        except NotRegistered:
+            queryset = remote_model._default_manager.all()
+        form_field = forms.ModelChoiceField(
+            queryset,
+            widget=AutocompleteSelect(
+                field, model_admin.admin_site, attrs={"data-width": "100%"}
+            ),
+            required=False,
+        )
+        self.rendered_widget = form_field.widget.render(
+            self.lookup_kwarg, self.lookup_val
+        )
+
+    def expected_parameters(self):
+        return [self.lookup_kwarg]
+
+    def get_facet_counts(self, pk_attname, filtered_qs):
+        return {}
+
+    def choices(self, changelist):
+        yield {
+            "selected": self.lookup_val is None,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg]
+            ),
+            "display": "All",
+        }
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist defaults for tables too large to count on every page view:
+    no unfiltered total next to the filtered count, no facet counts, and
+    estimated counts for unfiltered lists. Lists and autocomplete results
+    are ordered on the primary key index.
+    """
+
+    ordering = ["-pk"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+
+    @property
+    def media(self):
+        media = super().media
+        if any(
+            isinstance(list_filter, tuple)
+            and issubclass(list_filter[1], AutocompleteFilter)
+            for list_filter in self.list_filter
+        ):
+            media += AutocompleteSelect(None, self.admin_site).media
+            media += forms.Media(js=["booking_clone/autocomplete_filter.js"])
+        return media
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class BookingCloneConfig(AppConfig):
+    name = "booking_clone"
+
+    def ready(self):
+        if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+            from booking_clone.slow_queries import install_slow_query_recorders
+
+            install_slow_query_recorders()
@@ -0,0 +1,102 @@
+import threading
+import time
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client
+
+MODES = ["new", "persistent", "pool"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare API throughput with a new connection per request, "
+        "persistent connections and a connection pool (PostgreSQL only)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/hotels/")
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--host", default="localhost")
+        parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("bench_db_connections requires PostgreSQL.")
+
+        original = connections.settings["default"]
+        try:
+            for mode in options["modes"]:
+                try:
+                    self.configure(original, mode, options["threads"])
+                except ImproperlyConfigured as e:
+                    self.stdout.write(f"{mode:<12} skipped: {e}")
+                    continue
+                elapsed = self.run(options)
+                self.stdout.write(
+                    f"{mode:<12} {options['requests'] / elapsed:9.1f} req/s"
+                )
+        finally:
+            self.reset(original)
+
+    def configure(self, original, mode, threads):
+        self.reset(original)
+        settings = {**original, "OPTIONS": {**original["OPTIONS"]}}
+        settings["OPTIONS"].pop("pool", None)
+        if mode == "new":
+            settings["CONN_MAX_AGE"] = 0
+        elif mode == "persistent":
+            settings["CONN_MAX_AGE"] = None
+        else:
+            settings["CONN_MAX_AGE"] = 0
+            settings["OPTIONS"]["pool"] = {
+                "min_size": threads,
+                "max_size": threads,
+            }
+        connections.settings["default"] = settings
+        # Fail before the run when the pool is not available.
+        connections["default"].ensure_connection()
+        connections["default"].close()
+
+    def reset(self, original):
+        for alias in connections:
+            connection = connections[alias]
+            connection.close()
+            close_pool = getattr(connection, "close_pool", None)
+            if close_pool is not None:
+                close_pool()
+        connections.settings["default"] = original
+        del connections["default"]
+
+    def run(self, options):
+        per_thread, extra = divmod(options["requests"], options["threads"])
+        errors = []
+
+        def worker(count):
+            client = Client(HTTP_HOST=options["host"])
+            for _ in range(count):
+                response = client.get(options["path"])
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+            connections.close_all()
+
+        workers = [
+            threading.Thread(
+                target=worker, args=(per_thread + (index < extra),)
+            )
+            for index in range(options["threads"])
+        ]
+        start = time.perf_counter()
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        if errors:
+            raise CommandError(
+                f"{len(errors)} requests to {options['path']} failed "
+                f"(status {errors[0]})."
+            )
+        return elapsed
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import stripe
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from bookings.models import Booking
+from hotels.models import Room
+
+
+class FakeStripeHandler(BaseHTTPRequestHandler):
+    """Answers checkout session requests after the server's delay."""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.server.delay)
+        session_id = f"cs_test_{uuid.uuid4().hex}"
+        body = json.dumps(
+            {
+                "id": session_id,
+                "object": "checkout.session",
+                "url": f"https://checkout.stripe.test/{session_id}",
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare payment creation throughput of the sync endpoint on a "
+        "fixed thread pool and of the async endpoint on one event loop, "
+        "against a local fake Stripe server with a slow response"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=100)
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.3,
+            help="Seconds the fake gateway takes to answer",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=4,
+            help="Worker threads serving the sync endpoint",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests in flight on the async endpoint",
+        )
+        parser.add_argument("--host", default="localhost")
+
+    def handle(self, *args, **options):
+        room = Room.objects.order_by("pk").first()
+        if room is None:
+            raise CommandError("No rooms found, run seed_all first.")
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeStripeHandler)
+        server.delay = options["delay"]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        api_base = stripe.api_base
+        stripe.api_base = f"http://127.0.0.1:{server.server_port}"
+
+        user = get_user_model().objects.create_user(
+            username=f"bench_{uuid.uuid4().hex[:12]}", role="guest"
+        )
+        self.authorization = f"Bearer {AccessToken.for_user(user)}"
+        try:
+            modes = [("sync", self.run_sync), ("async", self.run_async)]
+            for batch, (mode, run) in enumerate(modes):
+                bookings = self.create_bookings(
+                    user,
+                    room,
+                    options["requests"],
+                    offset=batch * options["requests"],
+                )
+                start = time.perf_counter()
+                statuses = run(bookings, options)
+                elapsed = time.perf_counter() - start
+                failed = [code for code in statuses if code != 201]
+                if failed:
+                    raise CommandError(
+                        f"{len(failed)} {mode} requests failed "
+                        f"(status {failed[0]})."
+                    )
+                self.stdout.write(
+                    f"{mode:<6} {len(statuses)} requests in {elapsed:6.2f} s "
+                    f"{len(statuses) / elapsed:8.1f} req/s"
+                )
+        finally:
+            user.delete()
+            stripe.api_base = api_base
+            server.shutdown()
+
+    def create_bookings(self, user, room, count, offset):
+        # Far-future, non-overlapping stays so no real booking is blocked.
+        start = timezone.localdate() + timedelta(days=3650)
+        bookings = Booking.objects.bulk_create(
+            Booking(
+                user=user,
+                room=room,
+                check_in=start + timedelta(days=2 * (offset + index)),
+                check_out=start + timedelta(days=2 * (offset + index) + 1),
+            )
+            for index in range(count)
+        )
+        return [booking.pk for booking in bookings]
+
+    def run_sync(self, bookings, options):
+        def post(booking_id):
+            client = Client(HTTP_HOST=options["host"])
+            return client.post(
+                "/payments/",
+                {"booking": booking_id},
+                HTTP_AUTHORIZATION=self.authorization,
+            ).status_code
+
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            return list(executor.map(post, bookings))
+
+    def run_async(self, bookings, options):
+        async def run():
+            client = AsyncClient(headers={"host": options["host"]})
+            semaphore = asyncio.Semaphore(options["concurrency"])
+
+            async def post(booking_id):
+                async with semaphore:
+                    response = await client.post(
+                        "/payments/checkout/",
+                        {"booking": booking_id},
+                        headers={"authorization": self.authorization},
+                    )
+                    return response.status_code
+
+            try:
+                return await asyncio.gather(*map(post, bookings))
+            finally:
+                await sync_to_async(connections.close_all)()
+
+        return asyncio.run(run())
@@ -0,0 +1,85 @@
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand
+from PIL import Image, ImageDraw
+
+from images.pipeline import process_image
+
+
+def make_photo(index, width, height):
+    image = Image.new("RGB", (width, height), (index * 37 % 256, 90, 160))
+    draw = ImageDraw.Draw(image)
+    for step in range(0, width, 40):
+        draw.line(
+            (step, 0, width - step, height),
+            fill=(step % 256, index * 11 % 256, 255 - step % 256),
+            width=7,
+        )
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+    return buffer.getvalue()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure image variant throughput of the process_images pipeline "
+        "with 1 up to --workers threads"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--images", type=int, default=24)
+        parser.add_argument("--width", type=int, default=3000)
+        parser.add_argument("--height", type=int, default=2000)
+        parser.add_argument(
+            "--workers", type=int, default=settings.IMAGE_WORKERS
+        )
+
+    def handle(self, *args, **options):
+        count = options["images"]
+        photos = [
+            make_photo(index, options["width"], options["height"])
+            for index in range(count)
+        ]
+        self.stdout.write(
+            f"{count} JPEGs of {options['width']}x{options['height']}, "
+            f"variants {settings.IMAGE_VARIANT_WIDTHS} "
+            f"as {settings.IMAGE_VARIANT_FORMATS}"
+        )
+
+        workers = 1
+        while True:
+            with tempfile.TemporaryDirectory() as location:
+                storage = FileSystemStorage(location=location)
+                names = [
+                    storage.save(f"photo_{index}.jpg", ContentFile(photo))
+                    for index, photo in enumerate(photos)
+                ]
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(
+                        pool.map(
+                            lambda name: process_image(storage, name), names
+                        )
+                    )
+                elapsed = time.perf_counter() - start
+                written = sum(
+                    os.path.getsize(os.path.join(location, name))
+                    for name in os.listdir(location)
+                    if ".jpg" not in name
+                )
+            rate = count / elapsed
+            self.stdout.write(
+                f"  {workers:>3} workers {rate:8.2f} images/s "
+                f"{rate / workers:8.2f} images/s/worker "
+                f"{written / count / 1024:8.1f} KiB/image"
+            )
+            if workers >= options["workers"]:
+                break
+            workers = min(workers * 2, options["workers"])
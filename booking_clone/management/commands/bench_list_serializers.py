@@ -0,0 +1,75 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from booking_clone.management.viewsets import make_view
+from bookings.views import BookingViewSet
+from hotels.views import HotelViewSet
+
+
+class Command(BaseCommand):
+    help = "Compare per-row cost of DRF and values() list serializers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--host", default="localhost")
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        repeat = options["repeat"]
+        for viewset, path in [
+            (HotelViewSet, "/hotels/"),
+            (BookingViewSet, "/bookings/"),
+        ]:
+            view = make_view(viewset, "list", host=options["host"])
+            queryset = view.filter_queryset(view.get_queryset())
+            values_serializer = view.values_serializer_class(
+                context=view.get_serializer_context()
+            )
+            values_queryset = values_serializer.values(queryset)[:rows]
+            queryset = queryset[:rows]
+
+            instances = list(queryset.all())
+            value_rows = list(values_queryset.all())
+            count = len(instances)
+            if not count:
+                self.stdout.write(f"{path}: no rows, run seed_all first")
+                continue
+
+            results = {
+                "drf serialize": self.measure(
+                    lambda: view.get_serializer(instances, many=True).data,
+                    repeat,
+                ),
+                "values serialize": self.measure(
+                    lambda: values_serializer.serialize(value_rows),
+                    repeat,
+                ),
+                "drf fetch+serialize": self.measure(
+                    lambda: view.get_serializer(
+                        list(queryset.all()), many=True
+                    ).data,
+                    repeat,
+                ),
+                "values fetch+serialize": self.measure(
+                    lambda: values_serializer.serialize(
+                        list(values_queryset.all())
+                    ),
+                    repeat,
+                ),
+            }
+            self.stdout.write(f"{path} ({count} rows, best of {repeat})")
+            for label, seconds in results.items():
+                self.stdout.write(
+                    f"  {label:<24} {seconds / count * 1e6:8.1f} us/row"
+                )
+
+    def measure(self, function, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
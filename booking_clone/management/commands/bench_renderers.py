@@ -0,0 +1,70 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from booking_clone.management.viewsets import make_view
+from booking_clone.renderers import ORJSONRenderer
+from bookings.views import BookingViewSet
+from hotels.models import Room
+from hotels.serializers import RoomSerializer
+
+
+class Command(BaseCommand):
+    help = "Compare render time and allocations of the JSON renderers"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--host", default="localhost")
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        repeat = options["repeat"]
+        rooms = (
+            Room.objects.select_related("room_type")
+            .prefetch_related("amenities")
+            .order_by("price", "id")[:rows]
+        )
+        view = make_view(BookingViewSet, "list", host=options["host"])
+        pages = {
+            "/hotels/{id}/rooms/": RoomSerializer(
+                rooms, many=True, context={"request": view.request}
+            ).data,
+            "/bookings/": view.get_serializer(
+                view.get_queryset()[:rows], many=True
+            ).data,
+        }
+
+        for path, results in pages.items():
+            data = {
+                "count": len(results),
+                "next": None,
+                "previous": None,
+                "results": results,
+            }
+            self.stdout.write(f"{path} ({len(results)} rows)")
+            if not results:
+                self.stdout.write("  no rows, run seed_all first")
+                continue
+            for renderer in (JSONRenderer(), ORJSONRenderer()):
+                seconds = self.measure(lambda: renderer.render(data), repeat)
+                tracemalloc.start()
+                renderer.render(data)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                self.stdout.write(
+                    f"  {type(renderer).__name__:<16}"
+                    f" {seconds * 1e3:8.2f} ms"
+                    f" {peak / 1024:10.1f} KiB peak"
+                )
+
+    def measure(self, function, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
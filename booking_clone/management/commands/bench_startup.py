@@ -0,0 +1,85 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Run in a fresh interpreter, so nothing is imported or cached yet.
+BOOT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import django
+from django.conf import settings
+settings.INSTALLED_APPS
+marks = {"settings": time.perf_counter()}
+django.setup(set_prefix=False)
+marks["apps"] = time.perf_counter()
+from django.core.handlers.asgi import ASGIHandler
+handler = ASGIHandler()
+marks["middleware"] = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+marks["urlconf"] = time.perf_counter()
+from django.test import Client
+Client(HTTP_HOST=sys.argv[1]).get(sys.argv[2])
+marks["first request"] = time.perf_counter()
+print(json.dumps({name: mark - start for name, mark in marks.items()}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how long a worker takes to boot: settings, apps, "
+        "middleware, URLconf and the first request, each in a fresh process"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--path", default="/hotels/")
+        parser.add_argument("--host", default="localhost")
+        parser.add_argument(
+            "--with-migrate",
+            action="store_true",
+            help="Also time the makemigrations and migrate the old "
+            "entrypoint ran at every container start",
+        )
+
+    def handle(self, *args, **options):
+        boot = [
+            sys.executable,
+            "-c",
+            BOOT_SCRIPT,
+            options["host"],
+            options["path"],
+        ]
+        runs = [json.loads(self.run(boot)) for _ in range(options["repeat"])]
+        self.stdout.write(
+            f"Worker boot of {settings.SETTINGS_MODULE}, "
+            f"median of {options['repeat']} runs (cumulative)"
+        )
+        for name in runs[0]:
+            median = statistics.median(run[name] for run in runs)
+            self.stdout.write(f"  {name:<16} {median * 1000:8.1f} ms")
+
+        if options["with_migrate"]:
+            for command in [
+                ["makemigrations", "--check", "--dry-run"],
+                ["migrate", "--noinput"],
+            ]:
+                start = time.perf_counter()
+                self.run([sys.executable, "manage.py", *command])
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f"  {command[0]:<16} {elapsed * 1000:8.1f} ms"
+                )
+
+    def run(self, command):
+        result = subprocess.run(
+            command, capture_output=True, text=True, cwd=settings.BASE_DIR
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip() or result.stdout)
+        return result.stdout.strip().splitlines()[-1]
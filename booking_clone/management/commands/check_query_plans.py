@@ -0,0 +1,140 @@
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from rest_framework.settings import api_settings
+
+from analytics.models import HotelDailyStats
+from booking_clone.management.viewsets import make_view
+from bookings.models import Booking
+from bookings.views import BookingViewSet
+from hotels.models import Hotel, Room
+from hotels.serializers import HOTEL_DETAIL_ROOMS_LIMIT
+from hotels.views import HotelViewSet, RoomViewSet
+from payments.models import Payment
+from payments.views import PaymentViewSet
+from reviews.models import Review
+from reviews.views import ReviewViewSet
+
+
+def iter_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+
+def find_seq_scans(plan, threshold):
+    """
+    Return (relation, rows scanned) for every sequential scan in an
+    ``EXPLAIN (ANALYZE, FORMAT JSON)`` plan that read more than
+    ``threshold`` rows.
+    """
+    scans = []
+    for node in iter_nodes(plan):
+        if node["Node Type"] != "Seq Scan":
+            continue
+        rows = node.get("Actual Rows", 0) + node.get(
+            "Rows Removed by Filter", 0
+        )
+        rows *= node.get("Actual Loops", 1)
+        if rows > threshold:
+            scans.append((node["Relation Name"], rows))
+    return scans
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN ANALYZE the API's hot querysets and fail on sequential "
+        "scans over more than --threshold rows (PostgreSQL only)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threshold", type=int, default=1000)
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan of every query",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("check_query_plans requires PostgreSQL.")
+
+        failures = []
+        for name, queryset in self.catalogue():
+            plan = json.loads(
+                queryset.explain(format="json", analyze=True, buffers=True)
+            )[0]
+            scans = find_seq_scans(plan["Plan"], options["threshold"])
+            status = "FAIL" if scans else "ok"
+            self.stdout.write(
+                f"{status:<4} {name:<36} {plan['Execution Time']:9.2f} ms"
+            )
+            for relation, rows in scans:
+                self.stdout.write(f"     seq scan on {relation}: {rows} rows")
+                failures.append(name)
+            if options["verbose_plans"]:
+                self.stdout.write(json.dumps(plan["Plan"], indent=2))
+
+        if failures:
+            raise CommandError(
+                f"Sequential scans above {options['threshold']} rows in: "
+                + ", ".join(dict.fromkeys(failures))
+            )
+        self.stdout.write(self.style.SUCCESS("All query plans use indexes."))
+
+    def catalogue(self):
+        """Yield (name, queryset) for the querysets the API runs most."""
+        hotel = Hotel.objects.filter(rooms__bookings__isnull=False).first()
+        booking = Booking.objects.order_by("pk").first()
+        if hotel is None or booking is None:
+            raise CommandError("No bookings found, seed the database first.")
+        room = Room.objects.filter(hotel=hotel).first()
+        today = timezone.localdate()
+        page_size = api_settings.PAGE_SIZE
+
+        def page(view):
+            return view.filter_queryset(view.get_queryset())[:page_size]
+
+        yield "hotels: list", page(make_view(HotelViewSet, "list"))
+        yield "hotels: search by guests and price", page(
+            make_view(
+                HotelViewSet, "list", query={"guests": 2, "max_price": 150}
+            )
+        )
+        yield "hotels: detail", make_view(
+            HotelViewSet, "retrieve", pk=hotel.pk
+        ).get_queryset().filter(pk=hotel.pk)
+        yield "hotels: detail rooms", Room.objects.filter(
+            hotel=hotel
+        ).order_by("price", "id")[:HOTEL_DETAIL_ROOMS_LIMIT]
+        rooms_view = make_view(HotelViewSet, "rooms", pk=hotel.pk)
+        yield "hotels: rooms action", rooms_view.filter_rooms(
+            Room.objects.filter(hotel=hotel).select_related("room_type")
+        )[:page_size]
+        yield "rooms: list", page(make_view(RoomViewSet, "list"))
+        yield "bookings: list", page(make_view(BookingViewSet, "list"))
+        yield "bookings: user history", Booking.objects.filter(
+            user=booking.user_id
+        ).order_by("-created_at")[:page_size]
+        yield "bookings: overlap check", Booking.objects.overlapping(
+            room, today, today + timedelta(days=2)
+        )
+        yield "bookings: expiry sweep", Booking.objects.filter(
+            status="PENDING", expires_at__lte=timezone.now()
+        ).order_by("expires_at")[:500]
+        yield "payments: list", page(make_view(PaymentViewSet, "list"))
+        yield "payments: by session", Payment.objects.filter(
+            session_id="cs_test_missing"
+        )
+        yield "reviews: guest list", page(
+            make_view(ReviewViewSet, "list", user=booking.user)
+        )
+        yield "reviews: hotel", Review.objects.filter(hotel=hotel).order_by(
+            "-created_at"
+        )[:page_size]
+        yield "analytics: report", HotelDailyStats.objects.filter(
+            hotel=hotel, date__range=(today - timedelta(days=30), today)
+        )
@@ -0,0 +1,131 @@
+import posixpath
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from images.models import ImageJob
+from images.pipeline import variants_field
+
+
+def file_fields():
+    """
+    (manager, file field, variants field or None) of every file field, the
+    variants field being the JSON listing the field's resized images.
+    """
+    for model in apps.get_models():
+        opts = model._meta
+        columns = {field.name for field in opts.concrete_fields}
+        for field in opts.concrete_fields:
+            if not isinstance(field, models.FileField):
+                continue
+            variants = variants_field(field.name)
+            yield (
+                model._base_manager,
+                field.name,
+                variants if variants in columns else None,
+            )
+
+
+def referenced_names():
+    """
+    Names of every media file referenced by a row: file fields, the
+    variants listed next to image fields and queued images.
+    """
+    names = set()
+    for manager, field, variants in file_fields():
+        names.update(
+            manager.filter(**{f"{field}__isnull": False})
+            .exclude(**{field: ""})
+            .values_list(field, flat=True)
+            .iterator()
+        )
+        if variants is None:
+            continue
+        for value in (
+            manager.exclude(**{variants: {}})
+            .values_list(variants, flat=True)
+            .iterator()
+        ):
+            names.update(
+                variant["name"] for variant in value.get("variants", [])
+            )
+    names.update(ImageJob.objects.values_list("source", flat=True))
+    return names
+
+
+def is_referenced(name):
+    """
+    Whether a row references ``name`` now: rows committed after the
+    referenced_names() snapshot may point at a file it missed.
+    """
+    for manager, field, variants in file_fields():
+        if manager.filter(**{field: name}).exists():
+            return True
+        if (
+            variants is not None
+            and manager.filter(**{f"{variants}__icontains": name}).exists()
+        ):
+            return True
+    return ImageJob.objects.filter(source=name).exists()
+
+
+def stored_names(storage, path=""):
+    directories, files = storage.listdir(path)
+    for name in files:
+        yield posixpath.join(path, name)
+    for directory in directories:
+        yield from stored_names(storage, posixpath.join(path, directory))
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the media files no row references anymore, e.g. the files "
+        "of deleted photos, which content-addressed storage keeps"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=24,
+            help=(
+                "Hours since a file was written before it may be deleted, "
+                "so files of uploads in progress are kept"
+            ),
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the files that would be deleted",
+        )
+
+    def handle(self, *args, **options):
+        storage = default_storage
+        cutoff = timezone.now() - timedelta(hours=options["min_age"])
+        referenced = referenced_names()
+
+        deleted = freed = 0
+        for name in stored_names(storage):
+            if name in referenced:
+                continue
+            if storage.get_modified_time(name) > cutoff:
+                continue
+            if is_referenced(name):
+                continue
+            size = storage.size(name)
+            if options["dry_run"]:
+                self.stdout.write(name)
+            else:
+                storage.delete(name)
+            deleted += 1
+            freed += size
+
+        verb = "Would delete" if options["dry_run"] else "Deleted"
+        self.stdout.write(
+            f"{verb} {deleted} unreferenced files "
+            f"({freed / 1024 / 1024:.1f} MiB), kept {len(referenced)}."
+        )
@@ -0,0 +1,605 @@
+import bisect
+import itertools
+import random
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from analytics.models import HotelDailyStats
+from analytics.rollups import reconcile_stats
+from booking_clone.management.seeding import (
+    flush_models,
+    insert_rows,
+    reset_sequences,
+)
+from bookings.models import Booking
+from hotels.models import Amenity, Hotel, Location, Room, RoomType
+from payments.models import Payment
+from reviews.models import Review
+from users.models import User
+
+PASSWORD = "admin123"
+
+# (country, city), most visited first: hotels are spread over them with
+# Zipf weights, so a few cities hold most of the catalogue.
+CITIES = [
+    ("France", "Paris"),
+    ("UK", "London"),
+    ("USA", "New York"),
+    ("Italy", "Rome"),
+    ("Spain", "Barcelona"),
+    ("UAE", "Dubai"),
+    ("Japan", "Tokyo"),
+    ("Thailand", "Bangkok"),
+    ("Netherlands", "Amsterdam"),
+    ("Turkey", "Istanbul"),
+    ("Singapore", "Singapore"),
+    ("Germany", "Berlin"),
+    ("Czech Republic", "Prague"),
+    ("Spain", "Madrid"),
+    ("Austria", "Vienna"),
+    ("USA", "Los Angeles"),
+    ("USA", "Miami"),
+    ("Portugal", "Lisbon"),
+    ("Italy", "Milan"),
+    ("Italy", "Venice"),
+    ("Greece", "Athens"),
+    ("Hungary", "Budapest"),
+    ("Ireland", "Dublin"),
+    ("Germany", "Munich"),
+    ("USA", "Las Vegas"),
+    ("USA", "San Francisco"),
+    ("Denmark", "Copenhagen"),
+    ("Sweden", "Stockholm"),
+    ("Belgium", "Brussels"),
+    ("Switzerland", "Zurich"),
+    ("South Korea", "Seoul"),
+    ("China", "Hong Kong"),
+    ("Malaysia", "Kuala Lumpur"),
+    ("Indonesia", "Bali"),
+    ("Australia", "Sydney"),
+    ("Australia", "Melbourne"),
+    ("Canada", "Toronto"),
+    ("Canada", "Vancouver"),
+    ("Mexico", "Cancun"),
+    ("Mexico", "Mexico City"),
+    ("Brazil", "Rio de Janeiro"),
+    ("Argentina", "Buenos Aires"),
+    ("Morocco", "Marrakech"),
+    ("Egypt", "Cairo"),
+    ("South Africa", "Cape Town"),
+    ("Croatia", "Dubrovnik"),
+    ("Poland", "Krakow"),
+    ("Norway", "Oslo"),
+    ("Finland", "Helsinki"),
+    ("Iceland", "Reykjavik"),
+]
+
+HOTEL_PREFIXES = [
+    "Grand",
+    "Royal",
+    "Central",
+    "Park",
+    "Harbour",
+    "Old Town",
+    "Riverside",
+    "Boutique",
+    "Garden",
+    "Skyline",
+]
+HOTEL_SUFFIXES = ["Hotel", "Inn", "Suites", "Resort", "Palace", "Lodge"]
+STREETS = ["Main St", "High St", "Station Rd", "Market Sq", "Park Ave"]
+
+# name, description, max_guests, size, bed_count, base price, weight
+ROOM_TYPES = [
+    ("Standard Room", "Comfortable room", 2, 25.0, 1, 90, 45),
+    ("Deluxe Room", "Spacious room", 2, 35.0, 1, 140, 30),
+    ("Family Room", "Room for families", 4, 45.0, 2, 180, 12),
+    ("Suite", "Suite with a living area", 4, 60.0, 2, 300, 10),
+    ("Penthouse", "Top-floor suite", 6, 120.0, 3, 700, 3),
+]
+AMENITIES = [
+    "Free WiFi",
+    "Air Conditioning",
+    "TV",
+    "Coffee Maker",
+    "Mini Bar",
+    "Safe",
+    "Balcony",
+    "Bathtub",
+]
+# Rooms have the first BASE_AMENITIES[room type] amenities, and each of
+# the others at random.
+BASE_AMENITIES = [3, 4, 5, 6, 8]
+
+NIGHTS = [1, 2, 3, 4, 5, 6, 7, 10, 14]
+NIGHT_WEIGHTS = [18, 25, 20, 12, 8, 5, 7, 3, 2]
+PAST_STATUSES = ["CONFIRMED", "CANCELLED", "EXPIRED"]
+PAST_STATUS_WEIGHTS = [85, 12, 3]
+FUTURE_STATUSES = ["CONFIRMED", "PENDING", "CANCELLED", "EXPIRED"]
+FUTURE_STATUS_WEIGHTS = [70, 10, 15, 5]
+
+REVIEW_COMMENTS = {
+    1: "Very disappointing stay, would not come back.",
+    2: "Below expectations, the room needed maintenance.",
+    3: "Decent hotel for the price, nothing special.",
+    4: "Great location and friendly staff, would stay again.",
+    5: "Amazing stay! Spotless room and excellent service.",
+}
+
+USER_FIELDS = [
+    "id",
+    "password",
+    "is_superuser",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "is_staff",
+    "is_active",
+    "date_joined",
+    "role",
+]
+HOTEL_FIELDS = [
+    "id",
+    "owner",
+    "name",
+    "description",
+    "location",
+    "address",
+    "rating",
+    "photos_variants",
+]
+ROOM_FIELDS = [
+    "id",
+    "hotel",
+    "number",
+    "room_type",
+    "price",
+    "is_available",
+    "max_guests",
+    "photos_variants",
+]
+BOOKING_FIELDS = [
+    "id",
+    "user",
+    "room",
+    "check_in",
+    "check_out",
+    "created_at",
+    "status",
+    "expires_at",
+]
+PAYMENT_FIELDS = [
+    "id",
+    "booking",
+    "amount",
+    "status",
+    "payment_type",
+    "session_id",
+    "paid_at",
+]
+REVIEW_FIELDS = [
+    "id",
+    "hotel",
+    "user",
+    "rating",
+    "comment",
+    "created_at",
+    "photos_variants",
+]
+# Seeded rows have no photos, hence no image variants either.
+NO_VARIANTS = "{}"
+
+
+def proportional_shares(total, weights):
+    """Split ``total`` into integer shares proportional to ``weights``."""
+    cumulative = list(itertools.accumulate(weights))
+    scale = total / cumulative[-1]
+    shares = []
+    previous = 0
+    for value in cumulative:
+        current = round(value * scale)
+        shares.append(current - previous)
+        previous = current
+    return shares
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace all data with a reproducible synthetic dataset of the "
+        "given size, loaded in batches (COPY on PostgreSQL)"
+    )
+
+    fields = {
+        User: USER_FIELDS,
+        Location: ["id", "country", "city"],
+        RoomType: [
+            "id",
+            "name",
+            "description",
+            "max_guests",
+            "size",
+            "bed_count",
+        ],
+        Amenity: ["id", "name", "description"],
+        Hotel: HOTEL_FIELDS,
+        Room: ROOM_FIELDS,
+        Room.amenities.through: ["id", "room", "amenity"],
+        Booking: BOOKING_FIELDS,
+        Payment: PAYMENT_FIELDS,
+        Review: REVIEW_FIELDS,
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hotels", type=int, default=100)
+        parser.add_argument("--rooms-per-hotel", type=int, default=20)
+        parser.add_argument("--bookings", type=int, default=10000)
+        parser.add_argument(
+            "--guests",
+            type=int,
+            help="Guest accounts (default: one per 4 bookings)",
+        )
+        parser.add_argument(
+            "--review-rate",
+            type=float,
+            default=0.3,
+            help="Share of past confirmed stays that leave a review",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--batch-size", type=int, default=10000)
+        parser.add_argument(
+            "--skip-analytics",
+            action="store_true",
+            help="Do not rebuild the analytics rollups",
+        )
+
+    def handle(self, *args, **options):
+        if options["hotels"] < 1 or options["rooms_per_hotel"] < 1:
+            raise CommandError("--hotels and --rooms-per-hotel must be >= 1.")
+        if options["bookings"] < 0:
+            raise CommandError("--bookings must be >= 0.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1.")
+
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.now = timezone.now().replace(microsecond=0)
+        self.today = timezone.localdate()
+        self.buffers = {}
+        self.counts = {}
+        self.next_ids = {}
+
+        self.stdout.write("Clearing existing data...")
+        flush_models(
+            [
+                User,
+                Location,
+                RoomType,
+                Amenity,
+                Hotel,
+                Room,
+                Booking,
+                Payment,
+                Review,
+                HotelDailyStats,
+            ]
+        )
+
+        guests = options["guests"] or max(options["bookings"] // 4, 10)
+        owners = max(options["hotels"] // 20, 1)
+        self.create_catalogue()
+        self.create_users(owners, guests)
+        self.create_hotels(options, owners, guests)
+        self.flush()
+
+        reset_sequences(
+            [User, Location, RoomType, Amenity, Hotel, Room, Booking, Payment]
+            + [Review, Room.amenities.through]
+        )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+        if not options["skip_analytics"] and self.booking_dates:
+            self.stdout.write("Rebuilding analytics rollups...")
+            start, end = self.booking_dates
+            reconcile_stats(start, end)
+
+        self.stdout.write(self.style.SUCCESS("Seeded database:"))
+        for model, count in self.counts.items():
+            self.stdout.write(f"  {model._meta.label}: {count}")
+        self.stdout.write(f"All passwords are {PASSWORD}, admin is 'admin'.")
+
+    def add(self, model, row):
+        self.buffers.setdefault(model, []).append(row)
+        self.counts[model] = self.counts.get(model, 0) + 1
+        if len(self.buffers[model]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        # Buffers were created in dependency order, so rows are always
+        # inserted after the rows they reference.
+        for model, rows in self.buffers.items():
+            insert_rows(model, self.fields[model], rows)
+            rows.clear()
+
+    def new_id(self, model):
+        self.next_ids[model] = self.next_ids.get(model, 0) + 1
+        return self.next_ids[model]
+
+    def create_catalogue(self):
+        for country, city in CITIES:
+            self.add(Location, (self.new_id(Location), country, city))
+        for name, description, guests, size, beds, *_ in ROOM_TYPES:
+            self.add(
+                RoomType,
+                (self.new_id(RoomType), name, description, guests, size, beds),
+            )
+        for name in AMENITIES:
+            self.add(Amenity, (self.new_id(Amenity), name, ""))
+
+    def create_users(self, owners, guests):
+        self.stdout.write(f"Creating {owners} owners and {guests} guests...")
+        password = make_password(PASSWORD)
+        joined = self.now - timedelta(days=730)
+        self.add(
+            User,
+            (
+                self.new_id(User),
+                password,
+                True,
+                "admin",
+                "Admin",
+                "User",
+                "admin@booking.com",
+                True,
+                True,
+                joined,
+                "guest",
+            ),
+        )
+        self.first_owner_id = self.next_ids[User] + 1
+        for index in range(owners):
+            self.add_user(password, joined, f"owner{index + 1}", "owner")
+        self.first_guest_id = self.next_ids[User] + 1
+        for index in range(guests):
+            self.add_user(password, joined, f"guest{index + 1}", "guest")
+        self.last_guest_id = self.next_ids[User]
+
+    def add_user(self, password, joined, username, role):
+        self.add(
+            User,
+            (
+                self.new_id(User),
+                password,
+                False,
+                username,
+                username.capitalize(),
+                "Seed",
+                f"{username}@example.com",
+                False,
+                True,
+                joined + timedelta(minutes=self.random.randrange(500000)),
+                role,
+            ),
+        )
+
+    def create_hotels(self, options, owners, guests):
+        hotels = options["hotels"]
+        rooms_per_hotel = options["rooms_per_hotel"]
+        self.stdout.write(
+            f"Creating {hotels} hotels with {rooms_per_hotel} rooms each "
+            f"and {options['bookings']} bookings..."
+        )
+        rand = self.random
+        city_weights = list(
+            itertools.accumulate(
+                1 / rank for rank in range(1, len(CITIES) + 1)
+            )
+        )
+
+        # Ratings cluster around 4.2 and popularity grows with them.
+        ratings = [
+            round(min(max(rand.gauss(4.2, 0.4), 2.5), 5.0), 1)
+            for _ in range(hotels)
+        ]
+        popularity = [
+            rand.lognormvariate(0, 0.8) * rating**2 for rating in ratings
+        ]
+        booking_shares = proportional_shares(options["bookings"], popularity)
+        self.booking_dates = None
+
+        for index in range(hotels):
+            hotel_id = self.new_id(Hotel)
+            location = bisect.bisect(
+                city_weights, rand.random() * city_weights[-1]
+            )
+            country, city = CITIES[location]
+            name = (
+                f"{rand.choice(HOTEL_PREFIXES)} {city} "
+                f"{rand.choice(HOTEL_SUFFIXES)} {hotel_id}"
+            )
+            self.add(
+                Hotel,
+                (
+                    hotel_id,
+                    self.first_owner_id + index % owners,
+                    name,
+                    f"{name} in {city}, {country}.",
+                    location + 1,
+                    f"{rand.randint(1, 300)} {rand.choice(STREETS)}, {city}",
+                    ratings[index],
+                    NO_VARIANTS,
+                ),
+            )
+            rooms = self.create_rooms(hotel_id, rooms_per_hotel)
+            stays = self.create_bookings(rooms, booking_shares[index])
+            self.create_reviews(
+                hotel_id, ratings[index], stays, options["review_rate"]
+            )
+
+    def create_rooms(self, hotel_id, count):
+        """Add the rooms of a hotel, returning their (id, price)."""
+        rand = self.random
+        price_level = rand.lognormvariate(0, 0.35)
+        type_weights = [room_type[-1] for room_type in ROOM_TYPES]
+        rooms = []
+        for index in range(count):
+            room_id = self.new_id(Room)
+            type_index = rand.choices(range(len(ROOM_TYPES)), type_weights)[0]
+            room_type = ROOM_TYPES[type_index]
+            price = Decimal(
+                room_type[5] * price_level * rand.uniform(0.9, 1.1)
+            ).quantize(Decimal("0.01"))
+            self.add(
+                Room,
+                (
+                    room_id,
+                    hotel_id,
+                    str(100 * (index // 20 + 1) + index % 20 + 1),
+                    type_index + 1,
+                    price,
+                    rand.random() < 0.97,
+                    room_type[2],
+                    NO_VARIANTS,
+                ),
+            )
+            base = BASE_AMENITIES[type_index]
+            amenities = list(range(1, base + 1)) + [
+                amenity
+                for amenity in range(base + 1, len(AMENITIES) + 1)
+                if rand.random() < 0.2
+            ]
+            for amenity in amenities:
+                self.add(
+                    Room.amenities.through,
+                    (self.new_id(Room.amenities.through), room_id, amenity),
+                )
+            rooms.append((room_id, price))
+        return rooms
+
+    def create_bookings(self, rooms, count):
+        """
+        Add ``count`` bookings spread over the rooms of a hotel, from a year
+        ago to a year ahead. Each room's stays follow one another, so active
+        bookings never overlap. Returns the (user id, check-out) of past
+        confirmed stays.
+        """
+        rand = self.random
+        start = self.today - timedelta(days=365)
+        next_free = [start + timedelta(days=rand.randrange(30)) for _ in rooms]
+        # Gaps between stays sized so the bookings fill the two years;
+        # busier hotels get back-to-back stays.
+        mean_nights = sum(
+            nights * weight for nights, weight in zip(NIGHTS, NIGHT_WEIGHTS)
+        ) / sum(NIGHT_WEIGHTS)
+        mean_gap = 730 * len(rooms) / max(count, 1) - mean_nights
+        stays = []
+        for _ in range(count):
+            slot = rand.randrange(len(rooms))
+            room_id, price = rooms[slot]
+            nights = rand.choices(NIGHTS, NIGHT_WEIGHTS)[0]
+            gap = rand.expovariate(1 / mean_gap) if mean_gap > 0 else 0
+            check_in = next_free[slot] + timedelta(days=int(gap))
+            check_out = check_in + timedelta(days=nights)
+            next_free[slot] = check_out
+
+            if check_out <= self.today:
+                status = rand.choices(PAST_STATUSES, PAST_STATUS_WEIGHTS)[0]
+            else:
+                status = rand.choices(FUTURE_STATUSES, FUTURE_STATUS_WEIGHTS)[
+                    0
+                ]
+            lead = timedelta(
+                days=int(rand.expovariate(1 / 30)),
+                minutes=rand.randrange(1440),
+            )
+            created_at = min(
+                datetime.combine(check_in, time(), tzinfo=dt_timezone.utc)
+                - lead,
+                self.now - timedelta(minutes=rand.randrange(1, 60)),
+            )
+            expires_at = None
+            if status == "PENDING":
+                expires_at = self.now + timedelta(minutes=15)
+            elif status == "EXPIRED":
+                expires_at = created_at + timedelta(minutes=15)
+
+            booking_id = self.new_id(Booking)
+            user_id = rand.randint(self.first_guest_id, self.last_guest_id)
+            self.add(
+                Booking,
+                (
+                    booking_id,
+                    user_id,
+                    room_id,
+                    check_in,
+                    check_out,
+                    created_at,
+                    status,
+                    expires_at,
+                ),
+            )
+            self.add_payment(booking_id, status, price * nights, created_at)
+            if status == "CONFIRMED" and check_out <= self.today:
+                stays.append((user_id, check_out))
+
+            first, last = self.booking_dates or (check_in, check_out)
+            self.booking_dates = (min(first, check_in), max(last, check_out))
+        return stays
+
+    def add_payment(self, booking_id, booking_status, amount, created_at):
+        if booking_status == "CONFIRMED":
+            status, paid_at = "PAID", created_at + timedelta(minutes=5)
+        elif booking_status == "PENDING":
+            status, paid_at = "PENDING", None
+        elif booking_status == "EXPIRED":
+            status, paid_at = "EXPIRED", None
+        elif self.random.random() < 0.5:
+            status, paid_at = "CANCELLED", None
+        else:
+            return
+        self.add(
+            Payment,
+            (
+                self.new_id(Payment),
+                booking_id,
+                amount,
+                status,
+                "PAYMENT",
+                f"cs_seed_{booking_id}",
+                paid_at,
+            ),
+        )
+
+    def create_reviews(self, hotel_id, hotel_rating, stays, review_rate):
+        rand = self.random
+        reviewed = set()
+        for user_id, check_out in stays:
+            if user_id in reviewed or rand.random() >= review_rate:
+                continue
+            reviewed.add(user_id)
+            rating = min(max(round(rand.gauss(hotel_rating, 0.8)), 1), 5)
+            created_at = datetime.combine(
+                check_out,
+                time(hour=rand.randrange(24)),
+                tzinfo=dt_timezone.utc,
+            ) + timedelta(days=int(rand.expovariate(1 / 5)))
+            self.add(
+                Review,
+                (
+                    self.new_id(Review),
+                    hotel_id,
+                    user_id,
+                    rating,
+                    REVIEW_COMMENTS[rating],
+                    min(created_at, self.now),
+                    NO_VARIANTS,
+                ),
+            )
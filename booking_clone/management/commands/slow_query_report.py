@@ -0,0 +1,143 @@
+import json
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from booking_clone.management.commands.check_query_plans import iter_nodes
+from booking_clone.queries import normalize_sql
+
+SORT_KEYS = {
+    "total": lambda group: group.total,
+    "mean": lambda group: group.mean,
+    "max": lambda group: group.max,
+    "count": lambda group: group.count,
+}
+
+
+class StatementGroup:
+    """The slow executions of one normalized statement."""
+
+    def __init__(self, statement):
+        self.statement = statement
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.slowest = None
+        self.call_sites = Counter()
+        self.views = Counter()
+        self.serializer_fields = Counter()
+
+    @property
+    def mean(self):
+        return self.total / self.count
+
+    def add(self, entry):
+        duration = entry["duration_ms"]
+        self.count += 1
+        self.total += duration
+        if self.slowest is None or duration > self.max:
+            self.max = duration
+            self.slowest = entry
+        for counter, key in (
+            (self.call_sites, "call_site"),
+            (self.views, "view"),
+            (self.serializer_fields, "serializer_field"),
+        ):
+            if entry.get(key):
+                counter[entry[key]] += 1
+
+
+def read_entries(paths):
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash or a concurrent rotation.
+                    continue
+
+
+def group_entries(entries):
+    groups = {}
+    for entry in entries:
+        statement = normalize_sql(entry["sql"])
+        group = groups.get(statement)
+        if group is None:
+            group = groups[statement] = StatementGroup(statement)
+        group.add(entry)
+    return list(groups.values())
+
+
+def summarize_plan(plan):
+    """``Seq Scan on hotels_hotel, Index Scan on ...`` for a JSON plan."""
+    if not isinstance(plan, dict):
+        return plan
+    scans = [
+        f"{node['Node Type']} on {node['Relation Name']}"
+        for node in iter_nodes(plan)
+        if "Relation Name" in node
+    ]
+    return (
+        f"cost {plan['Total Cost']}, {plan['Plan Rows']} rows: "
+        + ", ".join(dict.fromkeys(scans) or [plan["Node Type"]])
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Aggregate the slow query log by normalized statement, with the "
+        "total and mean time and where the statement runs from"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--log-dir",
+            default=settings.SLOW_QUERY_LOG_DIR,
+            help="Directory of the slow_queries.*.jsonl files",
+        )
+        parser.add_argument("--limit", type=int, default=20)
+        parser.add_argument(
+            "--sort", choices=sorted(SORT_KEYS), default="total"
+        )
+        parser.add_argument(
+            "--plans",
+            action="store_true",
+            help="Print the full plan of the slowest execution",
+        )
+
+    def handle(self, *args, **options):
+        paths = sorted(Path(options["log_dir"]).glob("slow_queries.*.jsonl*"))
+        if not paths:
+            raise CommandError(
+                f"No slow query log in {options['log_dir']}; set "
+                "SLOW_QUERY_THRESHOLD_MS to record one."
+            )
+        groups = group_entries(read_entries(paths))
+        groups.sort(key=SORT_KEYS[options["sort"]], reverse=True)
+
+        self.stdout.write(
+            f"{sum(group.count for group in groups)} slow queries, "
+            f"{len(groups)} statements, from {len(paths)} files"
+        )
+        for group in groups[: options["limit"]]:
+            self.stdout.write("")
+            self.stdout.write(
+                f"{group.count:>6} x  total {group.total:10.1f} ms  "
+                f"mean {group.mean:8.1f} ms  max {group.max:8.1f} ms"
+            )
+            self.stdout.write(f"  {group.statement}")
+            for label, counter in (
+                ("call site", group.call_sites),
+                ("view", group.views),
+                ("serializer field", group.serializer_fields),
+            ):
+                for value, count in counter.most_common(3):
+                    self.stdout.write(f"  {label}: {value} ({count})")
+            plan = group.slowest.get("plan")
+            if plan:
+                self.stdout.write(f"  plan: {summarize_plan(plan)}")
+                if options["plans"] and isinstance(plan, dict):
+                    self.stdout.write(json.dumps(plan, indent=2))
@@ -0,0 +1,97 @@
+import io
+from datetime import datetime
+
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+
+PLAIN_TYPES = (int, float, str)
+
+
+def flush_models(models):
+    """
+    Empty the tables of ``models`` and of everything referencing them in a
+    single statement (``TRUNCATE ... RESTART IDENTITY CASCADE`` on
+    PostgreSQL) instead of loading and deleting rows one by one.
+    """
+    tables = set()
+    for model in models:
+        tables.add(model._meta.db_table)
+        for field in model._meta.local_many_to_many:
+            tables.add(field.remote_field.through._meta.db_table)
+    statements = connection.ops.sql_flush(
+        no_style(), sorted(tables), reset_sequences=True, allow_cascade=True
+    )
+    connection.ops.execute_sql_flush(statements)
+
+
+def reset_sequences(models):
+    """Move the id sequences past explicitly inserted primary keys."""
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def insert_rows(model, fields, rows):
+    """
+    Insert ``rows``, tuples of python values in the order of ``fields``,
+    into the table of ``model``. PostgreSQL loads them with ``COPY``, other
+    databases with a single executemany(). Unlike bulk_create(), values
+    are stored as given, auto_now_add timestamps included.
+    """
+    if not rows:
+        return
+    db = connections[DEFAULT_DB_ALIAS]
+    opts = model._meta
+    model_fields = [opts.get_field(name) for name in fields]
+    quote = db.ops.quote_name
+    table = quote(opts.db_table)
+    columns = ", ".join(quote(field.column) for field in model_fields)
+
+    with transaction.atomic(), db.cursor() as cursor:
+        if db.vendor == "postgresql":
+            sql = f"COPY {table} ({columns}) FROM STDIN"
+            if hasattr(cursor.cursor, "copy"):
+                # psycopg 3
+                with cursor.cursor.copy(sql) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            else:
+                data = "".join(
+                    "\t".join(map(copy_value, row)) + "\n" for row in rows
+                )
+                cursor.cursor.copy_expert(sql, io.StringIO(data))
+            return
+
+        # Only dates, datetimes and decimals need adapting.
+        placeholders = ", ".join(["%s"] * len(model_fields))
+        cursor.executemany(
+            f"INSERT INTO {table} ({columns}) VALUES ({placeholders})",
+            [
+                [
+                    (
+                        value
+                        if value is None or isinstance(value, PLAIN_TYPES)
+                        else field.get_db_prep_save(value, db)
+                    )
+                    for field, value in zip(model_fields, row)
+                ]
+                for row in rows
+            ],
+        )
@@ -0,0 +1,23 @@
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+def make_view(
+    viewset, action, query=None, user=None, host="localhost", **kwargs
+):
+    """
+    Instantiate ``viewset`` for ``action`` on a GET request, so commands can
+    build the same querysets and serializers the API uses.
+    """
+    request = Request(
+        APIRequestFactory().get("/", query or {}, HTTP_HOST=host)
+    )
+    if user is not None:
+        request.user = user
+    return viewset(
+        request=request,
+        action=action,
+        format_kwarg=None,
+        args=(),
+        kwargs=kwargs,
+    )
@@ -0,0 +1,248 @@
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, HttpResponseForbidden
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+_query_stats = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Queries of one sampled request, on every database alias."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = set()
+
+    @property
+    def duplicates(self):
+        return self.count - len(self.statements)
+
+    def add(self, sql, params, duration):
+        self.count += 1
+        self.duration += duration
+        self.statements.add((sql, str(params)))
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.add(sql, params, time.perf_counter() - start)
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def install_query_recorders():
+    """
+    Add the query recorder to the connections of this thread and to every
+    connection opened from now on. It only measures while a request is
+    sampled, and the context variable follows the request into the threads
+    sync_to_async() runs its queries in.
+    """
+    connection_created.connect(install_query_recorder)
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection)
+
+
+def start_query_stats():
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_stats(token):
+    _query_stats.reset(token)
+
+
+class Counter:
+    def __init__(self, name, help_text, labels):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.values = {}
+
+    def inc(self, label_values):
+        self.values[label_values] = self.values.get(label_values, 0) + 1
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} counter"
+        for label_values, value in sorted(self.values.items()):
+            labels = format_labels(self.labels, label_values)
+            yield f"{self.name}{labels} {value}"
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self.values = {}
+
+    def observe(self, label_values, value):
+        series = self.values.get(label_values)
+        if series is None:
+            # Bucket counts (the last one is +Inf), sum.
+            series = self.values[label_values] = [
+                [0] * (len(self.buckets) + 1),
+                0,
+            ]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} histogram"
+        for label_values, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                labels = format_labels(
+                    (*self.labels, "le"), (*label_values, str(bound))
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+def format_labels(names, values):
+    pairs = ",".join(
+        f'{name}="{escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def escape_label(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+class Registry:
+    """
+    Request metrics aggregated in the process. Every request is counted
+    and timed; database metrics come from the sampled requests only.
+    Each worker process has its own registry.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = Counter(
+            "http_requests_total",
+            "Requests by view, method and status code.",
+            ("view", "method", "status"),
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "Time to build the response.",
+            ("view",),
+            DURATION_BUCKETS,
+        )
+        self.db_duration = Histogram(
+            "http_request_db_duration_seconds",
+            "Time spent in database queries, sampled requests only.",
+            ("view",),
+            DURATION_BUCKETS,
+        )
+        self.queries = Histogram(
+            "http_request_db_queries",
+            "Database queries per request, sampled requests only.",
+            ("view",),
+            QUERY_BUCKETS,
+        )
+        self.duplicate_queries = Histogram(
+            "http_request_db_duplicate_queries",
+            "Queries repeating an earlier one of the request with the same "
+            "parameters, sampled requests only.",
+            ("view",),
+            QUERY_BUCKETS,
+        )
+
+    def record(self, view, method, status, duration, query_stats=None):
+        with self.lock:
+            self.requests.inc((view, method, str(status)))
+            self.duration.observe((view,), duration)
+            if query_stats is not None:
+                self.db_duration.observe((view,), query_stats.duration)
+                self.queries.observe((view,), query_stats.count)
+                self.duplicate_queries.observe((view,), query_stats.duplicates)
+
+    def render(self):
+        with self.lock:
+            lines = [
+                line
+                for metric in (
+                    self.requests,
+                    self.duration,
+                    self.db_duration,
+                    self.queries,
+                    self.duplicate_queries,
+                )
+                for line in metric.render()
+            ]
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+def view_name(request):
+    """
+    ``ViewSet.action`` for DRF viewsets, ``View.method`` for class-based
+    views and the URL name, or else route, otherwise, so the label set
+    stays bounded.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    cls = getattr(match.func, "cls", None) or getattr(
+        match.func, "view_class", None
+    )
+    if cls is None:
+        # ResolverMatch.view_name falls back to the function's path.
+        return match.view_name if match.url_name else match.route
+    method = request.method.lower()
+    actions = getattr(match.func, "actions", None)
+    if actions is not None:
+        return f"{cls.__name__}.{actions.get(method, method)}"
+    return f"{cls.__name__}.{method}"
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition of the registry, for scrapers sending the
+    METRICS_TOKEN; without a token it is only served with DEBUG on.
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        if not settings.DEBUG:
+            return HttpResponseForbidden()
+    elif not hmac.compare_digest(
+        request.headers.get("Authorization", "").encode(),
+        f"Bearer {token}".encode(),
+    ):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4"
+    )
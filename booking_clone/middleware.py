@@ -0,0 +1,277 @@
+import logging
+import random
+import re
+import time
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connection
+from rest_framework.permissions import SAFE_METHODS
+
+from booking_clone.metrics import (
+    install_query_recorders,
+    registry,
+    start_query_stats,
+    stop_query_stats,
+    view_name,
+)
+from booking_clone.queries import QueryPatternDetector
+
+logger = logging.getLogger(__name__)
+
+
+class StatementTimeoutMiddleware:
+    """
+    Applies the per-request-class limits of DB_STATEMENT_TIMEOUTS on top of
+    the DB_STATEMENT_TIMEOUT every session starts with, and restores the
+    default once the response, including a streamed body, is done so that
+    persistent and pooled connections do not keep another request's limit.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        self.timeouts = [
+            (re.compile(pattern), timeout)
+            for pattern, timeout in settings.DB_STATEMENT_TIMEOUTS
+        ]
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timeout = self.request_timeout(request)
+        if timeout is None:
+            return self.get_response(request)
+
+        self.set_timeout(timeout)
+        response = self.get_response(request)
+        if response.streaming:
+            response.streaming_content = self.reset_after(
+                response.streaming_content
+            )
+        else:
+            self.set_timeout(settings.DB_STATEMENT_TIMEOUT)
+        return response
+
+    async def __acall__(self, request):
+        timeout = self.request_timeout(request)
+        if timeout is None:
+            return await self.get_response(request)
+
+        await sync_to_async(self.set_timeout)(timeout)
+        response = await self.get_response(request)
+        if response.streaming and response.is_async:
+            response.streaming_content = self.areset_after(
+                response.streaming_content
+            )
+        elif response.streaming:
+            response.streaming_content = self.reset_after(
+                response.streaming_content
+            )
+        else:
+            await sync_to_async(self.set_timeout)(
+                settings.DB_STATEMENT_TIMEOUT
+            )
+        return response
+
+    def request_timeout(self, request):
+        """The timeout to apply to the request, None to keep the default."""
+        timeout = self.get_timeout(request.path_info)
+        if (
+            timeout is None
+            or timeout == settings.DB_STATEMENT_TIMEOUT
+            or connection.vendor != "postgresql"
+        ):
+            return None
+        return timeout
+
+    def get_timeout(self, path):
+        for pattern, timeout in self.timeouts:
+            if pattern.search(path):
+                return timeout
+        return None
+
+    def reset_after(self, content):
+        try:
+            yield from content
+        finally:
+            self.set_timeout(settings.DB_STATEMENT_TIMEOUT)
+
+    async def areset_after(self, content):
+        try:
+            async for chunk in content:
+                yield chunk
+        finally:
+            await sync_to_async(self.set_timeout)(
+                settings.DB_STATEMENT_TIMEOUT
+            )
+
+    @staticmethod
+    def set_timeout(timeout):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('statement_timeout', %s, false)",
+                [str(timeout)],
+            )
+
+
+class ReplicaPinMiddleware:
+    """
+    Pins a client to the primary database for REPLICA_PIN_SECONDS after a
+    successful write, so that its next reads see the write even when the
+    replicas lag behind.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.pin(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.pin(request, await self.get_response(request))
+
+    def pin(self, request, response):
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class RequestMetricsMiddleware:
+    """
+    Records every request's view, status and wall time in the metrics
+    registry. A METRICS_SAMPLE_RATE share of requests also accounts for
+    their database time, query count and duplicate queries, which are
+    reported in a Server-Timing header as well.
+
+    The time covers building the response, not sending a streamed body.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        install_query_recorders()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        sampled = self.sample()
+        start = time.perf_counter()
+        if sampled:
+            query_stats, token = start_query_stats()
+            try:
+                response = self.get_response(request)
+            finally:
+                stop_query_stats(token)
+        else:
+            query_stats = None
+            response = self.get_response(request)
+        return self.record(request, response, start, query_stats)
+
+    async def __acall__(self, request):
+        sampled = self.sample()
+        start = time.perf_counter()
+        if sampled:
+            query_stats, token = start_query_stats()
+            try:
+                response = await self.get_response(request)
+            finally:
+                stop_query_stats(token)
+        else:
+            query_stats = None
+            response = await self.get_response(request)
+        return self.record(request, response, start, query_stats)
+
+    @staticmethod
+    def sample():
+        rate = settings.METRICS_SAMPLE_RATE
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def record(self, request, response, start, query_stats):
+        duration = time.perf_counter() - start
+        registry.record(
+            view_name(request),
+            request.method,
+            response.status_code,
+            duration,
+            query_stats,
+        )
+        if query_stats is not None:
+            response["Server-Timing"] = (
+                f"db;dur={query_stats.duration * 1000:.1f};"
+                f'desc="{query_stats.count} queries, '
+                f'{query_stats.duplicates} duplicates", '
+                f"app;dur={duration * 1000:.1f}"
+            )
+        return response
+
+
+class NPlusOneMiddleware:
+    """
+    Development middleware logging the requests that repeat a query more
+    than NPLUSONE_THRESHOLD times from the same call site, or failing them
+    when NPLUSONE_RAISE is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with QueryPatternDetector() as detector:
+            response = self.get_response(request)
+        self.check(request, detector)
+        return response
+
+    async def __acall__(self, request):
+        with QueryPatternDetector() as detector:
+            response = await self.get_response(request)
+        self.check(request, detector)
+        return response
+
+    def check(self, request, detector):
+        if not detector.repeated():
+            return
+        if settings.NPLUSONE_RAISE:
+            detector.check()
+        logger.warning(
+            "%s %s repeats queries:\n%s",
+            request.method,
+            request.path,
+            detector.report(),
+        )
@@ -0,0 +1,228 @@
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_date
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import permissions
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from booking_clone.routers import choose_replica, read_from, set_read_alias
+from booking_clone.serializers import DynamicFieldsMixin
+from booking_clone.streaming import aiterate, stream_csv, stream_ndjson
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin pairing DynamicFieldsMixin serializers with the queryset:
+    list and detail querysets are narrowed to the requested fields, and
+    views can skip joins or annotations for fields that are not rendered.
+    """
+
+    def get_sparse_serializer(self):
+        if not hasattr(self, "_sparse_serializer"):
+            self._sparse_serializer = self.get_serializer()
+        return self._sparse_serializer
+
+    def field_requested(self, name):
+        return name in self.get_sparse_serializer().fields
+
+    def field_expanded(self, name):
+        serializer = self.get_sparse_serializer()
+        return name in serializer.fields and name in getattr(
+            serializer, "expanded_fields", ()
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer = self.get_sparse_serializer()
+        if isinstance(serializer, DynamicFieldsMixin):
+            queryset = serializer.narrow_queryset(queryset)
+        return queryset
+
+
+class ValuesListMixin:
+    """
+    Opt-in fast path for the list action. With FAST_LIST_SERIALIZERS
+    enabled, pages are read with QuerySet.values() and rendered by
+    ``values_serializer_class`` unless the client asked for a sparse
+    fieldset, which the regular serializer handles.
+    """
+
+    values_serializer_class = None
+
+    def use_values_serializer(self):
+        if not settings.FAST_LIST_SERIALIZERS:
+            return False
+        if self.values_serializer_class is None:
+            return False
+        serializer = self.get_serializer()
+        return not (
+            isinstance(serializer, DynamicFieldsMixin)
+            and serializer.get_sparse_params() is not None
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_values_serializer():
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.values_serializer_class(
+            context=self.get_serializer_context()
+        )
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
+
+
+class ReplicaReadMixin:
+    """
+    Serves safe requests for ``replica_actions`` (every action when None)
+    from a read replica, unless ReplicaPinMiddleware pinned the client to
+    the primary after a recent write. Authentication and permission checks
+    run before the switch and keep reading from the primary.
+    """
+
+    replica_actions = None
+
+    def use_replica(self, request):
+        if request.method not in permissions.SAFE_METHODS:
+            return False
+        if settings.REPLICA_PIN_COOKIE in request.COOKIES:
+            return False
+        return self.replica_actions is None or (
+            getattr(self, "action", None) in self.replica_actions
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if getattr(self, "view_is_async", False):
+            return self.async_replica_dispatch(request, *args, **kwargs)
+        with read_from(None):
+            return super().dispatch(request, *args, **kwargs)
+
+    async def async_replica_dispatch(self, request, *args, **kwargs):
+        with read_from(None):
+            return await super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.use_replica(request):
+            set_read_alias(choose_replica())
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", stream_ndjson),
+    "csv": ("text/csv; charset=utf-8", stream_csv),
+}
+
+
+class ExportMixin:
+    """
+    Adds an ``export`` list action streaming every visible row as NDJSON
+    or CSV (``?export_format=csv``). Rows are read with values_list() from
+    a server-side cursor, so memory use does not grow with the row count;
+    under ASGI the response iterates them asynchronously, batch by batch.
+
+    ``export_fields`` maps column names to values_list() lookups,
+    ``export_date_field`` is filtered by ``?date_from=`` and ``?date_to=``
+    and non-staff users only see rows whose ``export_owner_field`` is them.
+    """
+
+    export_fields = {}
+    export_date_field = None
+    export_owner_field = None
+    export_filename = "export"
+    export_permission_classes = [permissions.IsAdminUser]
+
+    def get_permissions(self):
+        if self.action == "export":
+            return [
+                permission() for permission in self.export_permission_classes
+            ]
+        return super().get_permissions()
+
+    def perform_content_negotiation(self, request, force=False):
+        # The export response is not rendered, whatever the client accepts.
+        if self.action == "export":
+            force = True
+        return super().perform_content_negotiation(request, force=force)
+
+    def get_export_date(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            date = parse_date(value)
+        except ValueError:
+            date = None
+        if date is None:
+            raise ValidationError({name: "Enter a date as YYYY-MM-DD."})
+        return date
+
+    def get_export_queryset(self):
+        queryset = self.queryset.model._default_manager.order_by("pk")
+        user = self.request.user
+        if self.export_owner_field and not user.is_staff:
+            queryset = queryset.filter(
+                **{f"{self.export_owner_field}_id": user.id}
+            )
+
+        date_from = self.get_export_date("date_from")
+        date_to = self.get_export_date("date_to")
+        if date_from:
+            queryset = queryset.filter(
+                **{f"{self.export_date_field}__gte": date_from}
+            )
+        if date_to:
+            queryset = queryset.filter(
+                **{f"{self.export_date_field}__lte": date_to}
+            )
+        return queryset
+
+    @extend_schema(
+        summary="Export",
+        description="Streams all rows visible to the user as NDJSON or CSV.",
+        parameters=[
+            OpenApiParameter(
+                "export_format",
+                type=str,
+                enum=list(EXPORT_FORMATS),
+                description="ndjson (default) or csv",
+            ),
+            OpenApiParameter(
+                "date_from", type=str, description="From date (YYYY-MM-DD)"
+            ),
+            OpenApiParameter(
+                "date_to", type=str, description="To date (YYYY-MM-DD)"
+            ),
+        ],
+        responses={200: OpenApiTypes.BINARY},
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {
+                    "export_format": f"Choose one of {', '.join(EXPORT_FORMATS)}."
+                }
+            )
+        content_type, stream = EXPORT_FORMATS[export_format]
+
+        rows = (
+            self.get_export_queryset()
+            .values_list(*self.export_fields.values())
+            .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        )
+        content = stream(list(self.export_fields), rows)
+        if isinstance(request._request, ASGIRequest):
+            content = aiterate(content)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{export_format}"'
+        )
+        return response
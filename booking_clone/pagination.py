@@ -0,0 +1,132 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+def estimated_count(queryset):
+    """
+    The PostgreSQL planner's row estimate for ``queryset``: the table's
+    ``pg_class.reltuples`` when the queryset is a plain unfiltered table
+    scan, the row estimate of its ``EXPLAIN`` plan otherwise. None on
+    other databases and for estimates under COUNT_ESTIMATE_THRESHOLD,
+    which are cheap to count exactly.
+    """
+    query = queryset.query
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql" or query.is_sliced:
+        return None
+    if (
+        not query.where
+        and not query.distinct
+        and not query.combinator
+        # annotate() with an aggregate groups by the primary key and
+        # keeps one row per table row; values().annotate() does not.
+        and query.group_by in (None, True)
+    ):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            (estimate,) = cursor.fetchone()
+    else:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        estimate = plan[0]["Plan"]["Plan Rows"]
+    if estimate < settings.COUNT_ESTIMATE_THRESHOLD:
+        return None
+    return int(estimate)
+
+
+class EstimatedPage(Page):
+    def has_next(self):
+        # The paginator only keeps an estimate while this page was full
+        # and followed by another row.
+        if self.paginator.count_is_estimate:
+            return True
+        return super().has_next()
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator of large tables: when the planner expects more than
+    COUNT_ESTIMATE_THRESHOLD rows, its estimate replaces COUNT(*) and
+    ``count_is_estimate`` is set. The estimate is only reported: pages
+    read one row more than they show to tell whether another page
+    follows, and a page that is not full ends the results with an exact
+    count.
+    """
+
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is None:
+            return super().count
+        self.count_is_estimate = True
+        return estimate
+
+    def validate_number(self, number):
+        if not self.count_is_estimate:
+            return super().validate_number(number)
+        # Page numbers past the estimate are valid, page() finds the end.
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if not (self.count and self.count_is_estimate):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if len(rows) <= self.per_page:
+            if not rows and number > 1:
+                raise EmptyPage(self.error_messages["no_results"])
+            self.count = bottom + len(rows)
+            self.num_pages = number
+            self.count_is_estimate = False
+        return self._get_page(rows[: self.per_page], number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return EstimatedPage(*args, **kwargs)
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page number pagination for large list endpoints, with a
+    ``count_is_estimate`` flag next to ``count``.
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.page.paginator.count,
+                "count_is_estimate": self.page.paginator.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        properties = schema["properties"]
+        schema["properties"] = {
+            "count": properties.pop("count"),
+            "count_is_estimate": {"type": "boolean", "example": False},
+            **properties,
+        }
+        return schema
@@ -0,0 +1,159 @@
+import re
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+_detectors = ContextVar("query_pattern_detectors", default=())
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+IN_LIST = re.compile(r"\bIN \((?:\s*(?:%s|\?)\s*,?)+\)", re.IGNORECASE)
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql):
+    """
+    Reduce a statement to its shape: literals become ``?`` and ``IN``
+    lists of any length collapse, so the queries of an N+1 loop compare
+    equal whatever ids they look up.
+    """
+    sql = STRING_LITERAL.sub("?", sql)
+    sql = NUMBER_LITERAL.sub("?", sql)
+    sql = IN_LIST.sub("IN (...)", sql.replace("%s", "?"))
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+@cache
+def project_root():
+    return str(Path(settings.BASE_DIR).resolve()) + "/"
+
+
+# The query instrumentation and the middleware wrapping every request are
+# never the call site of a query.
+SKIPPED_FILES = tuple(
+    str(Path(__file__).with_name(name))
+    for name in (
+        "queries.py",
+        "metrics.py",
+        "middleware.py",
+        "slow_queries.py",
+    )
+)
+
+
+def is_project_file(filename):
+    return (
+        filename.startswith(project_root())
+        and "site-packages" not in filename
+        and filename not in SKIPPED_FILES
+    )
+
+
+def call_site():
+    """
+    ``path:line in function`` of the innermost frame of project code
+    outside of tests, e.g. the serializer method or view issuing a query.
+    """
+    root = project_root()
+    fallback = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if is_project_file(filename):
+            site = (
+                f"{filename[len(root):]}:{frame.f_lineno} "
+                f"in {frame.f_code.co_name}"
+            )
+            if "/tests/" not in filename:
+                return site
+            fallback = fallback or site
+        frame = frame.f_back
+    return fallback or "unknown"
+
+
+class RepeatedQueries(AssertionError):
+    pass
+
+
+class QueryPatternDetector:
+    """
+    Counts the SELECT statements run while active by normalized SQL and
+    call site. A pattern seen more than ``threshold`` times is the
+    signature of an N+1: a query issued once per row of a previous one.
+    """
+
+    def __init__(self, threshold=None):
+        if threshold is None:
+            threshold = settings.NPLUSONE_THRESHOLD
+        self.threshold = threshold
+        self.patterns = Counter()
+
+    def __enter__(self):
+        install_pattern_recorders()
+        self.token = _detectors.set((*_detectors.get(), self))
+        return self
+
+    def __exit__(self, *exc_info):
+        _detectors.reset(self.token)
+
+    def add(self, sql):
+        if sql.lstrip()[:6].upper() == "SELECT":
+            self.patterns[(normalize_sql(sql), call_site())] += 1
+
+    def repeated(self):
+        """(count, normalized sql, call site) of every repeated pattern."""
+        return [
+            (count, sql, site)
+            for (sql, site), count in self.patterns.most_common()
+            if count > self.threshold
+        ]
+
+    def report(self):
+        return "\n".join(
+            f"{count} x {sql}\n    at {site}"
+            for count, sql, site in self.repeated()
+        )
+
+    def check(self):
+        if self.repeated():
+            raise RepeatedQueries(
+                "Repeated queries (more than "
+                f"{self.threshold} per call site):\n{self.report()}"
+            )
+
+
+def record_pattern(execute, sql, params, many, context):
+    for detector in _detectors.get():
+        detector.add(sql)
+    return execute(sql, params, many, context)
+
+
+def install_pattern_recorder(connection, **kwargs):
+    if record_pattern not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_pattern)
+
+
+def install_pattern_recorders():
+    """
+    Add the recorder to the connections of this thread and to every
+    connection opened from now on. The context variable follows requests
+    into the threads sync_to_async() runs their queries in.
+    """
+    connection_created.connect(install_pattern_recorder)
+    for connection in connections.all(initialized_only=True):
+        install_pattern_recorder(connection)
+
+
+@contextmanager
+def assert_no_repeated_queries(threshold=None):
+    """Fail if the block repeats a query more than ``threshold`` times."""
+    with QueryPatternDetector(threshold) as detector:
+        yield detector
+    detector.check()
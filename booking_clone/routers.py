@@ -0,0 +1,47 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_read_alias = ContextVar("read_alias", default=None)
+
+
+def get_read_alias():
+    return _read_alias.get()
+
+
+def set_read_alias(alias):
+    """Route reads of the current context to ``alias`` (None: primary)."""
+    return _read_alias.set(alias)
+
+
+@contextmanager
+def read_from(alias):
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def choose_replica():
+    replicas = settings.DATABASE_REPLICAS
+    return random.choice(replicas) if replicas else None
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica selected for the current request by
+    ReplicaReadMixin and every other query to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same rows as the primary.
+        return True
@@ -0,0 +1,314 @@
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Prefetch
+from django.utils.module_loading import import_string
+from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+
+
+def parse_field_list(value):
+    if not value:
+        return []
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def flatten_select_related(select_related, prefix=""):
+    paths = []
+    for name, nested in select_related.items():
+        path = f"{prefix}{name}"
+        paths.append(path)
+        paths.extend(flatten_select_related(nested, prefix=f"{path}__"))
+    return paths
+
+
+def prefetch_root(lookup):
+    if isinstance(lookup, Prefetch):
+        lookup = lookup.prefetch_to
+    return lookup.split("__")[0]
+
+
+class DynamicFieldsMixin:
+    """
+    Serializer mixin that lets clients shape read responses with the
+    ``fields``, ``omit`` and ``expand`` query parameters, e.g.
+    ``?fields=id,name,rating&expand=booking``.
+
+    Only the top-level serializer of a safe request is reshaped: nested
+    serializers and writes always keep their full set of fields.
+
+    Meta options:
+        expandable_fields: maps a field name to a serializer class (or its
+            dotted path) rendered in its place when the field is expanded.
+        field_dependencies: maps a field whose source is not a model
+            attribute (e.g. a SerializerMethodField) to the model fields,
+            annotations or prefetches it reads.
+    """
+
+    def get_sparse_params(self):
+        request = self.context.get("request")
+        if getattr(request, "method", None) not in SAFE_METHODS:
+            return None
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+
+        params = request.query_params
+        fields = parse_field_list(params.get("fields"))
+        omit = parse_field_list(params.get("omit"))
+        expand = parse_field_list(params.get("expand"))
+        if not (fields or omit or expand):
+            return None
+        return fields, omit, expand
+
+    def get_fields(self):
+        fields = super().get_fields()
+        self.expanded_fields = set()
+        params = self.get_sparse_params()
+        if params is None:
+            return fields
+
+        only, omit, expand = params
+        expandable = getattr(self.Meta, "expandable_fields", {})
+        for name in expand:
+            if name not in expandable:
+                continue
+            serializer_class = expandable[name]
+            if isinstance(serializer_class, str):
+                serializer_class = import_string(serializer_class)
+            fields[name] = serializer_class(read_only=True)
+            self.expanded_fields.add(name)
+
+        if only:
+            allowed = set(only) | self.expanded_fields
+            for name in list(fields):
+                if name not in allowed:
+                    fields.pop(name)
+        for name in omit:
+            fields.pop(name, None)
+        return fields
+
+    def get_field_sources(self):
+        """
+        Return the top-level model attributes read by the current fields,
+        or None if some field reads something that cannot be determined.
+        """
+        dependencies = getattr(self.Meta, "field_dependencies", {})
+        sources = set()
+        for name, field in self.fields.items():
+            if field.write_only:
+                continue
+            if name in dependencies:
+                paths = dependencies[name]
+            elif field.source == "*":
+                return None
+            else:
+                paths = [field.source.replace(".", "__")]
+            sources.update(path.split("__")[0] for path in paths)
+        return sources
+
+    def narrow_queryset(self, queryset):
+        """
+        Restrict the queryset to the columns, joins and prefetches the
+        requested fields need. Untouched when no sparse fieldset is used.
+        """
+        fields = self.fields
+        if self.get_sparse_params() is None or not fields:
+            return queryset
+        sources = self.get_field_sources()
+        if sources is None:
+            return queryset
+
+        opts = queryset.model._meta
+        only = [opts.pk.name]
+        for name in sources:
+            try:
+                model_field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if model_field.one_to_one or (
+                model_field.concrete and not model_field.many_to_many
+            ):
+                only.append(name)
+        queryset = queryset.only(*only)
+
+        select_related = queryset.query.select_related
+        if isinstance(select_related, dict):
+            kept = [
+                path
+                for path in flatten_select_related(select_related)
+                if path.split("__")[0] in sources
+            ]
+            queryset = queryset.select_related(None)
+            if kept:
+                queryset = queryset.select_related(*kept)
+
+        prefetches = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if prefetch_root(lookup) in sources
+        ]
+        return queryset.prefetch_related(None).prefetch_related(*prefetches)
+
+
+SKIP = object()
+
+
+class ValuesSerializer:
+    """
+    Read-only twin of a ModelSerializer for hot list endpoints.
+
+    Rows are fetched with ``QuerySet.values()`` and converted with
+    accessors compiled once from the fields of ``serializer_class``, so
+    the output matches it exactly without DRF instantiating and walking
+    the (nested) serializer fields for every row.
+
+    SerializerMethodFields are declared in ``method_fields`` as
+    ``name: (value_keys, function(row))``. Other fields can provide a
+    ``values_converter()`` returning ``convert(value, row, request)``.
+    """
+
+    serializer_class = None
+    method_fields = {}
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        cls = type(self)
+        if "_compiled" not in cls.__dict__:
+            value_keys = []
+            accessors = self.compile(self.serializer_class(), "", value_keys)
+            cls._compiled = (list(dict.fromkeys(value_keys)), accessors)
+        self.value_keys, self.accessors = cls._compiled
+
+    def values(self, queryset):
+        return queryset.prefetch_related(None).values(*self.value_keys)
+
+    def serialize(self, rows):
+        request = self.context.get("request")
+        accessors = self.accessors
+        data = []
+        for row in rows:
+            item = {}
+            for name, accessor in accessors:
+                value = accessor(row, request)
+                if value is not SKIP:
+                    item[name] = value
+            data.append(item)
+        return data
+
+    def compile(self, serializer, prefix, value_keys):
+        accessors = []
+        model = serializer.Meta.model
+        for field in serializer._readable_fields:
+            name = field.field_name
+            if isinstance(field, serializers.SerializerMethodField):
+                if prefix or name not in self.method_fields:
+                    raise ImproperlyConfigured(
+                        f"{type(self).__name__} needs a method_fields entry "
+                        f"for {serializer.__class__.__name__}.{name}."
+                    )
+                keys, function = self.method_fields[name]
+                value_keys.extend(keys)
+                accessors.append((name, self.method_accessor(function)))
+                continue
+            if field.source == "*" or isinstance(
+                field,
+                (serializers.ListSerializer, serializers.RelatedField),
+            ):
+                raise ImproperlyConfigured(
+                    f"{type(self).__name__} cannot compile "
+                    f"{serializer.__class__.__name__}.{name}."
+                )
+
+            path = field.source.split(".")
+            key = prefix + "__".join(path)
+            guards = [
+                prefix + "__".join(path[:index])
+                for index in range(1, len(path))
+            ]
+            value_keys.extend(guards)
+            value_keys.append(key)
+            if isinstance(field, serializers.BaseSerializer):
+                nested = self.compile(field, f"{key}__", value_keys)
+                convert = self.nested_converter(nested)
+            elif isinstance(field, serializers.FileField):
+                convert = self.file_converter(field, model, path)
+            elif hasattr(field, "values_converter"):
+                convert = field.values_converter()
+            else:
+                convert = self.field_converter(field)
+            accessors.append(
+                (name, self.accessor(field, key, guards, convert))
+            )
+        return accessors
+
+    @staticmethod
+    def method_accessor(function):
+        def access(row, request):
+            return function(row)
+
+        return access
+
+    @staticmethod
+    def accessor(field, key, guards, convert):
+        def missing():
+            if field.default is not empty:
+                return field.get_default()
+            if field.allow_null:
+                return None
+            return SKIP
+
+        def access(row, request):
+            for guard in guards:
+                if row[guard] is None:
+                    return missing()
+            value = row[key]
+            if value is None:
+                return None
+            return convert(value, row, request)
+
+        return access
+
+    @staticmethod
+    def field_converter(field):
+        to_representation = field.to_representation
+
+        def convert(value, row, request):
+            return to_representation(value)
+
+        return convert
+
+    @staticmethod
+    def nested_converter(accessors):
+        def convert(value, row, request):
+            item = {}
+            for name, accessor in accessors:
+                nested_value = accessor(row, request)
+                if nested_value is not SKIP:
+                    item[name] = nested_value
+            return item
+
+        return convert
+
+    @staticmethod
+    def file_converter(field, model, path):
+        for attr in path[:-1]:
+            model = model._meta.get_field(attr).related_model
+        storage = model._meta.get_field(path[-1]).storage
+        use_url = getattr(
+            field, "use_url", api_settings.UPLOADED_FILES_USE_URL
+        )
+
+        def convert(value, row, request):
+            if not value:
+                return None
+            if not use_url:
+                return value
+            url = storage.url(value)
+            if request is not None:
+                return request.build_absolute_uri(url)
+            return url
+
+        return convert
@@ -1,130 +1,287 @@
-import os
-from datetime import timedelta
-from pathlib import Path
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-
-SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
-
-INSTALLED_APPS = [
-    # Django core apps
-    "django.contrib.admin",
-    "django.contrib.auth",
-    "django.contrib.contenttypes",
-    "django.contrib.sessions",
-    "django.contrib.messages",
-    "django.contrib.staticfiles",
-    # Third-party apps
-    "debug_toolbar",
-    "django_filters",
-    "drf_spectacular",
-    "rest_framework",
-    "rest_framework.authtoken",
-    # Local apps
-    "booking_clone",
-    "users",
-    "hotels",
-    "bookings",
-    "reviews",
-    "payments",
-]
-
-REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
-    "DEFAULT_FILTER_BACKENDS": [
-        "django_filters.rest_framework.DjangoFilterBackend",
-        "rest_framework.filters.SearchFilter",
-        "rest_framework.filters.OrderingFilter",
-    ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
-    "PAGE_SIZE": 10,
-}
-
-MIDDLEWARE = [
-    "django.middleware.security.SecurityMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
-]
-
-ROOT_URLCONF = "booking_clone.urls"
-
-TEMPLATES = [
-    {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [],
-        "APP_DIRS": True,
-        "OPTIONS": {
-            "context_processors": [
-                "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
-            ],
-        },
-    },
-]
-
-WSGI_APPLICATION = "booking_clone.wsgi.application"
-
-AUTH_PASSWORD_VALIDATORS = [
-    {
-        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
-    },
-]
-
-LANGUAGE_CODE = "en-us"
-TIME_ZONE = "Europe/Kyiv"
-USE_I18N = True
-USE_TZ = True
-
-STATIC_URL = "static/"
-MEDIA_URL = "/media/"
-MEDIA_ROOT = "/files/media"
-
-DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
-
-AUTH_USER_MODEL = "users.User"
-
-SPECTACULAR_SETTINGS = {
-    "TITLE": "BookingClone API",
-    "DESCRIPTION": "Book hotels and payment management service",
-    "VERSION": "1.0.0",
-    "SERVE_INCLUDE_SCHEMA": False,
-    "SWAGGER_UI_SETTINGS": {
-        "deepLinking": True,
-        "defaultModelRendering": "model",
-        "defaultModelsExpandDepth": 2,
-        "defaultModelExpandDepth": 2,
-    },
-}
-
-SIMPLE_JWT = {
-    "ACCESS_TOKEN_LIFETIME": timedelta(days=10),
-    "REFRESH_TOKEN_LIFETIME": timedelta(days=10),
-    "ROTATE_REFRESH_TOKENS": False,
-    "BLACKLIST_AFTER_ROTATION": False,
-    "UPDATE_LAST_LOGIN": False,
-}
-
-STRIPE_PUBLISHABLE_KEY = os.environ["STRIPE_PUBLISHABLE_KEY"]
-STRIPE_SECRET_KEY = os.environ["STRIPE_SECRET_KEY"]
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+SECRET_KEY = os.environ["DJANGO_SECRET_KEY"]
+
+INSTALLED_APPS = [
+    # Django core apps
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    # Third-party apps
+    "servestatic",
+    "django_filters",
+    "drf_spectacular",
+    "rest_framework",
+    "rest_framework.authtoken",
+    # Local apps
+    "booking_clone",
+    "users",
+    "hotels",
+    "bookings",
+    "reviews",
+    "payments",
+    "analytics",
+    "images",
+]
+
+REST_FRAMEWORK = {
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        "users.authentication.ClaimsJWTAuthentication",
+    ),
+    "DEFAULT_FILTER_BACKENDS": [
+        "django_filters.rest_framework.DjangoFilterBackend",
+        "rest_framework.filters.SearchFilter",
+        "rest_framework.filters.OrderingFilter",
+    ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "booking_clone.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "booking_clone.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "PAGE_SIZE": 10,
+}
+
+# Statement timeout (ms) of every database session; requests matching a
+# pattern in DB_STATEMENT_TIMEOUTS get their own, 0 disables the limit.
+DB_STATEMENT_TIMEOUT = int(os.environ.get("DB_STATEMENT_TIMEOUT", 5000))
+DB_STATEMENT_TIMEOUTS = [
+    (r"^/admin/", 30000),
+    (r"/export/$", 0),
+]
+
+
+# Hosts of PostgreSQL read replicas (comma separated). Safe requests of the
+# catalog and review views read from them unless the client wrote in the
+# last REPLICA_PIN_SECONDS.
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+DATABASE_REPLICAS = [
+    f"replica{index}" for index in range(1, len(DB_REPLICA_HOSTS) + 1)
+]
+DATABASE_ROUTERS = ["booking_clone.routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.environ.get("REPLICA_PIN_SECONDS", 10))
+REPLICA_PIN_COOKIE = "db_pin_primary"
+
+# Share of requests whose database queries are accounted for in /metrics
+# and Server-Timing. /metrics requires "Authorization: Bearer
+# <METRICS_TOKEN>"; without a token it is only served with DEBUG on.
+METRICS_SAMPLE_RATE = float(os.environ.get("METRICS_SAMPLE_RATE", 0.1))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# A query repeated more than NPLUSONE_THRESHOLD times from one call site
+# is reported as an N+1 by NPlusOneMiddleware (development) and the tests.
+NPLUSONE_THRESHOLD = int(os.environ.get("NPLUSONE_THRESHOLD", 3))
+NPLUSONE_RAISE = False
+
+# Queries slower than SLOW_QUERY_THRESHOLD_MS (0 disables the recorder) are
+# logged with their call site and plan to rotating slow_queries.<pid>.jsonl
+# files in SLOW_QUERY_LOG_DIR; see the slow_query_report command.
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", 0))
+SLOW_QUERY_LOG_DIR = os.environ.get("SLOW_QUERY_LOG_DIR") or str(
+    BASE_DIR / "logs"
+)
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+SLOW_QUERY_LOG_BACKUPS = 5
+
+# Admin changelists and the hotel and room lists expecting more rows than
+# this are counted from the PostgreSQL planner estimate, not COUNT(*).
+COUNT_ESTIMATE_THRESHOLD = 100_000
+
+
+def postgres_database(conn_max_age):
+    """
+    PostgreSQL settings from the environment. Connections persist for
+    ``conn_max_age`` seconds (DB_CONN_MAX_AGE overrides) unless
+    DB_POOL_MAX_SIZE enables a psycopg 3 connection pool instead.
+    """
+    database = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ["POSTGRES_DB"],
+        "USER": os.environ["POSTGRES_USER"],
+        "PASSWORD": os.environ["POSTGRES_PASSWORD"],
+        "HOST": os.environ["POSTGRES_HOST"],
+        "PORT": os.environ["POSTGRES_PORT"],
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", conn_max_age)),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT}",
+        },
+    }
+    pool_max_size = int(os.environ.get("DB_POOL_MAX_SIZE", 0))
+    if pool_max_size:
+        # Django refuses persistent connections together with a pool.
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"]["pool"] = {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": pool_max_size,
+            "timeout": int(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        }
+    return database
+
+
+def postgres_databases(conn_max_age):
+    """The primary plus one alias per DB_REPLICA_HOSTS entry."""
+    databases = {"default": postgres_database(conn_max_age)}
+    for alias, host in zip(DATABASE_REPLICAS, DB_REPLICA_HOSTS):
+        replica = postgres_database(conn_max_age)
+        replica["HOST"] = host
+        # Tests run against the primary's test database.
+        replica["TEST"] = {"MIRROR": "default"}
+        databases[alias] = replica
+    return databases
+
+
+# Render hot list endpoints from QuerySet.values() instead of DRF fields.
+FAST_LIST_SERIALIZERS = (
+    os.environ.get("FAST_LIST_SERIALIZERS", "false").lower() == "true"
+)
+
+# Rows fetched per round trip by the streaming export endpoints.
+EXPORT_CHUNK_SIZE = int(os.environ.get("EXPORT_CHUNK_SIZE", 2000))
+
+# Minutes a PENDING booking holds its room before expire_bookings frees it.
+BOOKING_HOLD_MINUTES = int(os.environ.get("BOOKING_HOLD_MINUTES", 30))
+
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "servestatic.middleware.ServeStaticMiddleware",
+    "booking_clone.middleware.RequestMetricsMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "booking_clone.middleware.StatementTimeoutMiddleware",
+    "booking_clone.middleware.ReplicaPinMiddleware",
+]
+
+ROOT_URLCONF = "booking_clone.urls"
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [],
+        "APP_DIRS": True,
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = "booking_clone.wsgi.application"
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+LANGUAGE_CODE = "en-us"
+TIME_ZONE = "Europe/Kyiv"
+USE_I18N = True
+USE_TZ = True
+
+STATIC_URL = "static/"
+STATIC_ROOT = "/files/static"
+MEDIA_URL = "/media/"
+MEDIA_ROOT = "/files/media"
+
+STORAGES = {
+    # Media files are named after their content, see gc_media.
+    "default": {"BACKEND": "booking_clone.storage.ContentAddressedStorage"},
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+    },
+}
+
+# Resized copies of uploaded photos generated by the process_images worker.
+IMAGE_VARIANT_WIDTHS = [320, 640, 1280]
+IMAGE_VARIANT_FORMATS = ["webp", "jpeg"]
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_WORKERS = int(os.environ.get("IMAGE_WORKERS", os.cpu_count() or 1))
+# Gallery uploads are streamed to temporary files, one photo per request.
+PHOTO_MAX_UPLOAD_SIZE = int(
+    os.environ.get("PHOTO_MAX_UPLOAD_SIZE", 10 * 1024 * 1024)
+)
+PHOTO_MAX_PIXELS = 40_000_000
+PHOTO_FORMATS = ["JPEG", "PNG", "WEBP"]
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+AUTH_USER_MODEL = "users.User"
+
+SPECTACULAR_SETTINGS = {
+    "TITLE": "BookingClone API",
+    "DESCRIPTION": "Book hotels and payment management service",
+    "VERSION": "1.0.0",
+    "SERVE_INCLUDE_SCHEMA": False,
+    "SWAGGER_UI_SETTINGS": {
+        "deepLinking": True,
+        "defaultModelRendering": "model",
+        "defaultModelsExpandDepth": 2,
+        "defaultModelExpandDepth": 2,
+    },
+}
+
+# Safe requests trust the user's role and staff status stored in the
+# access token; other requests read users through a short cache.
+# Access tokens are then short-lived and refreshing them reads the user
+# again, which bounds how long a revoked role or staff status is trusted.
+AUTH_TRUST_TOKEN_CLAIMS = (
+    os.environ.get("AUTH_TRUST_TOKEN_CLAIMS", "true").lower() == "true"
+)
+
+SIMPLE_JWT = {
+    "ACCESS_TOKEN_LIFETIME": (
+        timedelta(minutes=5) if AUTH_TRUST_TOKEN_CLAIMS else timedelta(days=10)
+    ),
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=10),
+    "ROTATE_REFRESH_TOKENS": False,
+    "BLACKLIST_AFTER_ROTATION": False,
+    "UPDATE_LAST_LOGIN": False,
+    "TOKEN_OBTAIN_SERIALIZER": (
+        "users.serializers.ClaimsTokenObtainPairSerializer"
+    ),
+    "TOKEN_REFRESH_SERIALIZER": (
+        "users.serializers.ClaimsTokenRefreshSerializer"
+    ),
+}
+AUTH_USER_CACHE_SECONDS = 30
+AUTH_USER_CACHE_SIZE = 10_000
+
+STRIPE_PUBLISHABLE_KEY = os.environ["STRIPE_PUBLISHABLE_KEY"]
+STRIPE_SECRET_KEY = os.environ["STRIPE_SECRET_KEY"]
@@ -1,18 +1,22 @@
-from booking_clone.settings.base import *
-
-DEBUG = True
-
-ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
-
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.environ["POSTGRES_DB"],
-        "USER": os.environ["POSTGRES_USER"],
-        "PASSWORD": os.environ["POSTGRES_PASSWORD"],
-        "HOST": os.environ["POSTGRES_HOST"],
-        "PORT": os.environ["POSTGRES_PORT"],
-    }
-}
-
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+from booking_clone.settings.base import *
+
+DEBUG = True
+
+ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
+
+DATABASES = postgres_databases(conn_max_age=0)
+
+# Development-only tools, never installed in production. New lists, so the
+# ones of base.py stay untouched.
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+_toolbar_index = (
+    MIDDLEWARE.index("servestatic.middleware.ServeStaticMiddleware") + 1
+)
+MIDDLEWARE = [
+    *MIDDLEWARE[:_toolbar_index],
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    "booking_clone.middleware.NPlusOneMiddleware",
+    *MIDDLEWARE[_toolbar_index:],
+]
+
+EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
@@ -1,16 +1,16 @@
-from booking_clone.settings.base import *
-
-DEBUG = False
-
-ALLOWED_HOSTS = [os.environ["PRODUCTION_HOST"]]
-
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.environ["POSTGRES_DB"],
-        "USER": os.environ["POSTGRES_USER"],
-        "PASSWORD": os.environ["POSTGRES_PASSWORD"],
-        "HOST": os.environ["POSTGRES_HOST"],
-        "PORT": os.environ["POSTGRES_PORT"],
-    }
-}
+from booking_clone.settings.base import *
+
+DEBUG = False
+
+ALLOWED_HOSTS = [os.environ["PRODUCTION_HOST"]]
+
+# Under ASGI the sync code of each request runs in a fresh thread, and a
+# persistent connection would stay open with it: close them per request.
+DATABASES = postgres_databases(conn_max_age=0)
+
+STORAGES = {
+    "default": {"BACKEND": "booking_clone.storage.ContentAddressedStorage"},
+    "staticfiles": {
+        "BACKEND": "servestatic.storage.CompressedManifestStaticFilesStorage"
+    },
+}
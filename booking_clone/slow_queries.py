@@ -0,0 +1,151 @@
+import json
+import logging
+import os
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.utils import timezone
+
+from booking_clone.queries import call_site
+
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+logger = logging.getLogger(__name__)
+logger.propagate = False
+
+
+def record_slow_query(execute, sql, params, many, context):
+    start = time.perf_counter()
+    error = None
+    try:
+        return execute(sql, params, many, context)
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        duration = (time.perf_counter() - start) * 1000
+        if duration >= settings.SLOW_QUERY_THRESHOLD_MS:
+            log_slow_query(
+                sql, params, many, duration, context["connection"], error
+            )
+
+
+def install_slow_query_recorder(connection, **kwargs):
+    if record_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_slow_query)
+
+
+def install_slow_query_recorders():
+    """Time every query of the connections opened from now on."""
+    connection_created.connect(install_slow_query_recorder)
+
+
+def log_slow_query(sql, params, many, duration, connection, error=None):
+    entry = {
+        "time": timezone.now().isoformat(),
+        "duration_ms": round(duration, 3),
+        "database": connection.alias,
+        "sql": sql,
+        "params": params,
+        "many": many,
+        "call_site": call_site(),
+        "view": current_view(),
+        "serializer_field": current_serializer_field(),
+        "plan": None if many or error else explain(connection, sql, params),
+    }
+    if error is not None:
+        entry["error"] = f"{type(error).__name__}: {error}"
+    set_log_handler()
+    logger.warning(json.dumps(entry, default=str))
+
+
+def set_log_handler():
+    """
+    Write to ``slow_queries.<pid>.jsonl`` in SLOW_QUERY_LOG_DIR: rotating
+    a file shared by several worker processes would lose entries.
+    """
+    pid = os.getpid()
+    if any(getattr(h, "pid", None) == pid for h in logger.handlers):
+        return
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+    directory = Path(settings.SLOW_QUERY_LOG_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    handler = RotatingFileHandler(
+        directory / f"slow_queries.{pid}.jsonl",
+        maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+        backupCount=settings.SLOW_QUERY_LOG_BACKUPS,
+    )
+    handler.pid = pid
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+
+
+def explain(connection, sql, params):
+    """
+    The PostgreSQL plan of a statement, without running it again. The
+    driver's cursor is used directly so the EXPLAIN is not recorded too.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    if not sql.lstrip()[:6].upper().startswith(EXPLAINABLE):
+        return None
+    if connection.needs_rollback:
+        return None
+    # In a transaction, a failing EXPLAIN would abort the caller's
+    # transaction: run it under a savepoint.
+    savepoint = connection.in_atomic_block
+    try:
+        with connection.connection.cursor() as cursor:
+            if savepoint:
+                cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            except Exception:
+                if savepoint:
+                    cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            finally:
+                if savepoint:
+                    cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    except Exception as exc:
+        return f"EXPLAIN failed: {exc}"
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def current_view():
+    """``ViewSet.action`` (or ``View.method``) of the DRF view running."""
+    from rest_framework.views import APIView
+
+    frame = sys._getframe(2)
+    while frame is not None:
+        view = frame.f_locals.get("self")
+        if isinstance(view, APIView):
+            action = getattr(view, "action", None)
+            if action is None and getattr(view, "request", None):
+                action = view.request.method.lower()
+            return f"{type(view).__name__}.{action}"
+        frame = frame.f_back
+    return None
+
+
+def current_serializer_field():
+    """``Serializer.field`` being rendered, the innermost when nested."""
+    from rest_framework.fields import Field
+
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_name == "to_representation":
+            field = frame.f_locals.get("field")
+            if isinstance(field, Field) and field.parent is not None:
+                return f"{type(field.parent).__name__}.{field.field_name}"
+        frame = frame.f_back
+    return None
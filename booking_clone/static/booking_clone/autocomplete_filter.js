@@ -0,0 +1,16 @@
+'use strict';
+{
+    // Reload the changelist filtered on the related object picked in an
+    // AutocompleteFilter box, or unfiltered when the box is cleared.
+    const $ = django.jQuery;
+    $(document).on('change', '.autocomplete-filter select', function() {
+        const url = new URL(window.location.href);
+        url.searchParams.delete('p');
+        if (this.value) {
+            url.searchParams.set(this.name, this.value);
+        } else {
+            url.searchParams.delete(this.name);
+        }
+        window.location.href = url.href;
+    });
+}
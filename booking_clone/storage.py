@@ -0,0 +1,82 @@
+import hashlib
+import os
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.http import Http404
+from django.views.static import serve
+
+HASHED_NAME = re.compile(r"^[0-9a-f]{2}/([0-9a-f]{64})(\.[a-z0-9]{1,10})?$")
+# Content-addressed files never change, so clients and CDNs may cache
+# them for good.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def file_hash(content):
+    """SHA-256 of ``content``, reusing the hash computed on upload."""
+    digest = getattr(content, "content_hash", None)
+    if digest is None:
+        hasher = hashlib.sha256()
+        for chunk in content.chunks():
+            hasher.update(chunk)
+        content.seek(0)
+        digest = hasher.hexdigest()
+    return digest
+
+
+def hashed_name(digest, name):
+    extension = os.path.splitext(name)[1].lower()
+    if not re.fullmatch(r"\.[a-z0-9]{1,10}", extension):
+        extension = ""
+    return f"{digest[:2]}/{digest}{extension}"
+
+
+def is_hashed_name(name):
+    return HASHED_NAME.match(name) is not None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage naming every file after the SHA-256 of its
+    content, as ``ab/abcdef...jpg``: identical files are stored once, and
+    a name always refers to the same bytes. The name passed to save() only
+    contributes its extension.
+
+    Files are never deleted when the rows referencing them are, since
+    other rows may share them; run the gc_media command to delete the
+    files no row references anymore.
+    """
+
+    def __init__(self, **kwargs):
+        # Saving an existing name rewrites identical bytes.
+        kwargs.setdefault("allow_overwrite", True)
+        super().__init__(**kwargs)
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = hashed_name(file_hash(content), name)
+        if self.exists(name):
+            # Refresh the file's age, gc_media spares recently written files
+            # whose new rows may not be committed yet.
+            os.utime(self.path(name))
+            return name
+        return super().save(name, content, max_length=max_length)
+
+
+def serve_media(request, path):
+    """
+    Serve a media file, with far-future cache headers for the
+    content-addressed ones.
+    """
+    if not isinstance(default_storage, FileSystemStorage):
+        raise Http404
+    response = serve(request, path, document_root=default_storage.location)
+    match = HASHED_NAME.match(path)
+    if match is not None:
+        response["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        response["ETag"] = f'"{match.group(1)}"'
+    return response
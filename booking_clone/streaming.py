@@ -0,0 +1,111 @@
+import csv
+import datetime
+import decimal
+import json
+
+from asgiref.sync import sync_to_async
+from rest_framework.utils.encoders import JSONEncoder
+
+from booking_clone.renderers import orjson
+
+STREAM_BATCH_ROWS = 500
+
+
+class ExportJSONEncoder(JSONEncoder):
+    """JSONEncoder rendering Decimals as strings, like DecimalField does."""
+
+    def default(self, obj):
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        return super().default(obj)
+
+
+class Echo:
+    """File-like object handing back what csv.writer writes to it."""
+
+    def write(self, value):
+        return value
+
+
+def batched(lines, size=STREAM_BATCH_ROWS):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield b"".join(batch)
+            batch = []
+    if batch:
+        yield b"".join(batch)
+
+
+def ndjson_lines(columns, rows):
+    if orjson is None:
+        for row in rows:
+            line = json.dumps(
+                dict(zip(columns, row)),
+                cls=ExportJSONEncoder,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            yield f"{line}\n".encode()
+        return
+
+    # Rows come from the database, so datetimes are UTC and orjson's own
+    # formatting matches DRF's without a Python call per value.
+    default = ExportJSONEncoder().default
+    option = orjson.OPT_UTC_Z | orjson.OPT_APPEND_NEWLINE
+    for row in rows:
+        yield orjson.dumps(
+            dict(zip(columns, row)), default=default, option=option
+        )
+
+
+def format_datetime(value):
+    """ISO 8601 with a "Z" for UTC, as DRF and the NDJSON export write."""
+    value = value.isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def csv_lines(columns, rows):
+    # csv already writes None as "" and dates like isoformat(); only
+    # datetimes need converting, to match the NDJSON export.
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns).encode()
+    for row in rows:
+        yield writer.writerow(
+            [
+                (
+                    format_datetime(value)
+                    if type(value) is datetime.datetime
+                    else value
+                )
+                for value in row
+            ]
+        ).encode()
+
+
+def stream_ndjson(columns, rows):
+    """Encode an iterable of row tuples as NDJSON, batch by batch."""
+    return batched(ndjson_lines(columns, rows))
+
+
+def stream_csv(columns, rows):
+    """Encode an iterable of row tuples as CSV with a header, batch by batch."""
+    return batched(csv_lines(columns, rows))
+
+
+async def aiterate(chunks):
+    """
+    Serve a sync iterator of chunks to ASGI one chunk at a time. Django
+    would otherwise read a sync streaming response into a list before
+    sending it. Chunks are produced in the request's thread, which holds
+    the database connection of a server-side cursor.
+    """
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        await sync_to_async(chunks.close, thread_sensitive=True)()
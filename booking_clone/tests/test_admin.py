@@ -0,0 +1,128 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from booking_clone.pagination import EstimatedCountPaginator, estimated_count
+from booking_clone.queries import assert_no_repeated_queries
+from bookings.models import Booking
+from hotels.models import Hotel, Location, Room, RoomType
+from payments.models import Payment
+from reviews.models import Review
+
+
+class LargeTableAdminTest(TestCase):
+    """Changelists run the same number of queries whatever the page size."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin", password="pass", email="admin@example.com"
+        )
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        today = timezone.localdate()
+        cls.hotels = []
+        for index in range(4):
+            hotel = Hotel.objects.create(
+                name=f"Hotel {index}",
+                location=Location.objects.create(
+                    country="UA", city=f"City {index}"
+                ),
+                owner=owner,
+            )
+            cls.hotels.append(hotel)
+            guest = get_user_model().objects.create_user(
+                username=f"guest{index}", password="pass"
+            )
+            for number in range(index + 1):
+                room = Room.objects.create(
+                    hotel=hotel,
+                    number=str(number),
+                    room_type=room_type,
+                    price=100,
+                )
+                booking = Booking.objects.create(
+                    user=guest,
+                    room=room,
+                    check_in=today,
+                    check_out=today + timezone.timedelta(days=1),
+                )
+                Payment.objects.create(booking=booking, amount=100)
+            Review.objects.create(hotel=hotel, user=guest, rating=4)
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def test_changelists(self):
+        for model in (Hotel, Room, Booking, Payment, Review):
+            url = reverse(
+                f"admin:{model._meta.app_label}_{model._meta.model_name}"
+                "_changelist"
+            )
+            with self.subTest(model=model.__name__):
+                with assert_no_repeated_queries(threshold=1):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertIsInstance(
+                    response.context["cl"].paginator, EstimatedCountPaginator
+                )
+
+    def test_changelists_join_only_displayed_relations(self):
+        for model, select_related in [
+            (Room, {"hotel": {}, "room_type": {}}),
+            (Booking, {"user": {}, "room": {"hotel": {}}}),
+        ]:
+            url = reverse(
+                f"admin:{model._meta.app_label}_{model._meta.model_name}"
+                "_changelist"
+            )
+            with self.subTest(model=model.__name__):
+                response = self.client.get(url)
+                self.assertEqual(
+                    response.context["cl"].queryset.query.select_related,
+                    select_related,
+                )
+
+    def test_hotel_rooms_count(self):
+        response = self.client.get(
+            reverse("admin:hotels_hotel_changelist"), {"o": "-5"}
+        )
+
+        self.assertEqual(
+            [
+                hotel.rooms_count
+                for hotel in response.context["cl"].result_list
+            ],
+            [4, 3, 2, 1],
+        )
+
+    def test_autocomplete_filter(self):
+        hotel = self.hotels[2]
+
+        response = self.client.get(
+            reverse("admin:hotels_room_changelist"),
+            {"hotel__id__exact": hotel.pk},
+        )
+
+        self.assertEqual(
+            {room.hotel_id for room in response.context["cl"].result_list},
+            {hotel.pk},
+        )
+        self.assertContains(response, "booking_clone/autocomplete_filter.js")
+        self.assertContains(
+            response,
+            f'<option value="{hotel.pk}" selected>{hotel.name}</option>',
+            html=True,
+        )
+        # The sidebar no longer links every hotel.
+        self.assertNotContains(response, f"hotel__id__exact={hotel.pk + 1}")
+
+    def test_estimated_count_needs_postgresql_statistics(self):
+        self.assertIsNone(estimated_count(Hotel.objects.all()))
+        paginator = EstimatedCountPaginator(Hotel.objects.order_by("pk"), 2)
+        self.assertEqual(paginator.count, 4)
@@ -0,0 +1,129 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from booking_clone.management.commands.check_query_plans import (
+    find_seq_scans,
+)
+from bookings.models import Booking
+from hotels.models import Hotel, Room
+from payments.models import Payment
+
+
+class FindSeqScansTest(SimpleTestCase):
+    def test_counts_filtered_rows_and_loops(self):
+        plan = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {
+                    "Node Type": "Seq Scan",
+                    "Relation Name": "bookings_booking",
+                    "Actual Rows": 10,
+                    "Rows Removed by Filter": 990,
+                    "Actual Loops": 2,
+                },
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "hotels_room",
+                    "Actual Rows": 5000,
+                    "Actual Loops": 1,
+                },
+                {
+                    "Node Type": "Seq Scan",
+                    "Relation Name": "hotels_hotel",
+                    "Actual Rows": 20,
+                    "Actual Loops": 1,
+                },
+            ],
+        }
+        self.assertEqual(
+            find_seq_scans(plan, 1000), [("bookings_booking", 2000)]
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN needs PostgreSQL")
+class CheckQueryPlansTest(TestCase):
+    def test_small_tables_pass(self):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass"
+        )
+        room = Room.objects.create(
+            hotel=Hotel.objects.create(name="Hotel", owner=owner),
+            number="1",
+            price=100,
+        )
+        Booking.objects.create(
+            user=guest,
+            room=room,
+            check_in=timezone.now().date(),
+            check_out=timezone.now().date() + timedelta(days=1),
+        )
+        out = StringIO()
+        call_command("check_query_plans", stdout=out)
+        self.assertIn("All query plans use indexes.", out.getvalue())
+
+
+class SeedScaleTest(TestCase):
+    def seed(self, **options):
+        options = {
+            "hotels": 4,
+            "rooms_per_hotel": 3,
+            "bookings": 60,
+            "guests": 12,
+            "seed": 7,
+            "batch_size": 25,
+            **options,
+        }
+        call_command("seed_scale", stdout=StringIO(), **options)
+        return list(
+            Booking.objects.order_by("pk").values_list(
+                "user", "room", "check_in", "check_out", "status"
+            )
+        )
+
+    def test_seeds_reproducible_dataset(self):
+        bookings = self.seed()
+
+        self.assertEqual(len(bookings), 60)
+        self.assertEqual(Hotel.objects.count(), 4)
+        self.assertEqual(Room.objects.count(), 12)
+        self.assertEqual(self.seed(), bookings)
+        self.assertNotEqual(self.seed(seed=8), bookings)
+
+    def test_active_bookings_do_not_overlap(self):
+        self.seed(bookings=200)
+
+        stays = {}
+        for room, check_in, check_out in (
+            Booking.objects.filter(status__in=Booking.ACTIVE_STATUSES)
+            .order_by("room", "check_in")
+            .values_list("room", "check_in", "check_out")
+        ):
+            self.assertGreaterEqual(check_in, stays.get(room, check_in))
+            stays[room] = check_out
+        self.assertFalse(
+            Payment.objects.filter(booking__status="CONFIRMED")
+            .exclude(status="PAID")
+            .exists()
+        )
+
+    def test_new_rows_get_fresh_ids(self):
+        self.seed()
+
+        room = Room.objects.first()
+        booking = Booking.objects.create(
+            user=get_user_model().objects.get(username="guest1"),
+            room=room,
+            check_in=timezone.localdate() + timedelta(days=900),
+            check_out=timezone.localdate() + timedelta(days=901),
+        )
+        self.assertEqual(booking.pk, 61)
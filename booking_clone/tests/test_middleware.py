@@ -0,0 +1,122 @@
+from unittest.mock import call, patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+from django.urls import ResolverMatch
+
+from booking_clone.metrics import QueryStats, view_name
+from booking_clone.middleware import StatementTimeoutMiddleware
+from hotels.models import Hotel
+
+
+@override_settings(
+    DB_STATEMENT_TIMEOUT=5000,
+    DB_STATEMENT_TIMEOUTS=[(r"^/admin/", 30000), (r"/export/$", 0)],
+)
+@patch.object(connection, "vendor", "postgresql")
+@patch.object(StatementTimeoutMiddleware, "set_timeout")
+class StatementTimeoutMiddlewareTest(SimpleTestCase):
+    def test_default_requests_run_no_extra_queries(self, set_timeout):
+        middleware = StatementTimeoutMiddleware(lambda request: HttpResponse())
+        middleware(RequestFactory().get("/hotels/"))
+        set_timeout.assert_not_called()
+
+    def test_timeout_is_restored_after_response(self, set_timeout):
+        middleware = StatementTimeoutMiddleware(lambda request: HttpResponse())
+        middleware(RequestFactory().get("/admin/bookings/"))
+        self.assertEqual(set_timeout.call_args_list, [call(30000), call(5000)])
+
+    def test_streamed_response_keeps_timeout_until_consumed(self, set_timeout):
+        middleware = StatementTimeoutMiddleware(
+            lambda request: StreamingHttpResponse(iter([b"a", b"b"]))
+        )
+        response = middleware(RequestFactory().get("/bookings/export/"))
+        self.assertEqual(set_timeout.call_args_list, [call(0)])
+        self.assertEqual(b"".join(response.streaming_content), b"ab")
+        self.assertEqual(set_timeout.call_args_list, [call(0), call(5000)])
+
+
+@override_settings(METRICS_SAMPLE_RATE=1, METRICS_TOKEN="secret")
+class RequestMetricsMiddlewareTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        Hotel.objects.create(name="Hotel", owner=owner)
+
+    def test_sampled_request_reports_queries(self):
+        response = self.client.get("/hotels/")
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="[1-9]\d* queries, \d+ duplicates", '
+            r"app;dur=[\d.]+$",
+        )
+
+        metrics = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer secret"}
+        ).content.decode()
+        self.assertIn(
+            'http_requests_total{view="HotelViewSet.list",method="GET",'
+            'status="200"}',
+            metrics,
+        )
+        self.assertIn(
+            'http_request_db_queries_count{view="HotelViewSet.list"}',
+            metrics,
+        )
+
+    async def test_queries_of_async_views_are_counted(self):
+        response = await self.async_client.get(
+            "/hotels/availability/",
+            {"check_in": "2030-01-11", "check_out": "2030-01-13"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'desc="[1-9]\d* queries')
+
+    @override_settings(METRICS_SAMPLE_RATE=0)
+    def test_unsampled_request_has_no_server_timing(self):
+        response = self.client.get("/hotels/")
+        self.assertNotIn("Server-Timing", response)
+
+    def test_metrics_require_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        response = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer wrong"}
+        )
+        self.assertEqual(response.status_code, 403)
+        response = self.client.get(
+            "/metrics", headers={"Authorization": "Bearer secret"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN="")
+    def test_metrics_without_token_need_debug(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        with self.settings(DEBUG=True):
+            self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+
+class QueryStatsTest(SimpleTestCase):
+    def test_duplicates_need_same_parameters(self):
+        stats = QueryStats()
+        stats.add("SELECT %s", (1,), 0.1)
+        stats.add("SELECT %s", (1,), 0.1)
+        stats.add("SELECT %s", (2,), 0.1)
+        self.assertEqual((stats.count, stats.duplicates), (3, 1))
+
+
+class ViewNameTest(SimpleTestCase):
+    def test_unnamed_function_view_is_labelled_by_route(self):
+        request = RequestFactory().get("/ping/")
+        request.resolver_match = ResolverMatch(
+            lambda request: HttpResponse(), (), {}, route="ping/"
+        )
+        self.assertEqual(view_name(request), "ping/")
@@ -0,0 +1,78 @@
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from booking_clone.pagination import estimated_count
+from hotels.models import Hotel, Location
+
+
+class EstimatedCountPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        location = Location.objects.create(country="UA", city="Kyiv")
+        for index in range(12):
+            Hotel.objects.create(
+                name=f"Hotel {index}", location=location, owner=owner
+            )
+
+    def test_small_results_are_counted(self):
+        response = self.client.get("/hotels/")
+
+        self.assertEqual(
+            list(response.data),
+            ["count", "count_is_estimate", "next", "previous", "results"],
+        )
+        self.assertEqual(response.data["count"], 12)
+        self.assertFalse(response.data["count_is_estimate"])
+
+    @patch("booking_clone.pagination.estimated_count", return_value=1000)
+    def test_planner_estimate(self, estimated_count):
+        response = self.client.get("/hotels/")
+
+        self.assertEqual(response.data["count"], 1000)
+        self.assertTrue(response.data["count_is_estimate"])
+        self.assertIsNotNone(response.data["next"])
+
+        # The short last page knows the exact count.
+        response = self.client.get("/hotels/", {"page": 2})
+
+        self.assertEqual(response.data["count"], 12)
+        self.assertFalse(response.data["count_is_estimate"])
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get("/hotels/", {"page": 3})
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch("booking_clone.pagination.estimated_count", return_value=5)
+    def test_underestimate_keeps_paging(self, estimated_count):
+        response = self.client.get("/hotels/")
+
+        self.assertEqual(response.data["count"], 5)
+        self.assertTrue(response.data["count_is_estimate"])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get("/hotels/", {"page": 2})
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(response.data["count"], 12)
+        self.assertIsNone(response.data["next"])
+
+    @skipUnless(connection.vendor == "postgresql", "Estimates need PostgreSQL")
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=1)
+    def test_estimated_count(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE hotels_hotel")
+
+        self.assertEqual(estimated_count(Hotel.objects.all()), 12)
+        self.assertIsInstance(
+            estimated_count(Hotel.objects.filter(name__startswith="Hotel")),
+            int,
+        )
+        self.assertIsNone(estimated_count(Hotel.objects.all()[:5]))
@@ -0,0 +1,86 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    SimpleTestCase,
+    TestCase,
+    override_settings,
+)
+
+from booking_clone.queries import (
+    RepeatedQueries,
+    assert_no_repeated_queries,
+    normalize_sql,
+)
+from booking_clone.middleware import NPlusOneMiddleware
+from hotels.models import Hotel
+
+
+class NormalizeSqlTest(SimpleTestCase):
+    def test_literals_and_in_lists(self):
+        self.assertEqual(
+            normalize_sql(
+                "SELECT  *\n FROM t WHERE id IN (%s, %s, %s) "
+                "AND name = 'it''s' AND n > 10"
+            ),
+            "SELECT * FROM t WHERE id IN (...) AND name = ? AND n > ?",
+        )
+        self.assertEqual(
+            normalize_sql("SELECT * FROM t WHERE id IN (%s)"),
+            "SELECT * FROM t WHERE id IN (...)",
+        )
+
+
+class QueryPatternDetectorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        for index in range(3):
+            Hotel.objects.create(name=f"Hotel {index}", owner=owner)
+
+    def test_repeated_query_fails(self):
+        with self.assertRaisesMessage(RepeatedQueries, "3 x SELECT"):
+            with assert_no_repeated_queries(threshold=2):
+                for hotel in Hotel.objects.all():
+                    hotel.owner
+
+        with assert_no_repeated_queries(threshold=2):
+            for hotel in Hotel.objects.select_related("owner"):
+                hotel.owner
+
+    @override_settings(NPLUSONE_THRESHOLD=2, NPLUSONE_RAISE=False)
+    def test_middleware_logs_repeated_queries(self):
+        def view(request):
+            for hotel in Hotel.objects.all():
+                hotel.owner
+            return HttpResponse()
+
+        middleware = NPlusOneMiddleware(view)
+        with self.assertLogs("booking_clone.middleware", "WARNING") as logs:
+            middleware(RequestFactory().get("/hotels/"))
+        self.assertIn("GET /hotels/ repeats queries", logs.output[0])
+        self.assertIn("test_queries.py", logs.output[0])
+
+
+# The nplusone fixture of conftest.py, for pytest-style tests.
+
+
+@pytest.mark.django_db
+def test_nplusone_fixture_passes_list_endpoint(client, nplusone):
+    response = client.get("/hotels/")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_nplusone_fixture_fails_on_repeated_queries(nplusone):
+    nplusone.threshold = 1
+    for pk in range(2):
+        list(Hotel.objects.filter(pk=pk))
+
+    with pytest.raises(RepeatedQueries):
+        nplusone.check()
+    # Let the fixture's own check pass.
+    nplusone.patterns.clear()
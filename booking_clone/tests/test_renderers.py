@@ -0,0 +1,127 @@
+import io
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient
+from rest_framework.utils.serializer_helpers import ReturnDict
+
+from booking_clone.parsers import ORJSONParser
+from booking_clone.renderers import ORJSONRenderer
+from hotels.models import Hotel, Location, Room, RoomType
+
+
+class ORJSONRendererTest(TestCase):
+    def assertRendersLikeDRF(self, data, **kwargs):
+        self.assertEqual(
+            ORJSONRenderer().render(data, **kwargs),
+            JSONRenderer().render(data, **kwargs),
+        )
+
+    def test_matches_json_renderer(self):
+        data = ReturnDict(
+            {
+                "price": Decimal("120.50"),
+                "amount": Decimal("1E+2"),
+                "check_in": date(2025, 1, 31),
+                "created_at": datetime(
+                    2025, 1, 31, 12, 30, 5, 123456, tzinfo=timezone.utc
+                ),
+                "naive": datetime(2025, 1, 31, 12, 30),
+                "offset": datetime(
+                    2025, 1, 31, tzinfo=timezone(timedelta(hours=2))
+                ),
+                "time": time(9, 15, 0, 500),
+                "duration": timedelta(days=1, seconds=3),
+                "uuid": uuid.UUID(int=1),
+                "photo": "http://testserver/media/hotels/a%20b.jpg",
+                "name": "Готель \u2028 \u2029 ☃",
+                "label": gettext_lazy("Hotel"),
+                "rating": 4.5,
+                "nested": [{"a": None, "b": True}, (1, 2)],
+            },
+            serializer=None,
+        )
+        self.assertRendersLikeDRF(data)
+        self.assertRendersLikeDRF(None)
+        self.assertRendersLikeDRF({1: "non-string key", "big": 2**70})
+        self.assertRendersLikeDRF(
+            data, accepted_media_type="application/json; indent=4"
+        )
+
+    def test_common_types_do_not_fall_back(self):
+        data = {
+            "price": Decimal("10.00"),
+            "check_in": date(2025, 1, 31),
+            "created_at": datetime(2025, 1, 31, tzinfo=timezone.utc),
+        }
+        with patch.object(JSONRenderer, "render") as fallback:
+            ORJSONRenderer().render(data)
+        fallback.assert_not_called()
+
+    def test_api_responses_match_json_renderer(self):
+        owner = get_user_model().objects.create_user(
+            username="owner", password="pass", role="owner"
+        )
+        location = Location.objects.create(country="UA", city="Kyiv")
+        hotel = Hotel.objects.create(
+            name="Hotel", owner=owner, location=location, photos="hotels/a.jpg"
+        )
+        room_type = RoomType.objects.create(
+            name="Double", max_guests=2, size=18.5, bed_count=1
+        )
+        for number in range(3):
+            Room.objects.create(
+                hotel=hotel,
+                number=str(number),
+                price=Decimal("99.90") + number,
+                room_type=room_type,
+            )
+        client = APIClient()
+        urls = [
+            reverse("hotels:hotel-list"),
+            reverse("hotels:hotel-detail", args=[hotel.id]),
+            reverse("hotels:hotel-rooms", args=[hotel.id]),
+        ]
+        stdlib = {
+            **api_settings.user_settings,
+            "DEFAULT_RENDERER_CLASSES": [
+                "rest_framework.renderers.JSONRenderer"
+            ],
+        }
+        for url in urls:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            with override_settings(REST_FRAMEWORK=stdlib):
+                expected = client.get(url)
+            self.assertEqual(response.content, expected.content)
+
+
+class ORJSONParserTest(TestCase):
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), "application/json", {})
+
+    def test_matches_json_parser(self):
+        body = '{"price": "1.50", "guests": 2, "name": "Готель"}'.encode()
+        self.assertEqual(
+            self.parse(ORJSONParser(), body), self.parse(JSONParser(), body)
+        )
+
+    def test_invalid_body_raises_parse_error(self):
+        for body in [b"{", b'{"price": NaN}']:
+            with self.assertRaises(ParseError) as orjson_error:
+                self.parse(ORJSONParser(), body)
+            with self.assertRaises(ParseError) as json_error:
+                self.parse(JSONParser(), body)
+            self.assertEqual(
+                str(orjson_error.exception), str(json_error.exception)
+            )
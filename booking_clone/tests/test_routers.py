@@ -0,0 +1,68 @@
+from django.db import router
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from booking_clone.middleware import ReplicaPinMiddleware
+from booking_clone.mixins import ReplicaReadMixin
+from booking_clone.routers import get_read_alias, read_from
+from hotels.models import Hotel
+
+
+class ReadAliasViewSet(ReplicaReadMixin, viewsets.ViewSet):
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def list(self, request):
+        return Response({"db": Hotel.objects.all().db})
+
+    def create(self, request):
+        return Response({"db": Hotel.objects.all().db}, status=201)
+
+
+view = ReadAliasViewSet.as_view({"get": "list", "post": "create"})
+
+
+class ReplicaRouterTest(SimpleTestCase):
+    def test_reads_follow_context_and_writes_stay_on_primary(self):
+        self.assertEqual(Hotel.objects.all().db, "default")
+        with read_from("replica1"):
+            self.assertEqual(Hotel.objects.all().db, "replica1")
+            self.assertEqual(router.db_for_write(Hotel), "default")
+        self.assertEqual(Hotel.objects.all().db, "default")
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"])
+class ReplicaReadMixinTest(SimpleTestCase):
+    def test_safe_requests_read_from_replica(self):
+        response = view(RequestFactory().get("/"))
+        self.assertEqual(response.data, {"db": "replica1"})
+        self.assertIsNone(get_read_alias())
+
+    def test_writes_read_from_primary(self):
+        response = view(RequestFactory().post("/"))
+        self.assertEqual(response.data, {"db": "default"})
+
+    def test_pinned_client_reads_from_primary(self):
+        request = RequestFactory().get("/")
+        request.COOKIES["db_pin_primary"] = "1"
+        self.assertEqual(view(request).data, {"db": "default"})
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas_reads_from_primary(self):
+        response = view(RequestFactory().get("/"))
+        self.assertEqual(response.data, {"db": "default"})
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"], REPLICA_PIN_SECONDS=10)
+class ReplicaPinMiddlewareTest(SimpleTestCase):
+    def test_successful_write_pins_client(self):
+        response = ReplicaPinMiddleware(view)(RequestFactory().post("/"))
+        cookie = response.cookies["db_pin_primary"]
+        self.assertEqual(cookie["max-age"], 10)
+        self.assertTrue(cookie["httponly"])
+
+    def test_reads_do_not_pin_client(self):
+        response = ReplicaPinMiddleware(view)(RequestFactory().get("/"))
+        self.assertNotIn("db_pin_primary", response.cookies)
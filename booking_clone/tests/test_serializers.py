@@ -0,0 +1,147 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from booking_clone.serializers import ValuesSerializer
+from bookings.models import Booking
+from hotels.models import Hotel, Location, Room, RoomType
+from payments.models import Payment
+
+
+class DynamicFieldsTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.hotel = Hotel.objects.create(
+            name="Test Hotel",
+            description="A very long description",
+            location=self.location,
+            owner=self.owner,
+        )
+        self.room = Room.objects.create(hotel=self.hotel, number="1", price=100)
+        self.booking = Booking.objects.create(
+            user=self.guest,
+            room=self.room,
+            check_in=timezone.now().date(),
+            check_out=timezone.now().date() + timezone.timedelta(days=2),
+        )
+        Payment.objects.create(booking=self.booking, amount=200)
+        self.client = APIClient()
+
+    def test_fields_trims_response_and_query(self):
+        url = reverse("hotels:hotel-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"fields": "id,name,min_price"})
+        self.assertEqual(response.status_code, 200)
+        hotel = response.data["results"][0]
+        self.assertEqual(list(hotel), ["id", "name", "min_price"])
+        self.assertEqual(hotel["min_price"], 100)
+        sql = queries.captured_queries[-1]["sql"]
+        self.assertNotIn("description", sql)
+        self.assertNotIn("hotels_location", sql)
+        self.assertNotIn("COUNT(", sql)
+
+    def test_omit_removes_fields(self):
+        url = reverse("hotels:hotel-list")
+        response = self.client.get(url, {"omit": "description,location"})
+        hotel = response.data["results"][0]
+        self.assertNotIn("description", hotel)
+        self.assertNotIn("location", hotel)
+        self.assertEqual(hotel["rooms_count"], 1)
+
+    def test_expand_nests_related_object(self):
+        self.client.force_authenticate(user=self.guest)
+        url = reverse("payments:payment-list")
+        response = self.client.get(url)
+        self.assertEqual(
+            response.data["results"][0]["booking"], self.booking.id
+        )
+        response = self.client.get(url, {"expand": "booking"})
+        booking = response.data["results"][0]["booking"]
+        self.assertEqual(booking["id"], self.booking.id)
+        self.assertEqual(booking["room"]["number"], "1")
+        self.assertEqual(booking["total_price"], 200)
+
+
+class ValuesSerializerDifferentialTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser",
+            password="pass",
+            role="guest",
+            is_staff=True,
+        )
+        location = Location.objects.create(country="UA", city="Kyiv")
+        room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        today = timezone.now().date()
+        for index in range(12):
+            hotel = Hotel.objects.create(
+                name=f"Hotel {index}",
+                description="Ünïcode description",
+                location=location if index % 3 else None,
+                rating=index / 3,
+                photos=f"hotels/photo_{index}.jpg" if index % 2 else "",
+                owner=self.owner,
+            )
+            for number in range(index % 4):
+                room = Room.objects.create(
+                    hotel=hotel,
+                    number=str(number),
+                    room_type=room_type if number % 2 else None,
+                    price=f"{50 + index}.{number}5",
+                    is_available=number != 2,
+                    photos=f"rooms/room_{number}.jpg" if number else None,
+                )
+                Booking.objects.create(
+                    user=self.guest,
+                    room=room,
+                    check_in=today + timezone.timedelta(days=number),
+                    check_out=today + timezone.timedelta(days=index + 4),
+                )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.guest)
+
+    def assertSameResponses(self, url, params):
+        with self.settings(FAST_LIST_SERIALIZERS=False):
+            expected = self.client.get(url, params)
+
+        calls = []
+        serialize = ValuesSerializer.serialize
+
+        def spy(serializer, rows):
+            calls.append(serializer)
+            return serialize(serializer, rows)
+
+        with self.settings(FAST_LIST_SERIALIZERS=True), patch.object(
+            ValuesSerializer, "serialize", spy
+        ):
+            actual = self.client.get(url, params)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(expected.status_code, 200)
+        self.assertEqual(actual.content, expected.content)
+
+    def test_hotel_list_is_identical(self):
+        url = reverse("hotels:hotel-list")
+        for params in [{}, {"page": 2}, {"ordering": "name"}]:
+            self.assertSameResponses(url, params)
+
+    def test_booking_list_is_identical(self):
+        url = reverse("bookings:booking-list")
+        for params in [{}, {"page": 2}, {"ordering": "check_in"}]:
+            self.assertSameResponses(url, params)
@@ -0,0 +1,54 @@
+import importlib
+import os
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+DEPLOY_ENV = {
+    "PRODUCTION_HOST": "booking.example.com",
+    "POSTGRES_DB": "booking",
+    "POSTGRES_USER": "booking",
+    "POSTGRES_PASSWORD": "secret",
+    "POSTGRES_HOST": "db",
+    "POSTGRES_PORT": "5432",
+}
+
+
+class SettingsCompositionTest(SimpleTestCase):
+    def load(self, name):
+        with patch.dict(os.environ, DEPLOY_ENV):
+            return importlib.reload(importlib.import_module(name))
+
+    def test_prod_middleware_chain(self):
+        prod = self.load("booking_clone.settings.prod")
+        self.assertEqual(
+            prod.MIDDLEWARE,
+            [
+                "django.middleware.security.SecurityMiddleware",
+                "servestatic.middleware.ServeStaticMiddleware",
+                "booking_clone.middleware.RequestMetricsMiddleware",
+                "django.contrib.sessions.middleware.SessionMiddleware",
+                "django.middleware.common.CommonMiddleware",
+                "django.middleware.csrf.CsrfViewMiddleware",
+                "django.contrib.auth.middleware.AuthenticationMiddleware",
+                "django.contrib.messages.middleware.MessageMiddleware",
+                "django.middleware.clickjacking.XFrameOptionsMiddleware",
+                "booking_clone.middleware.StatementTimeoutMiddleware",
+                "booking_clone.middleware.ReplicaPinMiddleware",
+            ],
+        )
+        self.assertNotIn("debug_toolbar", prod.INSTALLED_APPS)
+
+    def test_dev_adds_debug_toolbar(self):
+        dev = self.load("booking_clone.settings.dev")
+        base = importlib.import_module("booking_clone.settings.base")
+        self.assertIn("debug_toolbar", dev.INSTALLED_APPS)
+        self.assertEqual(
+            dev.MIDDLEWARE[2:4],
+            [
+                "debug_toolbar.middleware.DebugToolbarMiddleware",
+                "booking_clone.middleware.NPlusOneMiddleware",
+            ],
+        )
+        self.assertNotIn("debug_toolbar", base.INSTALLED_APPS)
+        self.assertEqual(len(dev.MIDDLEWARE), len(base.MIDDLEWARE) + 2)
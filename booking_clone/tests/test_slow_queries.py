@@ -0,0 +1,157 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from booking_clone.management.commands.slow_query_report import (
+    group_entries,
+)
+from booking_clone.slow_queries import (
+    explain,
+    install_slow_query_recorder,
+    logger,
+    record_slow_query,
+)
+from hotels.models import Hotel, Location
+from hotels.serializers import HotelListSerializer
+
+
+class SlowQueryRecorderTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        location = Location.objects.create(country="UA", city="Kyiv")
+        Hotel.objects.create(name="Hotel", location=location, owner=owner)
+
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.log_dir.cleanup)
+        settings = override_settings(
+            SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_LOG_DIR=self.log_dir.name
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        install_slow_query_recorder(connection)
+        self.addCleanup(connection.execute_wrappers.remove, record_slow_query)
+        self.addCleanup(self.close_handlers)
+
+    def close_handlers(self):
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+
+    def entries(self):
+        (path,) = Path(self.log_dir.name).glob("slow_queries.*.jsonl")
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    def test_records_view_of_api_queries(self):
+        response = self.client.get("/hotels/")
+
+        self.assertEqual(response.status_code, 200)
+        entries = self.entries()
+        self.assertTrue(entries)
+        for entry in entries:
+            self.assertEqual(entry["view"], "HotelViewSet.list")
+            self.assertTrue(entry["call_site"])
+            self.assertIsNone(entry["plan"])
+        self.assertIn('"hotels_hotel"', entries[-1]["sql"])
+
+    def test_records_serializer_field(self):
+        HotelListSerializer(Hotel.objects.all(), many=True).data
+
+        fields = [entry["serializer_field"] for entry in self.entries()]
+        self.assertEqual(
+            fields,
+            [
+                None,
+                "HotelListSerializer.location",
+                "HotelListSerializer.rooms_count",
+                "HotelListSerializer.min_price",
+            ],
+        )
+
+
+class ExplainTest(SimpleTestCase):
+    def test_failed_explain_keeps_transaction_usable(self):
+        connection = MagicMock(
+            vendor="postgresql", in_atomic_block=True, needs_rollback=False
+        )
+        cursor = connection.connection.cursor.return_value.__enter__()
+
+        def execute(sql, params=None):
+            if sql.startswith("EXPLAIN"):
+                raise DatabaseError("syntax error")
+
+        cursor.execute.side_effect = execute
+
+        plan = explain(connection, "SELECT 1", ())
+
+        self.assertTrue(plan.startswith("EXPLAIN failed"))
+        self.assertEqual(
+            [args[0] for args, kwargs in cursor.execute.call_args_list],
+            [
+                "SAVEPOINT slow_query_explain",
+                "EXPLAIN (FORMAT JSON) SELECT 1",
+                "ROLLBACK TO SAVEPOINT slow_query_explain",
+                "RELEASE SAVEPOINT slow_query_explain",
+            ],
+        )
+
+
+class SlowQueryReportTest(SimpleTestCase):
+    def entry(self, sql, duration, view):
+        return {
+            "sql": sql,
+            "duration_ms": duration,
+            "call_site": "hotels/views.py:10 in list",
+            "view": view,
+            "serializer_field": None,
+            "plan": None,
+        }
+
+    def test_groups_by_normalized_statement(self):
+        groups = group_entries(
+            [
+                self.entry("SELECT * FROM t WHERE id = 1", 30, "A.list"),
+                self.entry("SELECT * FROM t WHERE id = 2", 10, "A.list"),
+                self.entry("SELECT * FROM u", 25, "B.list"),
+            ]
+        )
+
+        self.assertEqual(
+            [(g.statement, g.count, g.total, g.mean, g.max) for g in groups],
+            [
+                ("SELECT * FROM t WHERE id = ?", 2, 40, 20, 30),
+                ("SELECT * FROM u", 1, 25, 25, 25),
+            ],
+        )
+        self.assertEqual(groups[0].views, {"A.list": 2})
+
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            path = Path(log_dir) / "slow_queries.1.jsonl"
+            path.write_text(
+                json.dumps(self.entry("SELECT * FROM u", 25, "B.list"))
+                + "\n"
+                + json.dumps(self.entry("SELECT * FROM t", 5, "A.list"))
+                + "\n{truncated"
+            )
+            out = StringIO()
+            call_command(
+                "slow_query_report", log_dir=log_dir, sort="mean", stdout=out
+            )
+
+        output = out.getvalue()
+        self.assertIn("2 slow queries, 2 statements, from 1 files", output)
+        self.assertLess(
+            output.index("SELECT * FROM u"), output.index("SELECT * FROM t")
+        )
+        self.assertIn("view: B.list (1)", output)
@@ -0,0 +1,121 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+from importlib import import_module
+from unittest.mock import patch
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from booking_clone.storage import is_hashed_name
+from hotels.models import Hotel
+
+rehash_migration = import_module("images.migrations.0003_rehash_media_files")
+
+
+class ContentAddressedStorageTest(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+
+    def test_identical_files_are_stored_once(self):
+        digest = hashlib.sha256(b"photo").hexdigest()
+
+        first = default_storage.save("hotels/a.JPG", ContentFile(b"photo"))
+        second = default_storage.save("rooms/b.jpg", ContentFile(b"photo"))
+
+        self.assertEqual(first, f"{digest[:2]}/{digest}.jpg")
+        self.assertEqual(second, first)
+        self.assertEqual(default_storage.listdir(digest[:2])[1], [first[3:]])
+
+    def test_hashed_files_are_cached_for_good(self):
+        name = default_storage.save("hotels/a.jpg", ContentFile(b"photo"))
+
+        response = self.client.get(f"/media/{name}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["Cache-Control"], "public, max-age=31536000, immutable"
+        )
+        self.assertEqual(response["ETag"], f'"{name[3:67]}"')
+
+    def test_gc_deletes_unreferenced_files(self):
+        kept = default_storage.save("hotels/a.jpg", ContentFile(b"kept"))
+        variant = default_storage.save("hotels/a.webp", ContentFile(b"v"))
+        orphan = default_storage.save("hotels/b.jpg", ContentFile(b"orphan"))
+        Hotel.objects.create(
+            name="Hotel",
+            owner=self.owner,
+            photos=kept,
+            photos_variants={"source": kept, "variants": [{"name": variant}]},
+        )
+
+        call_command("gc_media", min_age=1, stdout=io.StringIO())
+        self.assertTrue(default_storage.exists(orphan))
+
+        call_command("gc_media", min_age=0, stdout=io.StringIO())
+        self.assertTrue(default_storage.exists(kept))
+        self.assertTrue(default_storage.exists(variant))
+        self.assertFalse(default_storage.exists(orphan))
+
+    def test_saving_existing_content_refreshes_its_age(self):
+        name = default_storage.save("hotels/a.jpg", ContentFile(b"photo"))
+        os.utime(default_storage.path(name), (0, 0))
+
+        default_storage.save("rooms/b.jpg", ContentFile(b"photo"))
+
+        call_command("gc_media", min_age=1, stdout=io.StringIO())
+        self.assertTrue(default_storage.exists(name))
+
+    def test_gc_rechecks_references_before_deleting(self):
+        kept = default_storage.save("hotels/a.jpg", ContentFile(b"kept"))
+        variant = default_storage.save("hotels/a.webp", ContentFile(b"v"))
+        Hotel.objects.create(
+            name="Hotel",
+            owner=self.owner,
+            photos=kept,
+            photos_variants={"source": kept, "variants": [{"name": variant}]},
+        )
+
+        # Rows committed after the snapshot of referenced names.
+        with patch(
+            "booking_clone.management.commands.gc_media.referenced_names",
+            return_value=set(),
+        ):
+            call_command("gc_media", min_age=0, stdout=io.StringIO())
+
+        self.assertTrue(default_storage.exists(kept))
+        self.assertTrue(default_storage.exists(variant))
+
+    def test_migration_rehashes_existing_files(self):
+        path = default_storage.path("hotels/legacy.jpg")
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as file:
+            file.write(b"legacy")
+        hotel = Hotel.objects.create(name="Hotel", owner=self.owner)
+        Hotel.objects.filter(pk=hotel.pk).update(photos="hotels/legacy.jpg")
+
+        rehash_migration.rehash_media_files(apps, None)
+
+        hotel.refresh_from_db()
+        self.assertTrue(is_hashed_name(hotel.photos.name))
+        self.assertEqual(hotel.photos.read(), b"legacy")
+
+    def test_migration_fails_on_missing_files(self):
+        hotel = Hotel.objects.create(name="Hotel", owner=self.owner)
+        Hotel.objects.filter(pk=hotel.pk).update(photos="hotels/missing.jpg")
+
+        with self.assertRaises(FileNotFoundError):
+            rehash_migration.rehash_media_files(apps, None)
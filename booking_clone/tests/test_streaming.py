@@ -0,0 +1,97 @@
+import datetime
+import json
+import tracemalloc
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+
+from booking_clone.streaming import stream_csv, stream_ndjson
+from bookings.models import Booking
+from hotels.models import Hotel, Room
+
+COLUMNS = ["id", "status", "check_in", "created_at", "price"]
+
+
+def generate_rows(count):
+    row = (
+        1,
+        "CONFIRMED",
+        datetime.date(2025, 1, 1),
+        datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        Decimal("120.50"),
+    )
+    for _ in range(count):
+        yield row
+
+
+class StreamingExportTest(SimpleTestCase):
+    def test_ndjson_rows(self):
+        lines = b"".join(stream_ndjson(COLUMNS, generate_rows(2)))
+        rows = [json.loads(line) for line in lines.splitlines()]
+        self.assertEqual(
+            rows[1],
+            {
+                "id": 1,
+                "status": "CONFIRMED",
+                "check_in": "2025-01-01",
+                "created_at": "2025-01-01T00:00:00Z",
+                "price": "120.50",
+            },
+        )
+
+    def test_csv_rows(self):
+        content = b"".join(stream_csv(COLUMNS, generate_rows(1))).decode()
+        self.assertEqual(
+            content.splitlines(),
+            [
+                "id,status,check_in,created_at,price",
+                "1,CONFIRMED,2025-01-01,2025-01-01T00:00:00Z,120.50",
+            ],
+        )
+
+
+class StreamingExportEndpointTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = get_user_model().objects.create_user(
+            username="staff", password="pass", is_staff=True
+        )
+        room = Room.objects.create(
+            hotel=Hotel.objects.create(name="Hotel", owner=cls.staff),
+            number="1",
+            price=100,
+        )
+        check_in = timezone.localdate()
+        Booking.objects.bulk_create(
+            Booking(
+                user=cls.staff,
+                room=room,
+                check_in=check_in,
+                check_out=check_in + datetime.timedelta(days=1),
+            )
+            for _ in range(30_000)
+        )
+
+    async def test_memory_is_bounded(self):
+        client = AsyncClient()
+        url = reverse("bookings:booking-export")
+        headers = {
+            "authorization": f"Bearer {AccessToken.for_user(self.staff)}"
+        }
+        # Load the modules imported by the first request.
+        await client.get(url, {"date_from": "2999-01-01"}, headers=headers)
+
+        tracemalloc.start()
+        response = await client.get(url, headers=headers)
+        size = 0
+        async for chunk in response:
+            size += len(chunk)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.assertGreater(size, 30_000 * 100)
+        self.assertLess(peak, size / 2)
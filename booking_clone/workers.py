@@ -0,0 +1,13 @@
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    UvicornWorker honouring Gunicorn's ``worker_connections`` as Uvicorn's
+    ``limit_concurrency``: a worker answers 503 once that many HTTP
+    connections are open, idle keep-alive ones included.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.config.limit_concurrency = self.cfg.worker_connections
@@ -1,6 +1,6 @@
-from django.apps import AppConfig
-
-
-class BookingsConfig(AppConfig):
-    default_auto_field = "django.db.models.BigAutoField"
-    name = "bookings"
+from django.apps import AppConfig
+
+
+class BookingsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "bookings"
@@ -0,0 +1,64 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from bookings.models import Booking
+from payments.models import Payment, PaymentStatus
+
+
+class Command(BaseCommand):
+    help = "Expire PENDING bookings whose hold has run out"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sweeping every --interval seconds",
+        )
+        parser.add_argument("--interval", type=float, default=60)
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                # Drop a connection the database closed, or one past
+                # CONN_MAX_AGE, as the request cycle does.
+                close_old_connections()
+                expired = self.sweep(options["batch_size"])
+                self.stdout.write(f"Expired {expired} bookings.")
+                if not options["loop"]:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+    def sweep(self, batch_size):
+        total = 0
+        while True:
+            expired = self.expire_batch(batch_size)
+            total += expired
+            if expired < batch_size:
+                return total
+
+    @transaction.atomic
+    def expire_batch(self, batch_size):
+        # Rows locked by another sweeper or a payment callback
+        # (payments.views.settle_payment) are skipped and picked up by a
+        # later batch; the callback rejects holds that ran out meanwhile.
+        pending = Booking.objects.filter(
+            status="PENDING", expires_at__lte=timezone.now()
+        )
+        ids = list(
+            pending.select_for_update(skip_locked=True)
+            .order_by("expires_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0
+
+        Payment.objects.filter(
+            booking_id__in=ids, status=PaymentStatus.PENDING
+        ).update(status=PaymentStatus.EXPIRED)
+        return pending.filter(pk__in=ids).update(status="EXPIRED")
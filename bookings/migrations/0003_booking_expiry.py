@@ -0,0 +1,61 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:38
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def set_pending_expiry(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    Booking.objects.filter(status="PENDING", expires_at__isnull=True).update(
+        expires_at=models.F("created_at")
+        + timedelta(minutes=settings.BOOKING_HOLD_MINUTES)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0002_booking_status"),
+        ("hotels", "0005_room_hotel_avail_guests_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="expires_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(set_pending_expiry, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="booking",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "PENDING"),
+                    ("CONFIRMED", "CONFIRMED"),
+                    ("CANCELLED", "CANCELLED"),
+                    ("EXPIRED", "EXPIRED"),
+                ],
+                default="PENDING",
+                max_length=16,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status__in", ["PENDING", "CONFIRMED"])),
+                fields=["room", "check_in", "check_out"],
+                name="booking_active_room_dates_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["expires_at"],
+                name="booking_pending_expiry_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0003_booking_expiry"),
+        ("hotels", "0006_query_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(
+                fields=["user", "-created_at"], name="booking_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["-created_at"], name="booking_created_idx"),
+        ),
+    ]
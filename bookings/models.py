@@ -1,37 +1,81 @@
-from django.conf import settings
-from django.db import models
-
-from hotels.models import Room
-
-
-class Booking(models.Model):
-    user = models.ForeignKey(
-        settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE,
-        limit_choices_to={"role": "guest"},
-        related_name="bookings",
-    )
-    room = models.ForeignKey(
-        Room,
-        on_delete=models.CASCADE,
-        related_name="bookings",
-    )
-    check_in = models.DateField()
-    check_out = models.DateField()
-    created_at = models.DateTimeField(auto_now_add=True)
-    STATUS_CHOICES = [
-        ("PENDING", "PENDING"),
-        ("CONFIRMED", "CONFIRMED"),
-        ("CANCELLED", "CANCELLED"),
-    ]
-    status = models.CharField(
-        max_length=16,
-        choices=STATUS_CHOICES,
-        default="PENDING",
-    )
-
-    def __str__(self):
-        return (
-            f"Booking {self.id} by {self.user.username} - "
-            f"{self.room.hotel.name} / {self.room.number}"
-        )
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from hotels.models import Room
+
+
+class BookingQuerySet(models.QuerySet):
+    def holding_room(self):
+        """Confirmed bookings and pending ones whose hold has not expired."""
+        return self.filter(status__in=Booking.ACTIVE_STATUSES).exclude(
+            status="PENDING", expires_at__lte=timezone.now()
+        )
+
+    def overlapping(self, room, check_in, check_out):
+        return self.holding_room().filter(
+            room=room, check_in__lt=check_out, check_out__gt=check_in
+        )
+
+
+class Booking(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        limit_choices_to={"role": "guest"},
+        related_name="bookings",
+    )
+    room = models.ForeignKey(
+        Room,
+        on_delete=models.CASCADE,
+        related_name="bookings",
+    )
+    check_in = models.DateField()
+    check_out = models.DateField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    STATUS_CHOICES = [
+        ("PENDING", "PENDING"),
+        ("CONFIRMED", "CONFIRMED"),
+        ("CANCELLED", "CANCELLED"),
+        ("EXPIRED", "EXPIRED"),
+    ]
+    ACTIVE_STATUSES = ("PENDING", "CONFIRMED")
+    status = models.CharField(
+        max_length=16,
+        choices=STATUS_CHOICES,
+        default="PENDING",
+    )
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    objects = BookingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["room", "check_in", "check_out"],
+                name="booking_active_room_dates_idx",
+                condition=models.Q(status__in=["PENDING", "CONFIRMED"]),
+            ),
+            models.Index(
+                fields=["expires_at"],
+                name="booking_pending_expiry_idx",
+                condition=models.Q(status="PENDING"),
+            ),
+            models.Index(
+                fields=["user", "-created_at"],
+                name="booking_user_created_idx",
+            ),
+            models.Index(fields=["-created_at"], name="booking_created_idx"),
+        ]
+
+    def is_held(self):
+        """Whether the booking is PENDING and its hold has not run out."""
+        return self.status == "PENDING" and (
+            self.expires_at is None or self.expires_at > timezone.now()
+        )
+
+    def __str__(self):
+        return (
+            f"Booking {self.id} by {self.user.username} - "
+            f"{self.room.hotel.name} / {self.room.number}"
+        )
@@ -1,80 +1,112 @@
-from django.utils import timezone
-from rest_framework import serializers
-
-from bookings.models import Booking
-from hotels.models import Room
-from hotels.serializers import RoomShortSerializer
-from users.models import User
-
-
-class UserShortSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = User
-        fields = ["id", "username", "email"]
-
-
-class BookingSerializer(serializers.ModelSerializer):
-    user = UserShortSerializer(read_only=True)
-    room = RoomShortSerializer(read_only=True)
-    room_id = serializers.PrimaryKeyRelatedField(
-        queryset=Room.objects.all(), write_only=True, source="room"
-    )
-    total_price = serializers.SerializerMethodField(read_only=True)
-
-    class Meta:
-        model = Booking
-        fields = [
-            "id",
-            "user",
-            "room",
-            "room_id",
-            "check_in",
-            "check_out",
-            "created_at",
-            "total_price",
-            "status",
-        ]
-        read_only_fields = [
-            "id",
-            "created_at",
-            "user",
-            "room",
-            "total_price",
-            "status",
-        ]
-
-    def get_total_price(self, obj):
-        if obj.check_in and obj.check_out and obj.room:
-            days = (obj.check_out - obj.check_in).days
-            return days * obj.room.price
-        return None
-
-    def validate(self, attrs):
-        check_in = attrs.get("check_in")
-        check_out = attrs.get("check_out")
-        room = attrs.get("room")
-        today = timezone.now().date()
-        if check_in and check_in < today:
-            raise serializers.ValidationError(
-                {"check_in": "Check-in date cannot be in the past."}
-            )
-        if check_in and check_out and check_in >= check_out:
-            raise serializers.ValidationError(
-                {"check_out": "The check-out must be later than the check-in."}
-            )
-        if room and check_in and check_out:
-            overlapping = Booking.objects.filter(
-                room=room, check_in__lt=check_out, check_out__gt=check_in
-            )
-            if self.instance:
-                overlapping = overlapping.exclude(pk=self.instance.pk)
-            if overlapping.exists():
-                raise serializers.ValidationError(
-                    "This room is already booked for the selected dates."
-                )
-        return attrs
-
-    def create(self, validated_data):
-        user = self.context["request"].user
-        validated_data["user"] = user
-        return super().create(validated_data)
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+from booking_clone.serializers import DynamicFieldsMixin, ValuesSerializer
+from bookings.models import Booking
+from hotels.models import Room
+from hotels.serializers import RoomShortSerializer
+from users.models import User
+
+
+class UserShortSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ["id", "username", "email"]
+
+
+class BookingSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    user = UserShortSerializer(read_only=True)
+    room = RoomShortSerializer(read_only=True)
+    room_id = serializers.PrimaryKeyRelatedField(
+        queryset=Room.objects.all(), write_only=True, source="room"
+    )
+    total_price = serializers.SerializerMethodField(read_only=True)
+
+    class Meta:
+        model = Booking
+        fields = [
+            "id",
+            "user",
+            "room",
+            "room_id",
+            "check_in",
+            "check_out",
+            "created_at",
+            "total_price",
+            "status",
+            "expires_at",
+        ]
+        read_only_fields = [
+            "id",
+            "created_at",
+            "user",
+            "room",
+            "total_price",
+            "status",
+            "expires_at",
+        ]
+        expandable_fields = {
+            "payment": "payments.serializers.PaymentListSerializer",
+        }
+        field_dependencies = {
+            "total_price": ["check_in", "check_out", "room"],
+        }
+
+    def get_total_price(self, obj):
+        if obj.check_in and obj.check_out and obj.room:
+            days = (obj.check_out - obj.check_in).days
+            return days * obj.room.price
+        return None
+
+    def validate(self, attrs):
+        check_in = attrs.get("check_in")
+        check_out = attrs.get("check_out")
+        room = attrs.get("room")
+        today = timezone.now().date()
+        if check_in and check_in < today:
+            raise serializers.ValidationError(
+                {"check_in": "Check-in date cannot be in the past."}
+            )
+        if check_in and check_out and check_in >= check_out:
+            raise serializers.ValidationError(
+                {"check_out": "The check-out must be later than the check-in."}
+            )
+        if room and check_in and check_out:
+            overlapping = Booking.objects.overlapping(
+                room, check_in, check_out
+            )
+            if self.instance:
+                overlapping = overlapping.exclude(pk=self.instance.pk)
+            if overlapping.exists():
+                raise serializers.ValidationError(
+                    "This room is already booked for the selected dates."
+                )
+        return attrs
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+        validated_data["user"] = user
+        validated_data["expires_at"] = timezone.now() + timedelta(
+            minutes=settings.BOOKING_HOLD_MINUTES
+        )
+        return super().create(validated_data)
+
+
+def get_row_total_price(row):
+    if row["check_in"] and row["check_out"]:
+        days = (row["check_out"] - row["check_in"]).days
+        return days * row["room__price"]
+    return None
+
+
+class BookingValuesSerializer(ValuesSerializer):
+    serializer_class = BookingSerializer
+    method_fields = {
+        "total_price": (
+            ["check_in", "check_out", "room__price"],
+            get_row_total_price,
+        ),
+    }
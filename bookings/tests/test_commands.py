@@ -0,0 +1,69 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from bookings.models import Booking
+from hotels.models import Hotel, Room
+from payments.models import Payment, PaymentStatus
+
+
+class ExpireBookingsCommandTest(TestCase):
+    def setUp(self):
+        owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.user = get_user_model().objects.create_user(
+            username="simpleuser", password="pass"
+        )
+        self.room = Room.objects.create(
+            hotel=Hotel.objects.create(name="Hotel", owner=owner),
+            number="1",
+            price=100,
+        )
+
+    def book(self, status, expires_in, days=0):
+        check_in = timezone.now().date() + timezone.timedelta(days=days)
+        booking = Booking.objects.create(
+            user=self.user,
+            room=self.room,
+            check_in=check_in,
+            check_out=check_in + timezone.timedelta(days=1),
+            status=status,
+            expires_at=timezone.now() + timezone.timedelta(minutes=expires_in),
+        )
+        Payment.objects.create(booking=booking, amount=100)
+        return booking
+
+    def test_expires_abandoned_bookings_in_batches(self):
+        abandoned = [self.book("PENDING", -1, days=day) for day in range(3)]
+        held = self.book("PENDING", 10, days=5)
+        confirmed = self.book("CONFIRMED", -1, days=6)
+
+        out = StringIO()
+        call_command("expire_bookings", batch_size=2, stdout=out)
+        self.assertIn("Expired 3 bookings.", out.getvalue())
+
+        statuses = dict(Booking.objects.values_list("pk", "status"))
+        self.assertEqual(
+            [statuses[booking.pk] for booking in abandoned], ["EXPIRED"] * 3
+        )
+        self.assertEqual(statuses[held.pk], "PENDING")
+        self.assertEqual(statuses[confirmed.pk], "CONFIRMED")
+        self.assertEqual(
+            Payment.objects.filter(status=PaymentStatus.EXPIRED).count(), 3
+        )
+
+    @patch("bookings.management.commands.expire_bookings.time.sleep")
+    @patch(
+        "bookings.management.commands.expire_bookings.close_old_connections"
+    )
+    def test_loop_recycles_connections(self, close_old_connections, sleep):
+        sleep.side_effect = [None, KeyboardInterrupt]
+
+        call_command("expire_bookings", loop=True, stdout=StringIO())
+
+        self.assertEqual(close_old_connections.call_count, 2)
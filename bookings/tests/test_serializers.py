@@ -1,51 +1,96 @@
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.utils import timezone
-
-from bookings.serializers import BookingSerializer
-from hotels.models import Room, Hotel, RoomType, Location
-
-
-class BookingSerializerSimpleTest(TestCase):
-    def setUp(self):
-        self.owner = get_user_model().objects.create_user(
-            username="owneruser", password="pass"
-        )
-        self.user = get_user_model().objects.create_user(
-            username="simpleuser", password="pass"
-        )
-        self.location = Location.objects.create(country="UA", city="Kyiv")
-        self.hotel = Hotel.objects.create(
-            name="Simple Hotel", location=self.location, owner=self.owner
-        )
-        self.room_type = RoomType.objects.create(
-            name="Standard", description="", max_guests=2, size=20, bed_count=1
-        )
-        self.room = Room.objects.create(
-            hotel=self.hotel, number="1", room_type=self.room_type, price=100
-        )
-
-    def test_serializer_valid(self):
-        data = {
-            "room_id": self.room.id,
-            "check_in": timezone.now().date(),
-            "check_out": timezone.now().date() + timezone.timedelta(days=1),
-        }
-        request = type("Request", (), {"user": self.user})()
-        serializer = BookingSerializer(data=data, context={"request": request})
-        self.assertTrue(serializer.is_valid(), serializer.errors)
-        booking = serializer.save()
-        self.assertEqual(booking.user, self.user)
-        self.assertEqual(booking.room, self.room)
-        self.assertEqual(booking.status, "PENDING")
-    
-    def test_serializer_invalid_dates(self):
-        data = {
-            "room_id": self.room.id,
-            "check_in": timezone.now().date() + timezone.timedelta(days=2),
-            "check_out": timezone.now().date(),
-        }
-        request = type("Request", (), {"user": self.user})()
-        serializer = BookingSerializer(data=data, context={"request": request})
-        self.assertFalse(serializer.is_valid())
-        self.assertIn("check_out", serializer.errors)
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from bookings.models import Booking
+from bookings.serializers import BookingSerializer
+from hotels.models import Room, Hotel, RoomType, Location
+
+
+class BookingSerializerSimpleTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass"
+        )
+        self.user = get_user_model().objects.create_user(
+            username="simpleuser", password="pass"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.hotel = Hotel.objects.create(
+            name="Simple Hotel", location=self.location, owner=self.owner
+        )
+        self.room_type = RoomType.objects.create(
+            name="Standard", description="", max_guests=2, size=20, bed_count=1
+        )
+        self.room = Room.objects.create(
+            hotel=self.hotel, number="1", room_type=self.room_type, price=100
+        )
+
+    def test_serializer_valid(self):
+        data = {
+            "room_id": self.room.id,
+            "check_in": timezone.now().date(),
+            "check_out": timezone.now().date() + timezone.timedelta(days=1),
+        }
+        request = type("Request", (), {"user": self.user})()
+        serializer = BookingSerializer(data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        booking = serializer.save()
+        self.assertEqual(booking.user, self.user)
+        self.assertEqual(booking.room, self.room)
+        self.assertEqual(booking.status, "PENDING")
+    
+    def test_serializer_invalid_dates(self):
+        data = {
+            "room_id": self.room.id,
+            "check_in": timezone.now().date() + timezone.timedelta(days=2),
+            "check_out": timezone.now().date(),
+        }
+        request = type("Request", (), {"user": self.user})()
+        serializer = BookingSerializer(data=data, context={"request": request})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("check_out", serializer.errors)
+
+    def test_serializer_sets_hold_expiry(self):
+        data = {
+            "room_id": self.room.id,
+            "check_in": timezone.now().date(),
+            "check_out": timezone.now().date() + timezone.timedelta(days=1),
+        }
+        request = type("Request", (), {"user": self.user})()
+        serializer = BookingSerializer(data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        booking = serializer.save()
+        self.assertGreater(booking.expires_at, timezone.now())
+
+    def test_only_holding_bookings_overlap(self):
+        check_in = timezone.now().date()
+        check_out = check_in + timezone.timedelta(days=2)
+        booking = Booking.objects.create(
+            user=self.user,
+            room=self.room,
+            check_in=check_in,
+            check_out=check_out,
+            expires_at=timezone.now() + timezone.timedelta(minutes=5),
+        )
+        data = {
+            "room_id": self.room.id,
+            "check_in": check_in,
+            "check_out": check_out,
+        }
+        request = type("Request", (), {"user": self.user})()
+        serializer = BookingSerializer(data=data, context={"request": request})
+        self.assertFalse(serializer.is_valid())
+
+        for status, expires_at in [
+            ("PENDING", timezone.now()),
+            ("CANCELLED", None),
+            ("EXPIRED", None),
+        ]:
+            booking.status = status
+            booking.expires_at = expires_at
+            booking.save()
+            serializer = BookingSerializer(
+                data=data, context={"request": request}
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
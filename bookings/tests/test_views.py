@@ -1,51 +1,192 @@
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
-from django.utils import timezone
-from rest_framework.test import APIClient
-
-from hotels.models import Hotel, Room, RoomType, Location
-
-
-class BookingViewSimpleTest(TestCase):
-    def setUp(self):
-        self.owner = get_user_model().objects.create_user(
-            username="owneruser", password="pass"
-        )
-        self.user = get_user_model().objects.create_user(
-            username="simpleuser", password="pass"
-        )
-        self.location = Location.objects.create(country="UA", city="Kyiv")
-        self.hotel = Hotel.objects.create(
-            name="Simple Hotel", location=self.location, owner=self.owner
-        )
-        self.room_type = RoomType.objects.create(
-            name="Standard", description="", max_guests=2, size=20, bed_count=1
-        )
-        self.room = Room.objects.create(
-            hotel=self.hotel, number="1", room_type=self.room_type, price=100
-        )
-        self.client = APIClient()
-    
-    def test_booking_create_authenticated(self):
-        self.client.force_authenticate(user=self.user)
-        url = reverse("bookings:booking-list")
-        data = {
-            "room_id": self.room.id,
-            "check_in": timezone.now().date(),
-            "check_out": timezone.now().date() + timezone.timedelta(days=1),
-        }
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data["status"], "PENDING")
-        self.assertEqual(response.data["user"]["id"], self.user.id)
-    
-    def test_booking_create_unauthenticated(self):
-        url = reverse("bookings:booking-list")
-        data = {
-            "room_id": self.room.id,
-            "check_in": timezone.now().date(),
-            "check_out": timezone.now().date() + timezone.timedelta(days=1),
-        }
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 401)
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from booking_clone.queries import assert_no_repeated_queries
+from bookings.models import Booking
+from hotels.models import Hotel, Room, RoomType, Location
+from payments.models import Payment
+
+
+class BookingViewSimpleTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass"
+        )
+        self.user = get_user_model().objects.create_user(
+            username="simpleuser", password="pass"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.hotel = Hotel.objects.create(
+            name="Simple Hotel", location=self.location, owner=self.owner
+        )
+        self.room_type = RoomType.objects.create(
+            name="Standard", description="", max_guests=2, size=20, bed_count=1
+        )
+        self.room = Room.objects.create(
+            hotel=self.hotel, number="1", room_type=self.room_type, price=100
+        )
+        self.client = APIClient()
+    
+    def test_booking_create_authenticated(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("bookings:booking-list")
+        data = {
+            "room_id": self.room.id,
+            "check_in": timezone.now().date(),
+            "check_out": timezone.now().date() + timezone.timedelta(days=1),
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], "PENDING")
+        self.assertEqual(response.data["user"]["id"], self.user.id)
+    
+    def test_booking_create_unauthenticated(self):
+        url = reverse("bookings:booking-list")
+        data = {
+            "room_id": self.room.id,
+            "check_in": timezone.now().date(),
+            "check_out": timezone.now().date() + timezone.timedelta(days=1),
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 401)
+
+
+class BookingExportTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        other_owner = get_user_model().objects.create_user(
+            username="otherowner", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass"
+        )
+        self.room = Room.objects.create(
+            hotel=Hotel.objects.create(name="Own Hotel", owner=self.owner),
+            number="1",
+            price=100,
+        )
+        other_room = Room.objects.create(
+            hotel=Hotel.objects.create(name="Other Hotel", owner=other_owner),
+            number="1",
+            price=100,
+        )
+        check_in = timezone.now().date()
+        for room, days in [(self.room, 0), (self.room, 40), (other_room, 0)]:
+            Booking.objects.create(
+                user=self.guest,
+                room=room,
+                check_in=check_in + timezone.timedelta(days=days),
+                check_out=check_in + timezone.timedelta(days=days + 1),
+            )
+        self.url = reverse("bookings:booking-export")
+        self.client = APIClient()
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        content = b"".join(response.streaming_content).decode()
+        return content.splitlines()
+
+    def test_owner_exports_own_hotel_bookings_as_ndjson(self):
+        self.client.force_authenticate(user=self.owner)
+        rows = [json.loads(line) for line in self.export()]
+        self.assertEqual(len(rows), 2)
+        self.assertEqual({row["hotel"] for row in rows}, {"Own Hotel"})
+        self.assertEqual(rows[0]["price"], "100.00")
+
+    def test_staff_exports_csv_filtered_by_date(self):
+        staff = get_user_model().objects.create_user(
+            username="staff", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=staff)
+        today = timezone.now().date().isoformat()
+        lines = self.export(
+            export_format="csv", date_from=today, date_to=today
+        )
+        self.assertEqual(lines[0].split(",")[:3], ["id", "status", "check_in"])
+        self.assertEqual(len(lines), 3)
+
+    async def test_export_streams_asynchronously_under_asgi(self):
+        token = AccessToken.for_user(self.owner)
+        response = await AsyncClient().get(
+            self.url, headers={"authorization": f"Bearer {token}"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response])
+        self.assertEqual(len(content.splitlines()), 2)
+
+    def test_guest_cannot_export(self):
+        self.client.force_authenticate(user=self.guest)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+
+
+class BookingQueryPatternTest(TestCase):
+    """Booking endpoints run the same number of queries per page."""
+
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.staff = get_user_model().objects.create_user(
+            username="staffuser", password="pass", is_staff=True
+        )
+        room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        today = timezone.localdate()
+        for index in range(5):
+            guest = get_user_model().objects.create_user(
+                username=f"guest{index}", password="pass"
+            )
+            hotel = Hotel.objects.create(
+                name=f"Hotel {index}",
+                location=Location.objects.create(
+                    country="UA", city=f"City {index}"
+                ),
+                owner=self.owner,
+            )
+            room = Room.objects.create(
+                hotel=hotel, number="1", room_type=room_type, price=100
+            )
+            self.booking = Booking.objects.create(
+                user=guest,
+                room=room,
+                check_in=today,
+                check_out=today + timezone.timedelta(days=1),
+                status="CONFIRMED",
+            )
+            Payment.objects.create(
+                booking=self.booking, amount=100, status="PAID"
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def test_read_endpoints(self):
+        urls = [
+            reverse("bookings:booking-list"),
+            reverse("bookings:booking-list") + "?expand=payment",
+            reverse("bookings:booking-detail", args=[self.booking.id]),
+            reverse("bookings:booking-export"),
+        ]
+        for url in urls:
+            with self.subTest(url=url), assert_no_repeated_queries():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                b"".join(getattr(response, "streaming_content", []))
+
+    def test_update(self):
+        url = reverse("bookings:booking-detail", args=[self.booking.id])
+        with assert_no_repeated_queries():
+            response = self.client.patch(url, {"status": "CANCELLED"})
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,14 @@
+import pytest
+
+from booking_clone.queries import QueryPatternDetector
+
+
+@pytest.fixture
+def nplusone():
+    """
+    Fail the test if it repeats a query more than NPLUSONE_THRESHOLD
+    times from the same call site; ``nplusone.threshold`` can be lowered.
+    """
+    with QueryPatternDetector() as detector:
+        yield detector
+    detector.check()
@@ -0,0 +1,49 @@
+"""
+Gunicorn settings of the application server. The ASGI app runs in Uvicorn
+workers: each one serves async views on its event loop. Django runs the sync
+code of a request (middleware, DRF views, the rows of streamed exports) in a
+thread of that request, which opens its own database connection and closes it
+when the request ends. worker_connections caps the concurrent HTTP
+connections of a worker, not its database connections.
+
+Tuned from the environment:
+    WEB_CONCURRENCY            worker processes (default: 2 x CPUs + 1)
+    GUNICORN_WORKER_CONNECTIONS
+                               concurrent HTTP connections per worker,
+                               beyond which it answers 503 (default: 25)
+    GUNICORN_BIND              address to listen on (default: 0.0.0.0:8000)
+    GUNICORN_TIMEOUT           seconds before a silent worker is restarted
+    GUNICORN_MAX_REQUESTS      requests before a worker is recycled
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "booking_clone.asgi:application"
+worker_class = "booking_clone.workers.UvicornWorker"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1)
+)
+# Idle keep-alive connections count too, so size it above the requests a
+# worker should serve at once.
+worker_connections = int(os.environ.get("GUNICORN_WORKER_CONNECTIONS", 25))
+
+# Import Django once in the master so workers fork with it loaded: faster
+# boots and copy-on-write shared memory. Connections open after the fork.
+preload_app = True
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then to bound memory growth, staggered so they do
+# not all restart together.
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+# Heartbeat files on tmpfs, a slow overlay filesystem can stall workers.
+worker_tmp_dir = "/dev/shm"
+
+accesslog = "-"
+errorlog = "-"
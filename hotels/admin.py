@@ -1,57 +1,91 @@
-from django.contrib import admin
-
-from hotels.models import Hotel, Location, Room, RoomType, Amenity
-
-
-@admin.register(Location)
-class LocationAdmin(admin.ModelAdmin):
-    list_display = ["city", "country"]
-    list_filter = ["country"]
-    search_fields = ["city", "country"]
-
-
-@admin.register(RoomType)
-class RoomTypeAdmin(admin.ModelAdmin):
-    list_display = ["name", "max_guests", "size", "bed_count"]
-    search_fields = ["name"]
-
-
-@admin.register(Amenity)
-class AmenityAdmin(admin.ModelAdmin):
-    list_display = ["name"]
-    search_fields = ["name"]
-
-
-class RoomInline(admin.TabularInline):
-    model = Room
-    extra = 0
-    fields = ["number", "room_type", "price", "is_available", "max_guests"]
-
-
-@admin.register(Hotel)
-class HotelAdmin(admin.ModelAdmin):
-    list_display = ["name", "owner", "location", "rating", "rooms_count"]
-    list_filter = ["location__country", "location__city", "rating"]
-    search_fields = ["name", "description"]
-    readonly_fields = ["rating"]
-    inlines = [RoomInline]
-
-    def rooms_count(self, obj):
-        return obj.rooms.count()
-
-    rooms_count.short_description = "Rooms"
-
-
-@admin.register(Room)
-class RoomAdmin(admin.ModelAdmin):
-    list_display = [
-        "hotel",
-        "number",
-        "room_type",
-        "price",
-        "is_available",
-        "max_guests",
-    ]
-    list_filter = ["hotel", "room_type", "is_available"]
-    search_fields = ["hotel__name", "number"]
-    filter_horizontal = ["amenities"]
+from django.contrib import admin
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from booking_clone.admin import AutocompleteFilter, LargeTableAdmin
+from hotels.models import Hotel, Location, Room, RoomType, Amenity
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ["city", "country"]
+    list_filter = ["country"]
+    search_fields = ["city", "country"]
+
+
+@admin.register(RoomType)
+class RoomTypeAdmin(admin.ModelAdmin):
+    list_display = ["name", "max_guests", "size", "bed_count"]
+    search_fields = ["name"]
+
+
+@admin.register(Amenity)
+class AmenityAdmin(admin.ModelAdmin):
+    list_display = ["name"]
+    search_fields = ["name"]
+
+
+class RoomInline(admin.TabularInline):
+    model = Room
+    extra = 0
+    fields = ["number", "room_type", "price", "is_available", "max_guests"]
+
+
+@admin.register(Hotel)
+class HotelAdmin(LargeTableAdmin):
+    list_display = ["name", "owner", "location", "rating", "rooms_count"]
+    list_filter = [
+        "location__country",
+        ("location", AutocompleteFilter),
+        "rating",
+    ]
+    list_select_related = ["owner", "location"]
+    search_fields = ["name", "description"]
+    readonly_fields = ["rating"]
+    autocomplete_fields = ["owner", "location"]
+    inlines = [RoomInline]
+
+    def get_queryset(self, request):
+        # A correlated subquery counts the rooms of the listed page only,
+        # where a join and GROUP BY would aggregate every hotel first.
+        rooms_count = (
+            Room.objects.filter(hotel=OuterRef("pk"))
+            .order_by()
+            .values("hotel")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(rooms_count=Coalesce(Subquery(rooms_count), 0))
+        )
+
+    @admin.display(description="Rooms", ordering="rooms_count")
+    def rooms_count(self, obj):
+        return obj.rooms_count
+
+
+@admin.register(Room)
+class RoomAdmin(LargeTableAdmin):
+    list_display = [
+        "hotel",
+        "number",
+        "room_type",
+        "price",
+        "is_available",
+        "max_guests",
+    ]
+    list_filter = [("hotel", AutocompleteFilter), "room_type", "is_available"]
+    search_fields = ["hotel__name", "number"]
+    autocomplete_fields = ["hotel"]
+    filter_horizontal = ["amenities"]
+    # Explicit, so the changelist never falls back to a select_related()
+    # of every foreign key.
+    list_select_related = ["hotel", "room_type"]
+
+    def get_queryset(self, request):
+        # Room.__str__ shows the hotel name, in autocomplete results too.
+        return (
+            super().get_queryset(request).select_related("hotel", "room_type")
+        )
@@ -1,6 +1,6 @@
-from django.apps import AppConfig
-
-
-class HotelsConfig(AppConfig):
-    default_auto_field = "django.db.models.BigAutoField"
-    name = "hotels"
+from django.apps import AppConfig
+
+
+class HotelsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "hotels"
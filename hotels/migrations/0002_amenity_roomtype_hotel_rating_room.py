@@ -1,94 +1,94 @@
-# Generated by Django 5.2.6 on 2025-09-17 01:37
-
-import django.db.models.deletion
-from django.db import migrations, models
-
-
-class Migration(migrations.Migration):
-    dependencies = [
-        ("hotels", "0001_initial"),
-    ]
-
-    operations = [
-        migrations.CreateModel(
-            name="Amenity",
-            fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("name", models.CharField(max_length=50, unique=True)),
-                ("description", models.TextField(blank=True)),
-            ],
-        ),
-        migrations.CreateModel(
-            name="RoomType",
-            fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("name", models.CharField(max_length=50, unique=True)),
-                ("description", models.TextField(blank=True)),
-                ("max_guests", models.PositiveIntegerField()),
-                ("size", models.FloatField()),
-                ("bed_count", models.PositiveIntegerField()),
-            ],
-        ),
-        migrations.AddField(
-            model_name="hotel",
-            name="rating",
-            field=models.FloatField(default=0),
-        ),
-        migrations.CreateModel(
-            name="Room",
-            fields=[
-                (
-                    "id",
-                    models.BigAutoField(
-                        auto_created=True,
-                        primary_key=True,
-                        serialize=False,
-                        verbose_name="ID",
-                    ),
-                ),
-                ("number", models.CharField(max_length=10)),
-                ("price", models.DecimalField(decimal_places=2, max_digits=8)),
-                ("is_available", models.BooleanField(default=True)),
-                ("max_guests", models.PositiveIntegerField()),
-                (
-                    "amenities",
-                    models.ManyToManyField(
-                        blank=True, related_name="rooms", to="hotels.amenity"
-                    ),
-                ),
-                (
-                    "hotel",
-                    models.ForeignKey(
-                        on_delete=django.db.models.deletion.CASCADE,
-                        related_name="rooms",
-                        to="hotels.hotel",
-                    ),
-                ),
-                (
-                    "room_type",
-                    models.ForeignKey(
-                        null=True,
-                        on_delete=django.db.models.deletion.SET_NULL,
-                        related_name="rooms",
-                        to="hotels.roomtype",
-                    ),
-                ),
-            ],
-        ),
-    ]
+# Generated by Django 5.2.6 on 2025-09-17 01:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Amenity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("description", models.TextField(blank=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="RoomType",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("description", models.TextField(blank=True)),
+                ("max_guests", models.PositiveIntegerField()),
+                ("size", models.FloatField()),
+                ("bed_count", models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="hotel",
+            name="rating",
+            field=models.FloatField(default=0),
+        ),
+        migrations.CreateModel(
+            name="Room",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.CharField(max_length=10)),
+                ("price", models.DecimalField(decimal_places=2, max_digits=8)),
+                ("is_available", models.BooleanField(default=True)),
+                ("max_guests", models.PositiveIntegerField()),
+                (
+                    "amenities",
+                    models.ManyToManyField(
+                        blank=True, related_name="rooms", to="hotels.amenity"
+                    ),
+                ),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rooms",
+                        to="hotels.hotel",
+                    ),
+                ),
+                (
+                    "room_type",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="rooms",
+                        to="hotels.roomtype",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0004_alter_room_max_guests"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(
+                fields=["hotel", "is_available", "max_guests", "price"],
+                name="room_hotel_avail_guests_idx",
+            ),
+        ),
+    ]
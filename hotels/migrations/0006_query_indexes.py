@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0005_room_hotel_avail_guests_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="hotel",
+            index=models.Index(fields=["-rating"], name="hotel_rating_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(fields=["hotel", "price"], name="room_hotel_price_idx"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-19 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hotels", "0006_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="hotel",
+            name="photos_variants",
+            field=models.JSONField(default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name="room",
+            name="photos_variants",
+            field=models.JSONField(default=dict, editable=False),
+        ),
+    ]
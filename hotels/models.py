@@ -16,6 +16,12 @@ class Hotel(models.Model):
     address = models.CharField(max_length=255, blank=True)
     rating = models.FloatField(default=0)
     photos = models.ImageField(upload_to="hotels/", blank=True, null=True)
+    photos_variants = models.JSONField(default=dict, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-rating"], name="hotel_rating_idx"),
+        ]
 
     def __str__(self):
         return self.name
@@ -46,8 +52,21 @@ class Room(models.Model):
         "Amenity", blank=True, related_name="rooms"
     )
     photos = models.ImageField(upload_to="rooms/", blank=True, null=True)
+    photos_variants = models.JSONField(default=dict, editable=False)
     max_guests = models.PositiveIntegerField(default=1)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["hotel", "is_available", "max_guests", "price"],
+                name="room_hotel_avail_guests_idx",
+            ),
+            models.Index(
+                fields=["hotel", "price"],
+                name="room_hotel_price_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.hotel.name} - {self.number}"
 
@@ -1,224 +1,360 @@
-from rest_framework import serializers
-
-from hotels.models import Hotel, Room, Location, RoomType, Amenity
-
-
-class LocationSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Location
-        fields = ["id", "country", "city"]
-
-
-class AmenitySerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Amenity
-        fields = ["id", "name", "description"]
-
-
-class RoomTypeSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = RoomType
-        fields = [
-            "id",
-            "name",
-            "description",
-            "max_guests",
-            "size",
-            "bed_count",
-        ]
-
-
-class RoomSerializer(serializers.ModelSerializer):
-    room_type = RoomTypeSerializer(read_only=True)
-    amenities = AmenitySerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Room
-        fields = [
-            "id",
-            "number",
-            "room_type",
-            "price",
-            "is_available",
-            "max_guests",
-            "amenities",
-            "photos",
-        ]
-
-
-class RoomShortSerializer(serializers.ModelSerializer):
-    room_type_name = serializers.CharField(
-        source="room_type.name", read_only=True
-    )
-
-    class Meta:
-        model = Room
-        fields = [
-            "id",
-            "number",
-            "room_type_name",
-            "price",
-            "photos",
-            "max_guests",
-        ]
-
-
-class HotelListSerializer(serializers.ModelSerializer):
-    location = LocationSerializer(read_only=True)
-    rooms_count = serializers.SerializerMethodField()
-    min_price = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Hotel
-        fields = [
-            "id",
-            "name",
-            "description",
-            "location",
-            "address",
-            "rating",
-            "photos",
-            "rooms_count",
-            "min_price",
-        ]
-
-    def get_rooms_count(self, obj):
-        return obj.rooms.filter(is_available=True).count()
-
-    def get_min_price(self, obj):
-        min_price = (
-            obj.rooms.filter(is_available=True).order_by("price").first()
-        )
-        return min_price.price if min_price else None
-
-
-class HotelCreateUpdateSerializer(serializers.ModelSerializer):
-    location_data = serializers.DictField(write_only=True, required=False)
-
-    class Meta:
-        model = Hotel
-        fields = [
-            "id",
-            "name",
-            "description",
-            "location",
-            "address",
-            "photos",
-            "location_data",
-        ]
-        read_only_fields = ["id", "rating"]
-
-    def create(self, validated_data):
-        location_data = validated_data.pop("location_data", None)
-
-        if location_data:
-            location, created = Location.objects.get_or_create(
-                country=location_data["country"], city=location_data["city"]
-            )
-            validated_data["location"] = location
-
-        return super().create(validated_data)
-
-    def update(self, instance, validated_data):
-        location_data = validated_data.pop("location_data", None)
-
-        if location_data:
-            location, created = Location.objects.get_or_create(
-                country=location_data["country"], city=location_data["city"]
-            )
-            validated_data["location"] = location
-
-        return super().update(instance, validated_data)
-
-
-class HotelDetailSerializer(serializers.ModelSerializer):
-    location = LocationSerializer(read_only=True)
-    rooms = RoomShortSerializer(many=True, read_only=True)
-    owner_name = serializers.CharField(source="owner.username", read_only=True)
-    reviews_count = serializers.SerializerMethodField()
-
-    class Meta:
-        model = Hotel
-        fields = [
-            "id",
-            "name",
-            "description",
-            "location",
-            "address",
-            "rating",
-            "photos",
-            "rooms",
-            "owner_name",
-            "reviews_count",
-        ]
-
-    def get_reviews_count(self, obj):
-        return obj.reviews.count()
-
-
-class RoomCreateUpdateSerializer(serializers.ModelSerializer):
-    room_type_id = serializers.IntegerField(write_only=True, required=False)
-    amenities_ids = serializers.ListField(
-        child=serializers.IntegerField(), write_only=True, required=False
-    )
-    amenities = AmenitySerializer(many=True, read_only=True)
-
-    class Meta:
-        model = Room
-        fields = [
-            "id",
-            "number",
-            "room_type",
-            "room_type_id",
-            "price",
-            "is_available",
-            "max_guests",
-            "amenities",
-            "amenities_ids",
-            "photos",
-        ]
-        read_only_fields = ["id", "hotel", "room_type"]
-
-    def create(self, validated_data):
-        room_type_id = validated_data.pop("room_type_id", None)
-        amenities_ids = validated_data.pop("amenities_ids", [])
-
-        if room_type_id:
-            try:
-                room_type = RoomType.objects.get(id=room_type_id)
-                validated_data["room_type"] = room_type
-            except RoomType.DoesNotExist:
-                raise serializers.ValidationError("Invalid room type ID")
-
-        room = super().create(validated_data)
-
-        if amenities_ids:
-            amenities = Amenity.objects.filter(id__in=amenities_ids)
-            room.amenities.set(amenities)
-
-        return room
-
-    def update(self, instance, validated_data):
-        room_type_id = validated_data.pop("room_type_id", None)
-        amenities_ids = validated_data.pop("amenities_ids", None)
-
-        if room_type_id:
-            try:
-                room_type = RoomType.objects.get(id=room_type_id)
-                validated_data["room_type"] = room_type
-            except RoomType.DoesNotExist:
-                raise serializers.ValidationError("Invalid room type ID")
-
-        room = super().update(instance, validated_data)
-
-        if amenities_ids is not None:
-            amenities = Amenity.objects.filter(id__in=amenities_ids)
-            room.amenities.set(amenities)
-
-        return room
-
-
-class HotelSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Hotel
-        fields = ["id", "name", "location", "owner"]
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from booking_clone.serializers import DynamicFieldsMixin, ValuesSerializer
+from hotels.models import Hotel, Room, Location, RoomType, Amenity
+from images.serializers import GalleryPhotoSerializer, ImageVariantsField
+
+HOTEL_DETAIL_ROOMS_LIMIT = 20
+AVAILABILITY_LIMIT = 50
+
+
+class LocationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Location
+        fields = ["id", "country", "city"]
+
+
+class AmenitySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Amenity
+        fields = ["id", "name", "description"]
+
+
+class RoomTypeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RoomType
+        fields = [
+            "id",
+            "name",
+            "description",
+            "max_guests",
+            "size",
+            "bed_count",
+        ]
+
+
+class RoomSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    room_type = RoomTypeSerializer(read_only=True)
+    amenities = AmenitySerializer(many=True, read_only=True)
+    photos_variants = ImageVariantsField()
+
+    class Meta:
+        model = Room
+        fields = [
+            "id",
+            "number",
+            "room_type",
+            "price",
+            "is_available",
+            "max_guests",
+            "amenities",
+            "photos",
+            "photos_variants",
+        ]
+
+
+class RoomShortSerializer(serializers.ModelSerializer):
+    room_type_name = serializers.CharField(
+        source="room_type.name", read_only=True
+    )
+    photos_variants = ImageVariantsField()
+
+    class Meta:
+        model = Room
+        fields = [
+            "id",
+            "number",
+            "room_type_name",
+            "price",
+            "photos",
+            "photos_variants",
+            "max_guests",
+        ]
+
+
+class HotelListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    location = LocationSerializer(read_only=True)
+    rooms_count = serializers.SerializerMethodField()
+    min_price = serializers.SerializerMethodField()
+    photos_variants = ImageVariantsField()
+
+    class Meta:
+        model = Hotel
+        fields = [
+            "id",
+            "name",
+            "description",
+            "location",
+            "address",
+            "rating",
+            "photos",
+            "photos_variants",
+            "rooms_count",
+            "min_price",
+        ]
+        field_dependencies = {
+            "rooms_count": ["available_rooms_count"],
+            "min_price": ["min_available_price"],
+        }
+
+    def get_rooms_count(self, obj):
+        if hasattr(obj, "available_rooms_count"):
+            return obj.available_rooms_count
+        return obj.rooms.filter(is_available=True).count()
+
+    def get_min_price(self, obj):
+        if hasattr(obj, "min_available_price"):
+            return obj.min_available_price
+        min_price = (
+            obj.rooms.filter(is_available=True).order_by("price").first()
+        )
+        return min_price.price if min_price else None
+
+
+class HotelListValuesSerializer(ValuesSerializer):
+    serializer_class = HotelListSerializer
+    method_fields = {
+        "rooms_count": (
+            ["available_rooms_count"],
+            lambda row: row["available_rooms_count"],
+        ),
+        "min_price": (
+            ["min_available_price"],
+            lambda row: row["min_available_price"],
+        ),
+    }
+
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    """Validates the query params of the room availability search."""
+
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+    guests = serializers.IntegerField(min_value=1, default=1)
+    city = serializers.CharField(required=False)
+    country = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        if attrs["check_out"] <= attrs["check_in"]:
+            raise serializers.ValidationError(
+                {"check_out": "Check-out must be after check-in."}
+            )
+        return attrs
+
+
+class AvailableRoomSerializer(serializers.ModelSerializer):
+    hotel = serializers.IntegerField(source="hotel_id")
+    hotel_name = serializers.CharField(source="hotel.name")
+    city = serializers.CharField(source="hotel.location.city")
+    country = serializers.CharField(source="hotel.location.country")
+    room_type = serializers.CharField(source="room_type.name", allow_null=True)
+
+    class Meta:
+        model = Room
+        fields = [
+            "id",
+            "hotel",
+            "hotel_name",
+            "city",
+            "country",
+            "number",
+            "room_type",
+            "price",
+            "max_guests",
+        ]
+
+
+class AvailableRoomValuesSerializer(ValuesSerializer):
+    serializer_class = AvailableRoomSerializer
+
+
+class HotelCreateUpdateSerializer(serializers.ModelSerializer):
+    location_data = serializers.DictField(write_only=True, required=False)
+
+    class Meta:
+        model = Hotel
+        fields = [
+            "id",
+            "name",
+            "description",
+            "location",
+            "address",
+            "photos",
+            "location_data",
+        ]
+        read_only_fields = ["id", "rating"]
+
+    def create(self, validated_data):
+        location_data = validated_data.pop("location_data", None)
+
+        if location_data:
+            location, created = Location.objects.get_or_create(
+                country=location_data["country"], city=location_data["city"]
+            )
+            validated_data["location"] = location
+
+        return super().create(validated_data)
+
+    def update(self, instance, validated_data):
+        location_data = validated_data.pop("location_data", None)
+
+        if location_data:
+            location, created = Location.objects.get_or_create(
+                country=location_data["country"], city=location_data["city"]
+            )
+            validated_data["location"] = location
+
+        return super().update(instance, validated_data)
+
+
+def gallery_data(obj, context):
+    photos = getattr(obj, "gallery_photos", None)
+    if photos is None:
+        photos = obj.gallery.all()
+    return GalleryPhotoSerializer(photos, many=True, context=context).data
+
+
+class HotelRoomSerializer(RoomShortSerializer):
+    gallery = serializers.SerializerMethodField()
+
+    class Meta(RoomShortSerializer.Meta):
+        fields = RoomShortSerializer.Meta.fields + ["gallery"]
+
+    @extend_schema_field(GalleryPhotoSerializer(many=True))
+    def get_gallery(self, obj):
+        return gallery_data(obj, self.context)
+
+
+class HotelDetailSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    location = LocationSerializer(read_only=True)
+    rooms = serializers.SerializerMethodField()
+    rooms_total = serializers.SerializerMethodField()
+    rooms_url = serializers.SerializerMethodField()
+    owner_name = serializers.CharField(source="owner.username", read_only=True)
+    reviews_count = serializers.SerializerMethodField()
+    photos_variants = ImageVariantsField()
+    gallery = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Hotel
+        fields = [
+            "id",
+            "name",
+            "description",
+            "location",
+            "address",
+            "rating",
+            "photos",
+            "photos_variants",
+            "gallery",
+            "rooms",
+            "rooms_total",
+            "rooms_url",
+            "owner_name",
+            "reviews_count",
+        ]
+        field_dependencies = {
+            "rooms": ["first_rooms"],
+            "rooms_total": ["rooms_total"],
+            "rooms_url": [],
+            "reviews_count": [],
+            "gallery": [],
+        }
+
+    @extend_schema_field(GalleryPhotoSerializer(many=True))
+    def get_gallery(self, obj):
+        return gallery_data(obj, self.context)
+
+    @extend_schema_field(HotelRoomSerializer(many=True))
+    def get_rooms(self, obj):
+        rooms = getattr(obj, "first_rooms", None)
+        if rooms is None:
+            rooms = obj.rooms.select_related("room_type").order_by(
+                "price", "id"
+            )[:HOTEL_DETAIL_ROOMS_LIMIT]
+        return HotelRoomSerializer(rooms, many=True, context=self.context).data
+
+    def get_rooms_total(self, obj):
+        if hasattr(obj, "rooms_total"):
+            return obj.rooms_total
+        return obj.rooms.count()
+
+    def get_rooms_url(self, obj):
+        return reverse(
+            "hotels:hotel-rooms",
+            args=[obj.pk],
+            request=self.context.get("request"),
+        )
+
+    def get_reviews_count(self, obj):
+        return obj.reviews.count()
+
+
+class RoomCreateUpdateSerializer(serializers.ModelSerializer):
+    room_type_id = serializers.IntegerField(write_only=True, required=False)
+    amenities_ids = serializers.ListField(
+        child=serializers.IntegerField(), write_only=True, required=False
+    )
+    amenities = AmenitySerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Room
+        fields = [
+            "id",
+            "number",
+            "room_type",
+            "room_type_id",
+            "price",
+            "is_available",
+            "max_guests",
+            "amenities",
+            "amenities_ids",
+            "photos",
+        ]
+        read_only_fields = ["id", "hotel", "room_type"]
+
+    def create(self, validated_data):
+        room_type_id = validated_data.pop("room_type_id", None)
+        amenities_ids = validated_data.pop("amenities_ids", [])
+
+        if room_type_id:
+            try:
+                room_type = RoomType.objects.get(id=room_type_id)
+                validated_data["room_type"] = room_type
+            except RoomType.DoesNotExist:
+                raise serializers.ValidationError("Invalid room type ID")
+
+        room = super().create(validated_data)
+
+        if amenities_ids:
+            amenities = Amenity.objects.filter(id__in=amenities_ids)
+            room.amenities.set(amenities)
+
+        return room
+
+    def update(self, instance, validated_data):
+        room_type_id = validated_data.pop("room_type_id", None)
+        amenities_ids = validated_data.pop("amenities_ids", None)
+
+        if room_type_id:
+            try:
+                room_type = RoomType.objects.get(id=room_type_id)
+                validated_data["room_type"] = room_type
+            except RoomType.DoesNotExist:
+                raise serializers.ValidationError("Invalid room type ID")
+
+        room = super().update(instance, validated_data)
+
+        if amenities_ids is not None:
+            amenities = Amenity.objects.filter(id__in=amenities_ids)
+            room.amenities.set(amenities)
+
+        return room
+
+
+class HotelSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Hotel
+        fields = ["id", "name", "location", "owner"]
@@ -1,36 +1,299 @@
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
-from rest_framework.test import APIClient
-
-from hotels.models import Location
-
-
-class HotelViewSimpleTest(TestCase):
-    def setUp(self):
-        self.owner = get_user_model().objects.create_user(
-            username="owneruser", password="pass", role="owner"
-        )
-        self.location = Location.objects.create(country="UA", city="Kyiv")
-        self.client = APIClient()
-    
-    def test_hotel_create_authenticated(self):
-        self.client.force_authenticate(user=self.owner)
-        url = reverse("hotels:hotel-list")
-        data = {
-            "name": "Test Hotel",
-            "location": self.location.id,
-        }
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data["name"], "Test Hotel")
-        self.assertEqual(response.data["location"], self.location.id)
-    
-    def test_hotel_create_unauthenticated(self):
-        url = reverse("hotels:hotel-list")
-        data = {
-            "name": "Test Hotel",
-            "location": self.location.id,
-        }
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 401)
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from booking_clone.queries import assert_no_repeated_queries
+from bookings.models import Booking
+from hotels.models import Amenity, Hotel, Location, Room, RoomType
+
+
+class HotelViewSimpleTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.client = APIClient()
+
+    def test_hotel_create_authenticated(self):
+        self.client.force_authenticate(user=self.owner)
+        url = reverse("hotels:hotel-list")
+        data = {
+            "name": "Test Hotel",
+            "location": self.location.id,
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["name"], "Test Hotel")
+        self.assertEqual(response.data["location"], self.location.id)
+
+    def test_hotel_create_unauthenticated(self):
+        url = reverse("hotels:hotel-list")
+        data = {
+            "name": "Test Hotel",
+            "location": self.location.id,
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 401)
+
+
+class HotelSearchFilterTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.small_type = RoomType.objects.create(
+            name="Single", max_guests=1, size=12, bed_count=1
+        )
+        self.family_type = RoomType.objects.create(
+            name="Family", max_guests=4, size=30, bed_count=2
+        )
+        self.small_hotel = Hotel.objects.create(
+            name="Small Hotel", location=self.location, owner=self.owner
+        )
+        self.family_hotel = Hotel.objects.create(
+            name="Family Hotel", location=self.location, owner=self.owner
+        )
+        Room.objects.create(
+            hotel=self.small_hotel,
+            number="1",
+            room_type=self.small_type,
+            price=50,
+            max_guests=1,
+        )
+        for number in ["1", "2"]:
+            Room.objects.create(
+                hotel=self.family_hotel,
+                number=number,
+                room_type=self.family_type,
+                price=150,
+                max_guests=4,
+            )
+        Room.objects.create(
+            hotel=self.small_hotel,
+            number="2",
+            room_type=self.family_type,
+            price=120,
+            max_guests=4,
+            is_available=False,
+        )
+        self.client = APIClient()
+
+    def get_hotel_names(self, params):
+        response = self.client.get(reverse("hotels:hotel-list"), params)
+        self.assertEqual(response.status_code, 200)
+        return [hotel["name"] for hotel in response.data["results"]]
+
+    def test_filter_by_guests(self):
+        names = self.get_hotel_names({"guests": 3})
+        self.assertEqual(names, ["Family Hotel"])
+
+    def test_filter_by_room_type_and_bed_count(self):
+        names = self.get_hotel_names({"room_type": self.family_type.id})
+        self.assertEqual(names, ["Family Hotel"])
+        names = self.get_hotel_names({"bed_count": 1})
+        self.assertCountEqual(names, ["Small Hotel", "Family Hotel"])
+
+    def test_guests_and_price_match_the_same_room(self):
+        names = self.get_hotel_names({"guests": 2, "max_price": 100})
+        self.assertEqual(names, [])
+        names = self.get_hotel_names({"guests": 2, "max_price": 200})
+        self.assertEqual(names, ["Family Hotel"])
+
+    def test_availability_excludes_booked_rooms(self):
+        guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        Booking.objects.create(
+            user=guest,
+            room=Room.objects.get(hotel=self.family_hotel, number="1"),
+            check_in=date(2030, 1, 10),
+            check_out=date(2030, 1, 12),
+            status="CONFIRMED",
+        )
+        url = reverse("hotels:availability")
+
+        response = self.client.get(
+            url,
+            {"check_in": "2030-01-11", "check_out": "2030-01-13", "guests": 3},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(room["hotel_name"], room["number"]) for room in response.data],
+            [("Family Hotel", "2")],
+        )
+        self.assertEqual(response.data[0]["price"], "150.00")
+
+        response = self.client.get(
+            url, {"check_in": "2030-01-12", "check_out": "2030-01-13"}
+        )
+        self.assertEqual(
+            [room["number"] for room in response.data], ["1", "1", "2"]
+        )
+
+        response = self.client.get(
+            url, {"check_in": "2030-01-13", "check_out": "2030-01-12"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class HotelRoomsActionTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.hotel = Hotel.objects.create(name="Big Hotel", owner=self.owner)
+        self.room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        amenity = Amenity.objects.create(name="WiFi")
+        for number in range(1, 16):
+            room = Room.objects.create(
+                hotel=self.hotel,
+                number=str(number),
+                room_type=self.room_type,
+                price=100 + number,
+                is_available=number % 5 != 0,
+            )
+            room.amenities.add(amenity)
+        self.client = APIClient()
+        self.url = reverse("hotels:hotel-rooms", args=[self.hotel.id])
+
+    def test_rooms_are_paginated_with_constant_queries(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 15)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertEqual(response.data["results"][0]["number"], "1")
+        self.assertEqual(
+            response.data["results"][0]["amenities"][0]["name"], "WiFi"
+        )
+
+    def test_rooms_filtering_and_ordering(self):
+        response = self.client.get(
+            self.url,
+            {"is_available": "false", "ordering": "-price"},
+        )
+        numbers = [room["number"] for room in response.data["results"]]
+        self.assertEqual(numbers, ["15", "10", "5"])
+        response = self.client.get(self.url, {"max_price": 103})
+        self.assertEqual(response.data["count"], 3)
+
+    def test_invalid_ordering_falls_back_to_price(self):
+        response = self.client.get(self.url, {"ordering": "--price"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["number"], "1")
+
+
+class HotelDetailQueryTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.hotel = Hotel.objects.create(name="Big Hotel", owner=self.owner)
+        Room.objects.bulk_create(
+            Room(hotel=self.hotel, number=str(number), price=100 + number)
+            for number in range(25)
+        )
+        self.client = APIClient()
+        self.url = reverse("hotels:hotel-detail", args=[self.hotel.id])
+
+    def test_retrieve_caps_nested_rooms(self):
+        # Hotel, first rooms, reviews count and all of their galleries.
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["rooms"]), 20)
+        self.assertEqual(response.data["rooms"][0]["number"], "0")
+        self.assertEqual(response.data["rooms_total"], 25)
+        self.assertTrue(
+            response.data["rooms_url"].endswith(
+                reverse("hotels:hotel-rooms", args=[self.hotel.id])
+            )
+        )
+
+    def test_partial_update_does_not_load_rooms(self):
+        self.client.force_authenticate(user=self.owner)
+        with self.assertNumQueries(3):
+            response = self.client.patch(self.url, {"name": "Renamed"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["name"], "Renamed")
+
+
+class HotelQueryPatternTest(TestCase):
+    """Every hotel endpoint runs the same number of queries per page."""
+
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        amenities = [
+            Amenity.objects.create(name=f"Amenity {index}")
+            for index in range(5)
+        ]
+        for index in range(5):
+            location = Location.objects.create(
+                country="UA", city=f"City {index}"
+            )
+            hotel = Hotel.objects.create(
+                name=f"Hotel {index}", location=location, owner=self.owner
+            )
+            for number in range(5):
+                room = Room.objects.create(
+                    hotel=hotel,
+                    number=str(number),
+                    room_type=room_type,
+                    price=100 + number,
+                    max_guests=2,
+                )
+                room.amenities.set(amenities)
+        self.hotel = hotel
+        self.room = room
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def test_read_endpoints(self):
+        urls = [
+            reverse("hotels:hotel-list"),
+            reverse("hotels:hotel-list") + "?guests=2&max_price=150",
+            reverse("hotels:hotel-detail", args=[self.hotel.id]),
+            reverse("hotels:hotel-rooms", args=[self.hotel.id]),
+            reverse("hotels:hotel-analytics", args=[self.hotel.id]),
+            reverse("hotels:availability")
+            + "?check_in=2030-01-10&check_out=2030-01-12",
+            reverse("hotels:rooms-list"),
+            reverse("hotels:rooms-detail", args=[self.room.id]),
+            reverse("hotels:locations-list"),
+            reverse("hotels:roomtype-list"),
+            reverse("hotels:amenity-list"),
+        ]
+        for url in urls:
+            with self.subTest(url=url), assert_no_repeated_queries():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+    def test_write_endpoints(self):
+        with assert_no_repeated_queries():
+            response = self.client.patch(
+                reverse("hotels:hotel-detail", args=[self.hotel.id]),
+                {"rating": 4.5},
+            )
+            self.assertEqual(response.status_code, 200)
+            response = self.client.post(
+                reverse("hotels:hotel-add-room", args=[self.hotel.id]),
+                {"number": "99", "price": 120, "max_guests": 2},
+            )
+            self.assertEqual(response.status_code, 201)
+            response = self.client.patch(
+                reverse("hotels:rooms-detail", args=[self.room.id]),
+                {"price": 130},
+            )
+            self.assertEqual(response.status_code, 200)
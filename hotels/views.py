@@ -1,374 +1,668 @@
-from django.db.models import Q
-from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework import viewsets, permissions, status, filters, serializers
-from rest_framework.decorators import action
-from rest_framework.response import Response
-
-from hotels.models import Hotel, Room, Location, RoomType, Amenity
-from hotels.permissions import IsOwnerOrReadOnly
-from hotels.serializers import (
-    HotelListSerializer,
-    HotelDetailSerializer,
-    HotelCreateUpdateSerializer,
-    RoomSerializer,
-    RoomCreateUpdateSerializer,
-    LocationSerializer,
-    RoomTypeSerializer,
-    AmenitySerializer,
-)
-
-
-@extend_schema(
-    tags=["Hotels"],
-    summary="API for hotel management.",
-    description="""
-    API for creating, viewing, updating, and deleting hotels.
-    - Only authenticated users can create hotels. Only owners can edit or
-      delete their hotels.
-    - Supports filtering by city, country, rating, price.
-    - Supports search by name, description, address.
-    - Supports ordering by rating and name.
-    - Custom actions: list rooms for a hotel, add a room, list owner's hotels.
-    """,
-)
-class HotelViewSet(viewsets.ModelViewSet):
-    queryset = Hotel.objects.all()
-    permission_classes = [IsOwnerOrReadOnly]
-    filter_backends = [
-        DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
-    filterset_fields = ["location__city", "location__country"]
-    search_fields = ["name", "description", "address"]
-    ordering_fields = ["rating", "name"]
-    ordering = ["-rating"]
-
-    def get_serializer_class(self):
-        if self.action in ["list"]:
-            return HotelListSerializer
-        elif self.action in ["retrieve"]:
-            return HotelDetailSerializer
-        else:
-            return HotelCreateUpdateSerializer
-
-    def get_queryset(self):
-        queryset = Hotel.objects.select_related(
-            "location", "owner"
-        ).prefetch_related("rooms")
-
-        min_rating = self.request.query_params.get("min_rating")
-        if min_rating:
-            try:
-                min_rating = float(min_rating)
-                queryset = queryset.filter(rating__gte=min_rating)
-            except ValueError:
-                pass
-
-        min_price = self.request.query_params.get("min_price")
-        max_price = self.request.query_params.get("max_price")
-
-        if min_price or max_price:
-            price_filter = Q()
-            if min_price:
-                try:
-                    price_filter &= Q(rooms__price__gte=float(min_price))
-                except ValueError:
-                    pass
-            if max_price:
-                try:
-                    price_filter &= Q(rooms__price__lte=float(max_price))
-                except ValueError:
-                    pass
-
-            if price_filter:
-                queryset = queryset.filter(price_filter).distinct()
-
-        return queryset
-
-    def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
-    
-    @extend_schema(
-        summary="List hotels",
-        description="""
-        Returns a list of hotels with filtering, search, and ordering.
-        """,
-        parameters=[
-            OpenApiParameter(
-                "location__city", type=str, description="City name"
-            ),
-            OpenApiParameter(
-                "location__country", type=str, description="Country name"
-            ),
-            OpenApiParameter(
-                "min_rating", type=float, description="Minimum rating"
-            ),
-            OpenApiParameter(
-                "min_price", type=float, description="Minimum room price"
-            ),
-            OpenApiParameter(
-                "max_price", type=float, description="Maximum room price"
-            ),
-            OpenApiParameter(
-                "search",
-                type=str,
-                description="Search by name, description, address",
-            ),
-            OpenApiParameter(
-                "ordering", type=str, description="Order by rating or name"
-            ),
-        ],
-    )
-    def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Retrieve hotel",
-        description="Returns detailed information about a hotel.",
-    )
-    def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Create hotel",
-        description="Create a new hotel. Only authenticated users can create.",
-    )
-    def create(self, request, *args, **kwargs):
-        return super().create(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Update hotel",
-        description="Update hotel data (only owner).",
-    )
-    def update(self, request, *args, **kwargs):
-        return super().update(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Partially update hotel",
-        description="Partially update hotel data (only owner).",
-    )
-    def partial_update(self, request, *args, **kwargs):
-        return super().partial_update(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Delete hotel",
-        description="Delete a hotel (only owner).",
-    )
-    def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
-
-    @action(detail=True, methods=["get"])
-    @extend_schema(
-        summary="List rooms for hotel",
-        description="Returns a list of rooms for the specified hotel.",
-        tags=["Rooms"],
-    )
-    def rooms(self, request, pk=None):
-        hotel = self.get_object()
-        rooms = hotel.rooms.all()
-        serializer = RoomSerializer(rooms, many=True)
-        return Response(serializer.data)
-
-    @action(
-        detail=True,
-        methods=["post"],
-        permission_classes=[permissions.IsAuthenticated],
-        url_path="add-room",
-    )
-    @extend_schema(
-        summary="Add room to hotel",
-        description="Add a new room to the specified hotel (only owner).",
-        tags=["Rooms"],
-    )
-    def add_room(self, request, pk=None):
-        hotel = self.get_object()
-
-        if hotel.owner != request.user:
-            return Response(
-                {"detail": "You dont have permission to add rooms."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-
-        serializer = RoomCreateUpdateSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save(hotel=hotel)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
-    @action(detail=False, methods=["get"], url_path="my-hotels")
-    @extend_schema(
-        summary="List hotels for current owner",
-        description="Returns a list of hotels owned by the current user.",
-    )
-    def my_hotels(self, request):
-        if not request.user.is_authenticated:
-            return Response(
-                {"detail": "Authentication required."},
-                status=status.HTTP_401_UNAUTHORIZED,
-            )
-
-        if request.user.role != "owner":
-            return Response(
-                {"detail": "Only hotel owners can view their hotels."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        hotels = Hotel.objects.filter(owner=request.user)
-        serializer = HotelListSerializer(hotels, many=True)
-        return Response(serializer.data)
-
-
-@extend_schema(
-    tags=["Rooms"],
-    summary="API for hotel room management.",
-    description="""
-    API for creating, viewing, updating, and deleting hotel rooms.
-    - Only authenticated users can create rooms. Only hotel owners can edit
-      or delete their rooms.
-    - Supports filtering by hotel, room type, and availability.
-    - Supports ordering by price.
-    """,
-)
-class RoomViewSet(viewsets.ModelViewSet):
-    serializer_class = RoomSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ["hotel", "room_type", "is_available"]
-    ordering_fields = ["price"]
-    ordering = ["price"]
-
-    def get_queryset(self):
-        return Room.objects.select_related(
-            "hotel", "room_type"
-        ).prefetch_related("amenities")
-
-    def get_serializer_class(self):
-        if self.action in ["create", "update", "partial_update"]:
-            return RoomCreateUpdateSerializer
-        return RoomSerializer
-
-    def perform_create(self, serializer):
-        hotel_id = self.request.data.get("hotel_id")
-        if not hotel_id:
-            raise serializers.ValidationError(
-                {"hotel_id": "This field is required."}
-            )
-        try:
-            hotel = Hotel.objects.get(id=hotel_id, owner=self.request.user)
-        except Hotel.DoesNotExist:
-            raise serializers.ValidationError(
-                {"hotel_id": "Invalid hotel ID or you do not own this hotel."}
-            )
-        serializer.save(hotel=hotel)
-
-    def perform_update(self, serializer):
-        room = self.get_object()
-        if room.hotel.owner != self.request.user:
-            raise serializers.ValidationError(
-                {"detail": "You do not have permission to edit this room."}
-            )
-        serializer.save()
-
-    def perform_destroy(self, instance):
-        if instance.hotel.owner != self.request.user:
-            raise serializers.ValidationError(
-                {"detail": "You do not have permission to delete this room."}
-            )
-        instance.delete()
-    
-    @extend_schema(
-        summary="List rooms",
-        description="Returns a list of rooms with filtering and ordering.",
-        parameters=[
-            OpenApiParameter("hotel", type=int, description="Hotel ID"),
-            OpenApiParameter(
-                "room_type", type=int, description="Room type ID"
-            ),
-            OpenApiParameter(
-                "is_available", type=bool, description="Is available"
-            ),
-            OpenApiParameter(
-                "ordering", type=str, description="Order by price"
-            ),
-        ],
-    )
-    def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Retrieve room",
-        description="Returns detailed information about a room.",
-    )
-    def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Create room",
-        description="Create a new room. Only hotel owners can create rooms.",
-    )
-    def create(self, request, *args, **kwargs):
-        return super().create(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Update room",
-        description="Update room data (only hotel owner).",
-    )
-    def update(self, request, *args, **kwargs):
-        return super().update(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Partially update room",
-        description="Partially update room data (only hotel owner).",
-    )
-    def partial_update(self, request, *args, **kwargs):
-        return super().partial_update(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Delete room",
-        description="Delete a room (only hotel owner).",
-    )
-    def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
-
-
-@extend_schema(
-    tags=["Locations"],
-    summary="API for hotel locations.",
-    description="""
-    Read-only API for listing and searching hotel locations.
-    - Supports search by country and city.
-    """,
-)
-class LocationViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Location.objects.all()
-    serializer_class = LocationSerializer
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["country", "city"]
-
-
-@extend_schema(
-    tags=["Room Types"],
-    summary="API for hotel room types.",
-    description="""
-    Read-only API for listing hotel room types.
-    """,
-)
-class RoomTypeViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = RoomType.objects.all()
-    serializer_class = RoomTypeSerializer
-
-
-@extend_schema(
-    tags=["Amenities"],
-    summary="API for hotel amenities.",
-    description="""
-    Read-only API for listing and searching hotel amenities.
-    - Supports search by name.
-    """,
-)
-class AmenityViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Amenity.objects.all()
-    serializer_class = AmenitySerializer
-    filter_backends = [filters.SearchFilter]
-    search_fields = ["name"]
+from adrf.views import APIView
+from django.db.models import Count, Exists, Min, OuterRef, Prefetch, Q
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import viewsets, permissions, status, filters, serializers
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from analytics.rollups import hotel_report
+from analytics.serializers import (
+    AnalyticsQuerySerializer,
+    HotelAnalyticsSerializer,
+)
+from booking_clone.mixins import (
+    ReplicaReadMixin,
+    SparseFieldsetMixin,
+    ValuesListMixin,
+)
+from booking_clone.pagination import EstimatedCountPagination
+from bookings.models import Booking
+from hotels.models import Hotel, Room, Location, RoomType, Amenity
+from hotels.permissions import IsOwnerOrReadOnly
+from hotels.serializers import (
+    AVAILABILITY_LIMIT,
+    HOTEL_DETAIL_ROOMS_LIMIT,
+    AvailabilityQuerySerializer,
+    AvailableRoomSerializer,
+    AvailableRoomValuesSerializer,
+    HotelListSerializer,
+    HotelListValuesSerializer,
+    HotelDetailSerializer,
+    HotelCreateUpdateSerializer,
+    RoomSerializer,
+    RoomCreateUpdateSerializer,
+    LocationSerializer,
+    RoomTypeSerializer,
+    AmenitySerializer,
+)
+from images.photos import prefetch_galleries
+
+
+def parse_bool(value):
+    value = value.lower()
+    if value in ("true", "1"):
+        return True
+    if value in ("false", "0"):
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
+@extend_schema(
+    tags=["Hotels"],
+    summary="API for hotel management.",
+    description="""
+    API for creating, viewing, updating, and deleting hotels.
+    - Only authenticated users can create hotels. Only owners can edit or
+      delete their hotels.
+    - Supports filtering by city, country, rating, price, guests, room type
+      and bed count.
+    - Supports search by name, description, address.
+    - Supports ordering by rating and name.
+    - Custom actions: list rooms for a hotel, add a room, list owner's hotels,
+      revenue and occupancy analytics for owners.
+    """,
+)
+class HotelViewSet(
+    ReplicaReadMixin,
+    ValuesListMixin,
+    SparseFieldsetMixin,
+    viewsets.ModelViewSet,
+):
+    queryset = Hotel.objects.all()
+    # Registered at the root of hotels/, so the detail route must not
+    # match the rooms/, locations/... prefixes of the other viewsets.
+    lookup_value_regex = "[0-9]+"
+    values_serializer_class = HotelListValuesSerializer
+    pagination_class = EstimatedCountPagination
+    permission_classes = [IsOwnerOrReadOnly]
+    filter_backends = [
+        DjangoFilterBackend,
+        filters.SearchFilter,
+        filters.OrderingFilter,
+    ]
+    filterset_fields = ["location__city", "location__country"]
+    search_fields = ["name", "description", "address"]
+    ordering_fields = ["rating", "name"]
+    ordering = ["-rating"]
+    room_ordering_fields = ["price", "number", "max_guests"]
+
+    def get_serializer_class(self):
+        if self.action in ["list"]:
+            return HotelListSerializer
+        elif self.action in ["retrieve"]:
+            return HotelDetailSerializer
+        else:
+            return HotelCreateUpdateSerializer
+
+    def get_queryset(self):
+        if self.action in ["rooms", "add_room", "analytics"]:
+            return Hotel.objects.only("id", "owner")
+        if self.action in ["update", "partial_update", "destroy"]:
+            return Hotel.objects.all()
+        if self.action == "retrieve":
+            rooms = (
+                Room.objects.select_related("room_type")
+                .only(
+                    "id",
+                    "hotel",
+                    "number",
+                    "room_type__name",
+                    "price",
+                    "photos",
+                    "photos_variants",
+                    "max_guests",
+                )
+                .order_by("price", "id")
+            )
+            queryset = Hotel.objects.select_related(
+                "location", "owner"
+            ).prefetch_related(
+                Prefetch(
+                    "rooms",
+                    queryset=rooms[:HOTEL_DETAIL_ROOMS_LIMIT],
+                    to_attr="first_rooms",
+                )
+            )
+            if self.field_requested("rooms_total"):
+                queryset = queryset.annotate(rooms_total=Count("rooms"))
+            return queryset
+
+        queryset = self.annotate_room_stats(
+            Hotel.objects.select_related("location"),
+            [
+                name
+                for name in ["rooms_count", "min_price"]
+                if self.field_requested(name)
+            ],
+        )
+
+        min_rating = self.request.query_params.get("min_rating")
+        if min_rating:
+            try:
+                min_rating = float(min_rating)
+                queryset = queryset.filter(rating__gte=min_rating)
+            except ValueError:
+                pass
+
+        room_filter = self.get_room_filter()
+        if room_filter:
+            queryset = queryset.filter(
+                Exists(Room.objects.filter(room_filter, hotel=OuterRef("pk")))
+            )
+
+        return queryset
+
+    def annotate_room_stats(self, queryset, fields):
+        available = Q(rooms__is_available=True)
+        if "rooms_count" in fields:
+            queryset = queryset.annotate(
+                available_rooms_count=Count("rooms", filter=available)
+            )
+        if "min_price" in fields:
+            queryset = queryset.annotate(
+                min_available_price=Min("rooms__price", filter=available)
+            )
+        return queryset
+
+    def get_room_filter(self):
+        """
+        Build the room conditions of the hotel search. All of them are
+        checked against the same available room inside a single EXISTS
+        subquery, so hotel rows are never multiplied by a join.
+        """
+        room_filter = self.build_query_filter(
+            [
+                ("min_price", "price__gte", float),
+                ("max_price", "price__lte", float),
+                ("guests", "max_guests__gte", int),
+                ("room_type", "room_type", int),
+                ("bed_count", "room_type__bed_count__gte", int),
+            ]
+        )
+        if room_filter:
+            room_filter &= Q(is_available=True)
+        return room_filter
+
+    def filter_rooms(self, queryset):
+        queryset = queryset.filter(
+            self.build_query_filter(
+                [
+                    ("is_available", "is_available", parse_bool),
+                    ("room_type", "room_type", int),
+                    ("min_price", "price__gte", float),
+                    ("max_price", "price__lte", float),
+                ]
+            )
+        )
+        ordering = self.request.query_params.get("ordering", "price")
+        if ordering.removeprefix("-") not in self.room_ordering_fields:
+            ordering = "price"
+        return queryset.order_by(ordering, "id")
+
+    def build_query_filter(self, lookups):
+        query_filter = Q()
+        for param, lookup, cast in lookups:
+            value = self.request.query_params.get(param)
+            if value:
+                try:
+                    query_filter &= Q(**{lookup: cast(value)})
+                except ValueError:
+                    pass
+        return query_filter
+
+    def perform_create(self, serializer):
+        serializer.save(owner=self.request.user)
+    
+    @extend_schema(
+        summary="List hotels",
+        description="""
+        Returns a list of hotels with filtering, search, and ordering.
+        """,
+        parameters=[
+            OpenApiParameter(
+                "location__city", type=str, description="City name"
+            ),
+            OpenApiParameter(
+                "location__country", type=str, description="Country name"
+            ),
+            OpenApiParameter(
+                "min_rating", type=float, description="Minimum rating"
+            ),
+            OpenApiParameter(
+                "min_price", type=float, description="Minimum room price"
+            ),
+            OpenApiParameter(
+                "max_price", type=float, description="Maximum room price"
+            ),
+            OpenApiParameter(
+                "guests",
+                type=int,
+                description="Number of guests an available room must fit",
+            ),
+            OpenApiParameter(
+                "room_type", type=int, description="Room type ID"
+            ),
+            OpenApiParameter(
+                "bed_count", type=int, description="Minimum number of beds"
+            ),
+            OpenApiParameter(
+                "search",
+                type=str,
+                description="Search by name, description, address",
+            ),
+            OpenApiParameter(
+                "ordering", type=str, description="Order by rating or name"
+            ),
+        ],
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Retrieve hotel",
+        description="""
+        Returns detailed information about a hotel, with the photo
+        galleries of the hotel and of its first rooms.
+        """,
+    )
+    def retrieve(self, request, *args, **kwargs):
+        hotel = self.get_object()
+        galleries = []
+        if self.field_requested("gallery"):
+            galleries.append(hotel)
+        if self.field_requested("rooms"):
+            galleries.extend(getattr(hotel, "first_rooms", []))
+        prefetch_galleries(galleries)
+        return Response(self.get_serializer(hotel).data)
+    
+    @extend_schema(
+        summary="Create hotel",
+        description="Create a new hotel. Only authenticated users can create.",
+    )
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Update hotel",
+        description="Update hotel data (only owner).",
+    )
+    def update(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Partially update hotel",
+        description="Partially update hotel data (only owner).",
+    )
+    def partial_update(self, request, *args, **kwargs):
+        return super().partial_update(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Delete hotel",
+        description="Delete a hotel (only owner).",
+    )
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+    @action(detail=True, methods=["get"])
+    @extend_schema(
+        summary="List rooms for hotel",
+        description="""
+        Returns a paginated list of rooms for the specified hotel with
+        filtering and ordering.
+        """,
+        tags=["Rooms"],
+        parameters=[
+            OpenApiParameter(
+                "is_available", type=bool, description="Is available"
+            ),
+            OpenApiParameter(
+                "room_type", type=int, description="Room type ID"
+            ),
+            OpenApiParameter(
+                "min_price", type=float, description="Minimum room price"
+            ),
+            OpenApiParameter(
+                "max_price", type=float, description="Maximum room price"
+            ),
+            OpenApiParameter(
+                "ordering",
+                type=str,
+                description="Order by price, number or max_guests",
+            ),
+        ],
+        responses={200: RoomSerializer(many=True)},
+    )
+    def rooms(self, request, pk=None):
+        hotel = self.get_object()
+        rooms = self.filter_rooms(
+            Room.objects.filter(hotel=hotel)
+            .select_related("room_type")
+            .prefetch_related("amenities")
+        )
+        context = self.get_serializer_context()
+
+        page = self.paginate_queryset(rooms)
+        if page is not None:
+            serializer = RoomSerializer(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = RoomSerializer(rooms, many=True, context=context)
+        return Response(serializer.data)
+
+    @action(
+        detail=True,
+        methods=["post"],
+        permission_classes=[permissions.IsAuthenticated],
+        url_path="add-room",
+    )
+    @extend_schema(
+        summary="Add room to hotel",
+        description="Add a new room to the specified hotel (only owner).",
+        tags=["Rooms"],
+    )
+    def add_room(self, request, pk=None):
+        hotel = self.get_object()
+
+        if hotel.owner_id != request.user.id:
+            return Response(
+                {"detail": "You dont have permission to add rooms."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = RoomCreateUpdateSerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save(hotel=hotel)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    @action(
+        detail=True,
+        methods=["get"],
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    @extend_schema(
+        summary="Hotel analytics",
+        description=(
+            "Occupancy rate, ADR and revenue of the hotel per day or month, "
+            "read from the daily rollups (only owner or staff)."
+        ),
+        parameters=[
+            OpenApiParameter(
+                "from", type=str, description="Start date (YYYY-MM-DD)"
+            ),
+            OpenApiParameter(
+                "to", type=str, description="End date (YYYY-MM-DD)"
+            ),
+            OpenApiParameter(
+                "granularity",
+                type=str,
+                enum=["day", "month"],
+                description="Group results by day (default) or month",
+            ),
+        ],
+        responses={200: HotelAnalyticsSerializer},
+    )
+    def analytics(self, request, pk=None):
+        hotel = self.get_object()
+
+        if hotel.owner_id != request.user.id and not request.user.is_staff:
+            return Response(
+                {"detail": "You dont have permission to view analytics."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        query = AnalyticsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        report = hotel_report(
+            hotel.id,
+            query.validated_data["from"],
+            query.validated_data["to"],
+            query.validated_data["granularity"],
+        )
+        return Response(HotelAnalyticsSerializer(report).data)
+
+    @action(detail=False, methods=["get"], url_path="my-hotels")
+    @extend_schema(
+        summary="List hotels for current owner",
+        description="Returns a list of hotels owned by the current user.",
+    )
+    def my_hotels(self, request):
+        if not request.user.is_authenticated:
+            return Response(
+                {"detail": "Authentication required."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        if request.user.role != "owner":
+            return Response(
+                {"detail": "Only hotel owners can view their hotels."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        hotels = self.annotate_room_stats(
+            Hotel.objects.select_related("location").filter(
+                owner_id=request.user.id
+            ),
+            ["rooms_count", "min_price"],
+        )
+        serializer = HotelListSerializer(hotels, many=True)
+        return Response(serializer.data)
+
+
+@extend_schema(tags=["Hotels"])
+class HotelAvailabilityView(ReplicaReadMixin, APIView):
+    permission_classes = [permissions.AllowAny]
+
+    @extend_schema(
+        summary="Search available rooms",
+        description="""
+        Returns up to 50 rooms, cheapest first, that are free for the whole
+        stay and fit the guests. Served by an async view, so slow searches do
+        not hold a worker thread under ASGI.
+        """,
+        parameters=[
+            OpenApiParameter(
+                "check_in",
+                type=str,
+                required=True,
+                description="Check-in date (YYYY-MM-DD)",
+            ),
+            OpenApiParameter(
+                "check_out",
+                type=str,
+                required=True,
+                description="Check-out date (YYYY-MM-DD)",
+            ),
+            OpenApiParameter("guests", type=int, description="Guests"),
+            OpenApiParameter("city", type=str, description="City"),
+            OpenApiParameter("country", type=str, description="Country"),
+        ],
+        responses={200: AvailableRoomSerializer(many=True)},
+    )
+    async def get(self, request, *args, **kwargs):
+        query = AvailabilityQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        rooms = Room.objects.filter(
+            is_available=True, max_guests__gte=params["guests"]
+        ).exclude(
+            Exists(
+                Booking.objects.overlapping(
+                    OuterRef("pk"), params["check_in"], params["check_out"]
+                )
+            )
+        )
+        if params.get("city"):
+            rooms = rooms.filter(hotel__location__city__iexact=params["city"])
+        if params.get("country"):
+            rooms = rooms.filter(
+                hotel__location__country__iexact=params["country"]
+            )
+
+        serializer = AvailableRoomValuesSerializer(
+            context={"request": request}
+        )
+        rows = serializer.values(rooms.order_by("price", "id"))
+        rows = [row async for row in rows[:AVAILABILITY_LIMIT]]
+        return Response(serializer.serialize(rows))
+
+
+@extend_schema(
+    tags=["Rooms"],
+    summary="API for hotel room management.",
+    description="""
+    API for creating, viewing, updating, and deleting hotel rooms.
+    - Only authenticated users can create rooms. Only hotel owners can edit
+      or delete their rooms.
+    - Supports filtering by hotel, room type, and availability.
+    - Supports ordering by price.
+    """,
+)
+class RoomViewSet(
+    ReplicaReadMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
+    serializer_class = RoomSerializer
+    pagination_class = EstimatedCountPagination
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ["hotel", "room_type", "is_available"]
+    ordering_fields = ["price"]
+    ordering = ["price"]
+
+    def get_queryset(self):
+        return Room.objects.select_related(
+            "hotel", "room_type"
+        ).prefetch_related("amenities")
+
+    def get_serializer_class(self):
+        if self.action in ["create", "update", "partial_update"]:
+            return RoomCreateUpdateSerializer
+        return RoomSerializer
+
+    def perform_create(self, serializer):
+        hotel_id = self.request.data.get("hotel_id")
+        if not hotel_id:
+            raise serializers.ValidationError(
+                {"hotel_id": "This field is required."}
+            )
+        try:
+            hotel = Hotel.objects.get(
+                id=hotel_id, owner_id=self.request.user.id
+            )
+        except Hotel.DoesNotExist:
+            raise serializers.ValidationError(
+                {"hotel_id": "Invalid hotel ID or you do not own this hotel."}
+            )
+        serializer.save(hotel=hotel)
+
+    def perform_update(self, serializer):
+        room = self.get_object()
+        if room.hotel.owner_id != self.request.user.id:
+            raise serializers.ValidationError(
+                {"detail": "You do not have permission to edit this room."}
+            )
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        if instance.hotel.owner_id != self.request.user.id:
+            raise serializers.ValidationError(
+                {"detail": "You do not have permission to delete this room."}
+            )
+        instance.delete()
+    
+    @extend_schema(
+        summary="List rooms",
+        description="Returns a list of rooms with filtering and ordering.",
+        parameters=[
+            OpenApiParameter("hotel", type=int, description="Hotel ID"),
+            OpenApiParameter(
+                "room_type", type=int, description="Room type ID"
+            ),
+            OpenApiParameter(
+                "is_available", type=bool, description="Is available"
+            ),
+            OpenApiParameter(
+                "ordering", type=str, description="Order by price"
+            ),
+        ],
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Retrieve room",
+        description="Returns detailed information about a room.",
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Create room",
+        description="Create a new room. Only hotel owners can create rooms.",
+    )
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Update room",
+        description="Update room data (only hotel owner).",
+    )
+    def update(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Partially update room",
+        description="Partially update room data (only hotel owner).",
+    )
+    def partial_update(self, request, *args, **kwargs):
+        return super().partial_update(request, *args, **kwargs)
+    
+    @extend_schema(
+        summary="Delete room",
+        description="Delete a room (only hotel owner).",
+    )
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+
+@extend_schema(
+    tags=["Locations"],
+    summary="API for hotel locations.",
+    description="""
+    Read-only API for listing and searching hotel locations.
+    - Supports search by country and city.
+    """,
+)
+class LocationViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Location.objects.all()
+    serializer_class = LocationSerializer
+    filter_backends = [filters.SearchFilter]
+    search_fields = ["country", "city"]
+
+
+@extend_schema(
+    tags=["Room Types"],
+    summary="API for hotel room types.",
+    description="""
+    Read-only API for listing hotel room types.
+    """,
+)
+class RoomTypeViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = RoomType.objects.all()
+    serializer_class = RoomTypeSerializer
+
+
+@extend_schema(
+    tags=["Amenities"],
+    summary="API for hotel amenities.",
+    description="""
+    Read-only API for listing and searching hotel amenities.
+    - Supports search by name.
+    """,
+)
+class AmenityViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = Amenity.objects.all()
+    serializer_class = AmenitySerializer
+    filter_backends = [filters.SearchFilter]
+    search_fields = ["name"]
@@ -0,0 +1,42 @@
+from django.contrib import admin
+
+from booking_clone.admin import LargeTableAdmin
+from images.models import ImageJob, Photo
+
+
+@admin.register(ImageJob)
+class ImageJobAdmin(LargeTableAdmin):
+    list_display = [
+        "id",
+        "model",
+        "object_id",
+        "field",
+        "source",
+        "status",
+        "attempts",
+        "created_at",
+    ]
+    list_filter = ["status", "model"]
+    search_fields = ["source"]
+    readonly_fields = ["claimed_at", "error"]
+
+
+@admin.register(Photo)
+class PhotoAdmin(LargeTableAdmin):
+    list_display = [
+        "id",
+        "hotel",
+        "room",
+        "review",
+        "position",
+        "content_hash",
+        "created_at",
+    ]
+    list_select_related = [
+        "hotel",
+        "room__hotel",
+        "review__hotel",
+        "review__user",
+    ]
+    raw_id_fields = ["hotel", "room", "review", "uploaded_by"]
+    search_fields = ["content_hash"]
@@ -0,0 +1,89 @@
+"""
+BlurHash encoder (https://blurha.sh): a ~30 character placeholder that
+clients decode into a blurred preview while the image loads.
+"""
+
+import math
+
+from PIL import Image
+
+BASE83 = (
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    "#$%*+,-.:;=?@[]^_{|}~"
+)
+SAMPLE_SIZE = 32
+
+SRGB_TO_LINEAR = [
+    value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+    for value in (channel / 255 for channel in range(256))
+]
+
+
+def base83(value, length):
+    return "".join(
+        BASE83[value // 83 ** (length - index - 1) % 83]
+        for index in range(length)
+    )
+
+
+def linear_to_srgb(value):
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def sign_pow(value, exponent):
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def encode(image, x_components=4, y_components=3):
+    """BlurHash of a Pillow image, computed on a small copy of it."""
+    image = image.convert("RGB")
+    image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BILINEAR)
+    width, height = image.size
+    pixels = [
+        (SRGB_TO_LINEAR[r], SRGB_TO_LINEAR[g], SRGB_TO_LINEAR[b])
+        for r, g, b in image.getdata()
+    ]
+
+    factors = []
+    for j in range(y_components):
+        cos_y = [math.cos(math.pi * j * y / height) for y in range(height)]
+        for i in range(x_components):
+            cos_x = [math.cos(math.pi * i * x / width) for x in range(width)]
+            red = green = blue = 0.0
+            for y in range(height):
+                row = y * width
+                for x in range(width):
+                    basis = cos_y[y] * cos_x[x]
+                    pixel = pixels[row + x]
+                    red += basis * pixel[0]
+                    green += basis * pixel[1]
+                    blue += basis * pixel[2]
+            scale = (1 if i == j == 0 else 2) / (width * height)
+            factors.append((red * scale, green * scale, blue * scale))
+
+    dc, ac = factors[0], factors[1:]
+    blurhash = base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        actual_max = max(abs(value) for factor in ac for value in factor)
+        quantised_max = max(0, min(82, math.floor(actual_max * 166 - 0.5)))
+        max_value = (quantised_max + 1) / 166
+    else:
+        quantised_max, max_value = 0, 1
+    blurhash += base83(quantised_max, 1)
+    red, green, blue = (linear_to_srgb(value) for value in dc)
+    blurhash += base83((red << 16) + (green << 8) + blue, 4)
+    for factor in ac:
+        red, green, blue = (
+            max(
+                0,
+                min(
+                    18, math.floor(sign_pow(value / max_value, 0.5) * 9 + 9.5)
+                ),
+            )
+            for value in factor
+        )
+        blurhash += base83(red * 19 * 19 + green * 19 + blue, 2)
+    return blurhash
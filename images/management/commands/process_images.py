@@ -0,0 +1,110 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from images.models import ImageJob
+from images.pipeline import claim_jobs, finish_job, run_job, variants_field
+from images.signals import IMAGE_FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the resized variants and placeholders of uploaded images "
+        "with a bounded pool of worker threads"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.IMAGE_WORKERS,
+            help="Images processed in parallel",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the queue every --interval seconds",
+        )
+        parser.add_argument("--interval", type=float, default=5)
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="First queue every image without variants",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        batch_size = options["batch_size"] or workers * 4
+        if options["backfill"]:
+            self.stdout.write(f"Queued {self.backfill()} images.")
+
+        # Pillow releases the GIL while resizing and encoding, so threads
+        # use every core without forking database connections.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                while True:
+                    # Drop a connection the database closed, or one past
+                    # CONN_MAX_AGE, as the request cycle does.
+                    close_old_connections()
+                    processed, failed = self.sweep(pool, batch_size)
+                    if processed or failed or not options["loop"]:
+                        self.stdout.write(
+                            f"Processed {processed} images, {failed} failed."
+                        )
+                    if not options["loop"]:
+                        break
+                    time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                pass
+
+    def sweep(self, pool, batch_size):
+        processed = failed = 0
+        while True:
+            jobs = claim_jobs(batch_size)
+            for job, variants, error in pool.map(run_job, jobs):
+                finish_job(job, variants, error)
+                if error is None:
+                    processed += 1
+                else:
+                    failed += 1
+                    self.stderr.write(f"{job}: {job.error}")
+            if len(jobs) < batch_size:
+                return processed, failed
+
+    def backfill(self):
+        queued = 0
+        for model, field_names in IMAGE_FIELDS.items():
+            label = model._meta.label_lower
+            for field_name in field_names:
+                pending = set(
+                    ImageJob.objects.filter(
+                        model=label, field=field_name
+                    ).values_list("object_id", flat=True)
+                )
+                rows = (
+                    model._default_manager.exclude(**{field_name: ""})
+                    .filter(
+                        **{
+                            f"{field_name}__isnull": False,
+                            variants_field(field_name): {},
+                        }
+                    )
+                    .values_list("pk", field_name)
+                )
+                jobs = [
+                    ImageJob(
+                        model=label,
+                        object_id=pk,
+                        field=field_name,
+                        source=name,
+                    )
+                    for pk, name in rows.iterator()
+                    if pk not in pending
+                ]
+                ImageJob.objects.bulk_create(jobs, batch_size=1000)
+                queued += len(jobs)
+        return queued
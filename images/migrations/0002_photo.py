@@ -0,0 +1,121 @@
+# Generated by Django 5.2.6 on 2026-10-19 16:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hotels", "0007_hotel_photos_variants_room_photos_variants"),
+        ("images", "0001_initial"),
+        ("reviews", "0003_review_photos_variants"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Photo",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("image", models.ImageField(upload_to="photos/")),
+                ("image_variants", models.JSONField(default=dict, editable=False)),
+                ("content_hash", models.CharField(editable=False, max_length=64)),
+                ("position", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "hotel",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="gallery",
+                        to="hotels.hotel",
+                    ),
+                ),
+                (
+                    "review",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="gallery",
+                        to="reviews.review",
+                    ),
+                ),
+                (
+                    "room",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="gallery",
+                        to="hotels.room",
+                    ),
+                ),
+                (
+                    "uploaded_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["position", "id"],
+                "indexes": [
+                    models.Index(fields=["content_hash"], name="photo_content_hash_idx")
+                ],
+                "constraints": [
+                    models.CheckConstraint(
+                        condition=models.Q(
+                            models.Q(
+                                ("hotel__isnull", False),
+                                ("review__isnull", True),
+                                ("room__isnull", True),
+                            ),
+                            models.Q(
+                                ("hotel__isnull", True),
+                                ("review__isnull", True),
+                                ("room__isnull", False),
+                            ),
+                            models.Q(
+                                ("hotel__isnull", True),
+                                ("review__isnull", False),
+                                ("room__isnull", True),
+                            ),
+                            _connector="OR",
+                        ),
+                        name="photo_single_parent",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("hotel__isnull", False)),
+                        fields=("hotel", "content_hash"),
+                        name="photo_hotel_content_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("room__isnull", False)),
+                        fields=("room", "content_hash"),
+                        name="photo_room_content_unique",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("review__isnull", False)),
+                        fields=("review", "content_hash"),
+                        name="photo_review_content_unique",
+                    ),
+                ],
+            },
+        ),
+    ]
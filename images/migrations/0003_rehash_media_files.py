@@ -0,0 +1,86 @@
+from django.core.files.storage import default_storage
+from django.db import migrations
+
+from booking_clone.storage import is_hashed_name
+
+IMAGE_FIELDS = [
+    ("hotels", "Hotel", "photos"),
+    ("hotels", "Room", "photos"),
+    ("reviews", "Review", "photos"),
+    ("images", "Photo", "image"),
+]
+BATCH_SIZE = 1000
+
+
+def rehash(name, renamed):
+    """Store the file ``name`` under its content-addressed name."""
+    if name not in renamed:
+        if is_hashed_name(name):
+            renamed[name] = name
+        elif not default_storage.exists(name):
+            # Usually MEDIA_ROOT not being mounted where the migration runs:
+            # recording the migration as applied would skip every file.
+            raise FileNotFoundError(
+                f"Media file {name!r} is referenced but missing from "
+                f"{default_storage.location}; mount the media files or "
+                "clear the reference before migrating."
+            )
+        else:
+            with default_storage.open(name) as file:
+                renamed[name] = default_storage.save(name, file)
+    return renamed[name]
+
+
+def rehash_media_files(apps, schema_editor):
+    """
+    Copy the stored images and their variants to content-addressed names
+    and point the rows at them. The old files are left for gc_media.
+    """
+    renamed = {}
+    for app_label, model_name, field in IMAGE_FIELDS:
+        model = apps.get_model(app_label, model_name)
+        variants_field = f"{field}_variants"
+        rows = (
+            model.objects.filter(**{f"{field}__isnull": False})
+            .exclude(**{field: ""})
+            .order_by("pk")
+            .values_list("pk", field, variants_field)
+        )
+        last_pk = 0
+        while batch := list(rows.filter(pk__gt=last_pk)[:BATCH_SIZE]):
+            for pk, name, variants in batch:
+                new_name = rehash(name, renamed)
+                if variants:
+                    variants = {
+                        **variants,
+                        "source": new_name,
+                        "variants": [
+                            {
+                                **variant,
+                                "name": rehash(variant["name"], renamed),
+                            }
+                            for variant in variants["variants"]
+                        ],
+                    }
+                model.objects.filter(pk=pk).update(
+                    **{field: new_name, variants_field: variants}
+                )
+            last_pk = batch[-1][0]
+
+    ImageJob = apps.get_model("images", "ImageJob")
+    for name, new_name in renamed.items():
+        if new_name != name:
+            ImageJob.objects.filter(source=name).update(source=new_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hotels", "0007_hotel_photos_variants_room_photos_variants"),
+        ("images", "0002_photo"),
+        ("reviews", "0003_review_photos_variants"),
+    ]
+
+    operations = [
+        migrations.RunPython(rehash_media_files, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,145 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+
+class ImageJobStatus(models.TextChoices):
+    PENDING = "PENDING", "PENDING"
+    PROCESSING = "PROCESSING", "PROCESSING"
+    FAILED = "FAILED", "FAILED"
+
+
+class ImageJob(models.Model):
+    """
+    Variants to generate for the image stored in ``field`` of a row, queued
+    when the image is uploaded and deleted once processed.
+    """
+
+    model = models.CharField(max_length=100)
+    object_id = models.PositiveBigIntegerField()
+    field = models.CharField(max_length=100)
+    source = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=20,
+        choices=ImageJobStatus.choices,
+        default=ImageJobStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["status", "created_at"], name="image_job_queue_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model} {self.object_id} {self.field}: {self.source}"
+
+
+class Photo(models.Model):
+    """
+    A photo of the ordered gallery of a hotel, a room or a review. Photos
+    with identical content share a single stored file.
+    """
+
+    PARENT_FIELDS = ["hotel", "room", "review"]
+
+    hotel = models.ForeignKey(
+        "hotels.Hotel",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="gallery",
+    )
+    room = models.ForeignKey(
+        "hotels.Room",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="gallery",
+    )
+    review = models.ForeignKey(
+        "reviews.Review",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="gallery",
+    )
+    image = models.ImageField(upload_to="photos/")
+    image_variants = models.JSONField(default=dict, editable=False)
+    content_hash = models.CharField(max_length=64, editable=False)
+    position = models.PositiveIntegerField(default=0)
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["position", "id"]
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(
+                    hotel__isnull=False,
+                    room__isnull=True,
+                    review__isnull=True,
+                )
+                | Q(
+                    hotel__isnull=True, room__isnull=False, review__isnull=True
+                )
+                | Q(
+                    hotel__isnull=True, room__isnull=True, review__isnull=False
+                ),
+                name="photo_single_parent",
+            ),
+            models.UniqueConstraint(
+                fields=["hotel", "content_hash"],
+                condition=Q(hotel__isnull=False),
+                name="photo_hotel_content_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["room", "content_hash"],
+                condition=Q(room__isnull=False),
+                name="photo_room_content_unique",
+            ),
+            models.UniqueConstraint(
+                fields=["review", "content_hash"],
+                condition=Q(review__isnull=False),
+                name="photo_review_content_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["content_hash"], name="photo_content_hash_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Photo {self.pk} of {self.parent_field} {self.parent_id}"
+
+    @property
+    def parent_field(self):
+        for name in self.PARENT_FIELDS:
+            if getattr(self, f"{name}_id") is not None:
+                return name
+        return None
+
+    @property
+    def parent_id(self):
+        return getattr(self, f"{self.parent_field}_id")
+
+    @property
+    def owner_id(self):
+        """The user allowed to change the gallery holding this photo."""
+        if self.hotel_id is not None:
+            return self.hotel.owner_id
+        if self.room_id is not None:
+            return self.room.hotel.owner_id
+        return self.review.user_id
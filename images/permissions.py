@@ -0,0 +1,18 @@
+from rest_framework import permissions
+
+
+class IsGalleryOwnerOrReadOnly(permissions.BasePermission):
+    """
+    Hotel and room galleries are managed by the hotel's owner, review
+    galleries by the review's author.
+    """
+
+    def has_permission(self, request, view):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        return request.user.is_authenticated
+
+    def has_object_permission(self, request, view, obj):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        return obj.owner_id == request.user.id or request.user.is_staff
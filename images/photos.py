@@ -0,0 +1,77 @@
+import hashlib
+
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from images.models import Photo
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "The uploaded file is too large."
+    default_code = "upload_too_large"
+
+
+class HashingUploadHandler(TemporaryFileUploadHandler):
+    """
+    Upload handler streaming every file to a temporary file on disk, never
+    to memory, and hashing its content on the way. Files larger than
+    PHOTO_MAX_UPLOAD_SIZE are rejected as soon as they cross the limit.
+    """
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        # One file, plus form fields capped by DATA_UPLOAD_MAX_MEMORY_SIZE.
+        limit = settings.PHOTO_MAX_UPLOAD_SIZE + (
+            settings.DATA_UPLOAD_MAX_MEMORY_SIZE or 0
+        )
+        if content_length > limit:
+            raise UploadTooLarge()
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > settings.PHOTO_MAX_UPLOAD_SIZE:
+            self.file.close()
+            raise UploadTooLarge()
+        self.hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.content_hash = self.hasher.hexdigest()
+        return file
+
+
+def prefetch_galleries(instances):
+    """
+    Set ``gallery_photos`` on the hotels, rooms and reviews in
+    ``instances``, reading all of their galleries with a single query.
+    """
+    parents = {}
+    for name in Photo.PARENT_FIELDS:
+        model = Photo._meta.get_field(name).related_model
+        parents[model] = name
+
+    by_parent = {}
+    condition = Q()
+    for instance in instances:
+        name = parents[type(instance)]
+        instance.gallery_photos = []
+        by_parent[name, instance.pk] = instance
+    for name in Photo.PARENT_FIELDS:
+        ids = [pk for parent, pk in by_parent if parent == name]
+        if ids:
+            condition |= Q(**{f"{name}__in": ids})
+    if not by_parent:
+        return
+
+    for photo in Photo.objects.filter(condition):
+        parent = by_parent[photo.parent_field, photo.parent_id]
+        parent.gallery_photos.append(photo)
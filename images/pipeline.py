@@ -0,0 +1,193 @@
+import io
+import os
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import ExifTags, Image, ImageOps
+
+from images import blurhash
+from images.models import ImageJob, ImageJobStatus
+
+# Variant format: (Pillow format, media type).
+FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+}
+MAX_ATTEMPTS = 3
+# A job claimed longer ago than this was lost by a crashed worker.
+CLAIM_TIMEOUT = timedelta(minutes=10)
+# EXIF orientations that swap width and height.
+TRANSPOSED = {5, 6, 7, 8}
+
+
+def variants_field(field_name):
+    """Name of the JSON column holding the variants of an image field."""
+    return f"{field_name}_variants"
+
+
+def variant_widths(width):
+    """
+    The configured widths narrower than the image, plus the image's own
+    width when it is narrower than the largest: images are never upscaled.
+    """
+    widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < width]
+    if width <= max(settings.IMAGE_VARIANT_WIDTHS):
+        widths.append(width)
+    return widths
+
+
+def oriented_size(image):
+    """(width, height) of ``image`` once turned upright."""
+    width, height = image.size
+    if image.getexif().get(ExifTags.Base.Orientation) in TRANSPOSED:
+        return height, width
+    return width, height
+
+
+def decode(image, widest):
+    """
+    Decode ``image`` upright, in RGB or RGBA. JPEGs are decoded straight
+    at the smallest scale still wider than ``widest``, which skips most of
+    the decoding work.
+    """
+    image.draft("RGB", (widest, widest))
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def encode(image, image_format):
+    if image_format == "JPEG" and image.mode == "RGBA":
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    buffer = io.BytesIO()
+    image.save(
+        buffer,
+        image_format,
+        quality=settings.IMAGE_VARIANT_QUALITY,
+        optimize=image_format == "JPEG",
+    )
+    return buffer.getvalue()
+
+
+def process_image(storage, name):
+    """
+    Generate the variants of the image ``name`` of ``storage`` and return
+    their description, stored in the image field's variants column.
+    """
+    with storage.open(name) as file:
+        image = Image.open(file)
+        width, height = oriented_size(image)
+        widths = variant_widths(width)
+        image = decode(image, max(widths))
+
+    stem = os.path.splitext(name)[0]
+    variants = []
+    # Largest first, each variant resized from the previous one.
+    for variant_width in sorted(set(widths), reverse=True):
+        variant_height = max(1, round(height * variant_width / width))
+        if image.size != (variant_width, variant_height):
+            image = image.resize(
+                (variant_width, variant_height), Image.Resampling.LANCZOS
+            )
+        for extension in settings.IMAGE_VARIANT_FORMATS:
+            image_format = FORMATS[extension][0]
+            variant_name = storage.save(
+                f"{stem}.{variant_width}w.{extension}",
+                ContentFile(encode(image, image_format)),
+            )
+            variants.append(
+                {
+                    "name": variant_name,
+                    "format": extension,
+                    "width": variant_width,
+                    "height": variant_height,
+                }
+            )
+    variants.sort(key=lambda variant: variant["width"])
+    return {
+        "source": name,
+        "width": width,
+        "height": height,
+        "blurhash": blurhash.encode(image),
+        "variants": variants,
+    }
+
+
+def enqueue(instance, field_name):
+    return ImageJob.objects.create(
+        model=instance._meta.label_lower,
+        object_id=instance.pk,
+        field=field_name,
+        source=getattr(instance, field_name).name,
+    )
+
+
+def claim_jobs(limit):
+    """
+    Mark up to ``limit`` queued jobs, or jobs a crashed worker left behind,
+    as processing and return them. Jobs claimed by a concurrent worker are
+    skipped.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            ImageJob.objects.filter(
+                Q(status=ImageJobStatus.PENDING)
+                | Q(
+                    status=ImageJobStatus.PROCESSING,
+                    claimed_at__lt=now - CLAIM_TIMEOUT,
+                )
+            )
+            .select_for_update(skip_locked=True)
+            .order_by("created_at")
+            .values_list("pk", flat=True)[:limit]
+        )
+        ImageJob.objects.filter(pk__in=ids).update(
+            status=ImageJobStatus.PROCESSING,
+            claimed_at=now,
+            attempts=F("attempts") + 1,
+        )
+    return list(ImageJob.objects.filter(pk__in=ids).order_by("created_at"))
+
+
+def run_job(job):
+    """
+    Process the image of ``job`` and return (job, variants, error). Runs in
+    the worker pool, so it only touches storage, never the database.
+    """
+    model = apps.get_model(job.model)
+    storage = model._meta.get_field(job.field).storage
+    try:
+        return job, process_image(storage, job.source), None
+    except Exception as exc:
+        return job, None, exc
+
+
+def finish_job(job, variants, error=None):
+    """
+    Store the variants on every row still holding the image, which gallery
+    photos with the same content share, and drop the job; failed jobs are
+    retried up to MAX_ATTEMPTS times.
+    """
+    if error is None:
+        model = apps.get_model(job.model)
+        model._default_manager.filter(**{job.field: job.source}).update(
+            **{variants_field(job.field): variants}
+        )
+        job.delete()
+        return
+    job.error = f"{type(error).__name__}: {error}"
+    if job.attempts >= MAX_ATTEMPTS:
+        job.status = ImageJobStatus.FAILED
+    else:
+        job.status = ImageJobStatus.PENDING
+    job.save(update_fields=["status", "error"])
@@ -0,0 +1,175 @@
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from booking_clone.storage import file_hash
+from images.models import Photo
+from images.pipeline import FORMATS, variants_field
+
+
+@extend_schema_field(
+    {
+        "type": "object",
+        "nullable": True,
+        "properties": {
+            "width": {"type": "integer"},
+            "height": {"type": "integer"},
+            "blurhash": {"type": "string"},
+            "srcset": {
+                "type": "object",
+                "additionalProperties": {"type": "string"},
+                "example": {
+                    "image/webp": "https://example.com/media/a.320w.webp "
+                    "320w, https://example.com/media/a.640w.webp 640w"
+                },
+            },
+        },
+    }
+)
+class ImageVariantsField(serializers.ReadOnlyField):
+    """
+    The resized variants of an image field: original size, BlurHash
+    placeholder and a ``srcset`` per media type. None until the variants
+    are generated.
+    """
+
+    def __init__(self, image_field="photos", **kwargs):
+        self.image_field = image_field
+        super().__init__(**kwargs)
+
+    def bind(self, field_name, parent):
+        source = variants_field(self.image_field)
+        if self.source is None and field_name != source:
+            self.source = source
+        super().bind(field_name, parent)
+        model = parent.Meta.model
+        self.storage = model._meta.get_field(self.image_field).storage
+
+    def to_representation(self, value):
+        return self.represent(value, self.context.get("request"))
+
+    def values_converter(self):
+        """Converter of ValuesSerializer rows."""
+
+        def convert(value, row, request):
+            return self.represent(value, request)
+
+        return convert
+
+    def represent(self, value, request):
+        if not value:
+            return None
+        srcset = {}
+        for variant in value["variants"]:
+            url = self.storage.url(variant["name"])
+            if request is not None:
+                url = request.build_absolute_uri(url)
+            media_type = FORMATS[variant["format"]][1]
+            srcset.setdefault(media_type, []).append(
+                f"{url} {variant['width']}w"
+            )
+        return {
+            "width": value["width"],
+            "height": value["height"],
+            "blurhash": value["blurhash"],
+            "srcset": {
+                media_type: ", ".join(candidates)
+                for media_type, candidates in srcset.items()
+            },
+        }
+
+
+class GalleryPhotoSerializer(serializers.ModelSerializer):
+    image_variants = ImageVariantsField(image_field="image")
+
+    class Meta:
+        model = Photo
+        fields = ["id", "image", "image_variants", "position"]
+
+
+class PhotoSerializer(serializers.ModelSerializer):
+    image_variants = ImageVariantsField(image_field="image")
+
+    class Meta:
+        model = Photo
+        fields = [
+            "id",
+            "hotel",
+            "room",
+            "review",
+            "image",
+            "image_variants",
+            "position",
+            "created_at",
+        ]
+        read_only_fields = ["hotel", "room", "review", "image", "created_at"]
+
+
+class PhotoUploadSerializer(PhotoSerializer):
+    """
+    Adds a photo to the gallery of exactly one of ``hotel``, ``room`` or
+    ``review``, at the end unless ``position`` is given. Uploading a photo
+    already in the gallery returns the existing one, and photos already
+    stored for another gallery reuse the stored file and its variants.
+    """
+
+    class Meta(PhotoSerializer.Meta):
+        read_only_fields = ["created_at"]
+        extra_kwargs = {"position": {"required": False}}
+
+    def validate_image(self, value):
+        image = value.image
+        if image.format not in settings.PHOTO_FORMATS:
+            raise serializers.ValidationError(
+                f"Unsupported image format {image.format}, use one of "
+                f"{', '.join(settings.PHOTO_FORMATS)}."
+            )
+        if image.width * image.height > settings.PHOTO_MAX_PIXELS:
+            raise serializers.ValidationError(
+                f"Images are limited to {settings.PHOTO_MAX_PIXELS} pixels."
+            )
+        return value
+
+    def validate(self, attrs):
+        parents = [name for name in Photo.PARENT_FIELDS if attrs.get(name)]
+        if len(parents) != 1:
+            raise serializers.ValidationError(
+                "Set exactly one of hotel, room or review."
+            )
+        return attrs
+
+    def create(self, validated_data):
+        self.duplicate = False
+        digest = file_hash(validated_data["image"])
+        parent = {
+            name: validated_data[name]
+            for name in Photo.PARENT_FIELDS
+            if validated_data.get(name)
+        }
+        gallery = Photo.objects.filter(**parent)
+        existing = gallery.filter(content_hash=digest).first()
+        if existing is not None:
+            self.duplicate = True
+            return existing
+
+        if "position" not in validated_data:
+            last = gallery.aggregate(last=Max("position"))["last"]
+            validated_data["position"] = 0 if last is None else last + 1
+        stored = (
+            Photo.objects.filter(content_hash=digest)
+            .only("image", "image_variants")
+            .first()
+        )
+        if stored is not None:
+            validated_data["image"] = stored.image.name
+            validated_data["image_variants"] = stored.image_variants
+        validated_data["content_hash"] = digest
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            # The same photo was added concurrently.
+            self.duplicate = True
+            return gallery.get(content_hash=digest)
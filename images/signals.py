@@ -0,0 +1,46 @@
+from django.db.models.signals import post_save, pre_save
+
+from hotels.models import Hotel, Room
+from images.models import Photo
+from images.pipeline import enqueue, variants_field
+from reviews.models import Review
+
+# Image fields with variants, each next to a "<field>_variants" column.
+IMAGE_FIELDS = {
+    Hotel: ["photos"],
+    Room: ["photos"],
+    Review: ["photos"],
+    Photo: ["image"],
+}
+
+
+def reset_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Drop the variants of a replaced or cleared image and remember new
+    uploads, which are not committed to storage until the save.
+    """
+    if raw:
+        return
+    instance._new_images = []
+    deferred = instance.get_deferred_fields()
+    for field_name in IMAGE_FIELDS[sender]:
+        if field_name in deferred or (
+            update_fields is not None and field_name not in update_fields
+        ):
+            continue
+        image = getattr(instance, field_name)
+        if not image:
+            setattr(instance, variants_field(field_name), {})
+        elif not image._committed:
+            instance._new_images.append(field_name)
+            setattr(instance, variants_field(field_name), {})
+
+
+def queue_new_images(sender, instance, raw=False, **kwargs):
+    for field_name in instance.__dict__.pop("_new_images", []):
+        enqueue(instance, field_name)
+
+
+for model in IMAGE_FIELDS:
+    pre_save.connect(reset_variants, sender=model)
+    post_save.connect(queue_new_images, sender=model)
@@ -0,0 +1,135 @@
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+from rest_framework.test import APIClient
+
+from hotels.models import Hotel, Room
+from images.models import ImageJob, Photo
+from reviews.models import Review
+
+
+def jpeg(color="red", size=(64, 48)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "JPEG")
+    return SimpleUploadedFile(
+        "photo.jpg", buffer.getvalue(), content_type="image/jpeg"
+    )
+
+
+class PhotoUploadTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.owner = User.objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        cls.guest = User.objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        cls.hotel = Hotel.objects.create(name="Hotel", owner=cls.owner)
+        cls.other_hotel = Hotel.objects.create(
+            name="Other Hotel", owner=cls.owner
+        )
+        cls.room = Room.objects.create(hotel=cls.hotel, number="1", price=80)
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+        self.url = reverse("images:photo-list")
+
+    def upload(self, image, **parent):
+        return self.client.post(
+            self.url, {"image": image, **parent}, format="multipart"
+        )
+
+    def test_upload_appends_to_gallery(self):
+        first = self.upload(jpeg("red"), hotel=self.hotel.id)
+        second = self.upload(jpeg("blue"), hotel=self.hotel.id)
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(first.data["position"], 0)
+        self.assertEqual(second.data["position"], 1)
+        self.assertEqual(
+            ImageJob.objects.filter(model="images.photo").count(), 2
+        )
+
+    def test_identical_photos_are_deduplicated(self):
+        first = self.upload(jpeg(), hotel=self.hotel.id)
+        again = self.upload(jpeg(), hotel=self.hotel.id)
+        elsewhere = self.upload(jpeg(), hotel=self.other_hotel.id)
+
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again.data["id"], first.data["id"])
+        self.assertEqual(elsewhere.status_code, 201)
+        photos = Photo.objects.order_by("id")
+        self.assertEqual(len(photos), 2)
+        # One stored file, processed once.
+        self.assertEqual(photos[0].image.name, photos[1].image.name)
+        self.assertEqual(
+            ImageJob.objects.filter(model="images.photo").count(), 1
+        )
+
+    @override_settings(PHOTO_MAX_UPLOAD_SIZE=1024)
+    def test_upload_size_is_limited(self):
+        response = self.upload(jpeg(size=(800, 600)), hotel=self.hotel.id)
+
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(Photo.objects.exists())
+
+    def test_only_gallery_owner_uploads(self):
+        self.client.force_authenticate(user=self.guest)
+
+        response = self.upload(jpeg(), room=self.room.id)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_review_gallery_is_private_to_author(self):
+        other_guest = get_user_model().objects.create_user(
+            username="otherguest", password="pass", role="guest"
+        )
+        review = Review.objects.create(
+            hotel=self.hotel, user=self.guest, rating=4, comment="Nice"
+        )
+        self.upload(jpeg("blue"), hotel=self.hotel.id)
+        self.client.force_authenticate(user=self.guest)
+        self.upload(jpeg(), review=review.id)
+
+        for user, visible in [(self.guest, 2), (other_guest, 1), (None, 1)]:
+            with self.subTest(user=user):
+                self.client.force_authenticate(user=user)
+                response = self.client.get(self.url)
+                self.assertEqual(response.data["count"], visible)
+                response = self.client.get(self.url, {"review": review.id})
+                self.assertEqual(response.data["count"], visible - 1)
+
+    def test_exactly_one_parent(self):
+        response = self.upload(jpeg(), hotel=self.hotel.id, room=self.room.id)
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_hotel_detail_galleries_in_one_query(self):
+        self.upload(jpeg("red"), hotel=self.hotel.id)
+        self.upload(jpeg("blue"), room=self.room.id)
+        url = reverse("hotels:hotel-detail", args=[self.hotel.id])
+
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.data["gallery"]), 1)
+        self.assertEqual(len(response.data["rooms"][0]["gallery"]), 1)
+        self.assertEqual(
+            list(response.data["gallery"][0]),
+            ["id", "image", "image_variants", "position"],
+        )
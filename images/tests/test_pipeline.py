@@ -0,0 +1,142 @@
+import io
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+
+from booking_clone.storage import is_hashed_name
+from hotels.models import Hotel, Location
+from images import blurhash
+from images.models import ImageJob
+from images.pipeline import claim_jobs, finish_job, process_image, run_job
+
+
+def jpeg(width, height, color="red"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, "JPEG")
+    return ContentFile(buffer.getvalue(), name="photo.jpg")
+
+
+class MediaRootMixin:
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings = override_settings(MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+
+class BlurHashTest(SimpleTestCase):
+    def test_solid_color(self):
+        image = Image.new("RGB", (64, 48), (255, 0, 0))
+
+        self.assertEqual(
+            blurhash.encode(image), "LDTI:j]9fQ]9|co1fQo1fQfQfQfQ"
+        )
+
+
+@override_settings(
+    IMAGE_VARIANT_WIDTHS=[320, 640, 1280],
+    IMAGE_VARIANT_FORMATS=["webp", "jpeg"],
+)
+class ProcessImageTest(MediaRootMixin, SimpleTestCase):
+    def test_variants(self):
+        name = default_storage.save("hotels/photo.jpg", jpeg(800, 600))
+
+        result = process_image(default_storage, name)
+
+        self.assertEqual(result["width"], 800)
+        self.assertEqual(result["height"], 600)
+        self.assertEqual(len(result["blurhash"]), 28)
+        self.assertEqual(
+            [
+                (variant["format"], variant["width"], variant["height"])
+                for variant in result["variants"]
+            ],
+            [
+                ("webp", 320, 240),
+                ("jpeg", 320, 240),
+                ("webp", 640, 480),
+                ("jpeg", 640, 480),
+                ("webp", 800, 600),
+                ("jpeg", 800, 600),
+            ],
+        )
+        variant = result["variants"][0]
+        self.assertTrue(is_hashed_name(variant["name"]))
+        self.assertTrue(variant["name"].endswith(".webp"))
+        with default_storage.open(variant["name"]) as file:
+            image = Image.open(file)
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, (320, 240))
+
+
+class ImagePipelineTest(MediaRootMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        cls.location = Location.objects.create(country="UA", city="Kyiv")
+
+    def create_hotel(self):
+        return Hotel.objects.create(
+            name="Hotel",
+            location=self.location,
+            owner=self.owner,
+            photos=jpeg(400, 300),
+        )
+
+    def test_upload_is_processed(self):
+        hotel = self.create_hotel()
+
+        job = ImageJob.objects.get()
+        self.assertEqual(job.source, hotel.photos.name)
+
+        call_command("process_images", workers=2, stdout=io.StringIO())
+
+        self.assertFalse(ImageJob.objects.exists())
+        hotel.refresh_from_db()
+        self.assertEqual(hotel.photos_variants["source"], hotel.photos.name)
+
+        response = self.client.get("/hotels/")
+
+        photos = response.data["results"][0]["photos_variants"]
+        self.assertEqual(photos["width"], 400)
+        self.assertEqual(photos["height"], 300)
+        self.assertEqual(set(photos["srcset"]), {"image/webp", "image/jpeg"})
+        self.assertTrue(
+            photos["srcset"]["image/webp"].startswith("http://testserver/")
+        )
+        self.assertTrue(photos["srcset"]["image/webp"].endswith(" 400w"))
+
+    def test_replaced_image_is_not_overwritten(self):
+        hotel = self.create_hotel()
+        jobs = claim_jobs(10)
+        results = [run_job(job) for job in jobs]
+
+        hotel.photos = jpeg(200, 100, "blue")
+        hotel.save()
+        for job, variants, error in results:
+            finish_job(job, variants, error)
+
+        hotel.refresh_from_db()
+        self.assertEqual(hotel.photos_variants, {})
+        # The job of the new upload is still queued.
+        self.assertEqual(ImageJob.objects.get().source, hotel.photos.name)
+
+    @patch("images.management.commands.process_images.time.sleep")
+    @patch("images.management.commands.process_images.close_old_connections")
+    def test_loop_recycles_connections(self, close_old_connections, sleep):
+        sleep.side_effect = [None, KeyboardInterrupt]
+
+        call_command("process_images", loop=True, stdout=io.StringIO())
+
+        self.assertEqual(close_old_connections.call_count, 2)
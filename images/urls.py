@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+
+from images.views import PhotoViewSet
+
+app_name = "images"
+
+router = DefaultRouter()
+router.register("", PhotoViewSet, basename="photo")
+
+urlpatterns = router.urls
@@ -0,0 +1,114 @@
+from django.db.models import Q
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import status, viewsets
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+
+from booking_clone.parsers import ORJSONParser
+from images.models import Photo
+from images.permissions import IsGalleryOwnerOrReadOnly
+from images.photos import HashingUploadHandler
+from images.serializers import PhotoSerializer, PhotoUploadSerializer
+
+
+@extend_schema(
+    tags=["Photos"],
+    summary="API for the photo galleries of hotels, rooms and reviews.",
+    description="""
+    API for listing, uploading, reordering and deleting gallery photos.
+    - Hotel and room photos are managed by the hotel's owner, review
+      photos by the review's author, and only visible to them and staff.
+    - Photos are uploaded one per multipart request, up to
+      PHOTO_MAX_UPLOAD_SIZE bytes.
+    - Resized variants are generated in the background.
+    """,
+)
+class PhotoViewSet(viewsets.ModelViewSet):
+    queryset = Photo.objects.all()
+    parser_classes = [MultiPartParser, ORJSONParser]
+    permission_classes = [IsGalleryOwnerOrReadOnly]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["hotel", "room", "review"]
+    http_method_names = ["get", "post", "patch", "delete", "head", "options"]
+
+    def initialize_request(self, request, *args, **kwargs):
+        if request.method == "POST":
+            # Set before anything reads the body, the CSRF check included.
+            request.upload_handlers = [HashingUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def get_serializer_class(self):
+        if self.action == "create":
+            return PhotoUploadSerializer
+        return PhotoSerializer
+
+    def get_queryset(self):
+        if self.action in ["partial_update", "destroy"]:
+            queryset = Photo.objects.select_related(
+                "hotel", "room__hotel", "review"
+            )
+        else:
+            queryset = Photo.objects.all()
+        user = self.request.user
+        if user.is_staff:
+            return queryset
+        # Like the reviews themselves, review galleries are only visible to
+        # their author.
+        return queryset.filter(
+            Q(review__isnull=True) | Q(review__user_id=user.id)
+        )
+
+    @extend_schema(
+        summary="List photos",
+        description="Returns the photos of a gallery, in gallery order.",
+        parameters=[
+            OpenApiParameter("hotel", type=int, description="Hotel ID"),
+            OpenApiParameter("room", type=int, description="Room ID"),
+            OpenApiParameter("review", type=int, description="Review ID"),
+        ],
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Upload photo",
+        description="""
+        Add a photo to the gallery of a hotel, a room or a review. Uploading
+        a photo already in the gallery returns it with status 200.
+        """,
+        request={"multipart/form-data": PhotoUploadSerializer},
+        responses={200: PhotoSerializer, 201: PhotoSerializer},
+    )
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        parent = {
+            name: serializer.validated_data[name]
+            for name in Photo.PARENT_FIELDS
+            if serializer.validated_data.get(name)
+        }
+        self.check_object_permissions(request, Photo(**parent))
+        serializer.save(uploaded_by=request.user)
+        return Response(
+            serializer.data,
+            status=(
+                status.HTTP_200_OK
+                if serializer.duplicate
+                else status.HTTP_201_CREATED
+            ),
+        )
+
+    @extend_schema(
+        summary="Move photo",
+        description="Change the position of a photo in its gallery.",
+    )
+    def partial_update(self, request, *args, **kwargs):
+        return super().partial_update(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Delete photo",
+        description="Remove a photo from its gallery.",
+    )
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
@@ -1,18 +1,20 @@
-from django.contrib import admin
-
-from payments.models import Payment
-
-
-@admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
-    list_display = (
-        "id",
-        "booking",
-        "amount",
-        "status",
-        "payment_type",
-        "paid_at",
-    )
-    list_filter = ("status", "payment_type", "paid_at")
-    search_fields = ("booking__user__username", "booking__room__hotel__name")
-    autocomplete_fields = ("booking",)
+from django.contrib import admin
+
+from booking_clone.admin import LargeTableAdmin
+from payments.models import Payment
+
+
+@admin.register(Payment)
+class PaymentAdmin(LargeTableAdmin):
+    list_display = (
+        "id",
+        "booking",
+        "amount",
+        "status",
+        "payment_type",
+        "paid_at",
+    )
+    list_filter = ("status", "payment_type", "paid_at")
+    list_select_related = ("booking__user", "booking__room__hotel")
+    search_fields = ("booking__user__username", "booking__room__hotel__name")
+    autocomplete_fields = ("booking",)
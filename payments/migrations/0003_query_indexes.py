@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("bookings", "0004_query_indexes"),
+        ("payments", "0002_payment_payment_type_payment_session_id_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payment",
+            index=models.Index(
+                condition=models.Q(("session_id__isnull", False)),
+                fields=["session_id"],
+                name="payment_session_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-19 17:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payments", "0003_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="payment",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "PENDING"),
+                    ("PAID", "PAID"),
+                    ("CANCELLED", "CANCELLED"),
+                    ("EXPIRED", "EXPIRED"),
+                    ("FAILED", "FAILED"),
+                    ("REFUNDED", "REFUNDED"),
+                ],
+                default="PENDING",
+                max_length=20,
+            ),
+        ),
+    ]
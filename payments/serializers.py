@@ -1,43 +1,55 @@
-from rest_framework import serializers
-
-from bookings.models import Booking
-from bookings.serializers import BookingSerializer
-from payments.models import Payment
-
-
-class PaymentSerializer(serializers.ModelSerializer):
-    booking = serializers.PrimaryKeyRelatedField(
-        queryset=Booking.objects.all()
-    )
-
-    class Meta:
-        model = Payment
-        fields = [
-            "id",
-            "status",
-            "payment_type",
-            "booking",
-            "session_url",
-            "session_id",
-            "amount",
-            "paid_at",
-        ]
-        read_only_fields = ["id", "session_url", "session_id", "paid_at"]
-
-
-class PaymentListSerializer(serializers.ModelSerializer):
-    booking = serializers.SlugRelatedField(read_only=True, slug_field="id")
-
-    class Meta:
-        model = Payment
-        fields = (
-            "id",
-            "status",
-            "payment_type",
-            "booking",
-            "amount",
-        )
-
-
-class PaymentDetailSerializer(PaymentSerializer):
-    booking = BookingSerializer(read_only=True)
+from rest_framework import serializers
+
+from booking_clone.serializers import DynamicFieldsMixin
+from bookings.models import Booking
+from bookings.serializers import BookingSerializer
+from payments.models import Payment, PaymentType
+
+
+class PaymentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    booking = serializers.PrimaryKeyRelatedField(
+        queryset=Booking.objects.all()
+    )
+
+    class Meta:
+        model = Payment
+        fields = [
+            "id",
+            "status",
+            "payment_type",
+            "booking",
+            "session_url",
+            "session_id",
+            "amount",
+            "paid_at",
+        ]
+        read_only_fields = ["id", "session_url", "session_id", "paid_at"]
+        expandable_fields = {"booking": BookingSerializer}
+
+
+class PaymentCheckoutSerializer(serializers.Serializer):
+    """Input of the async checkout endpoint, validated without queries."""
+
+    booking = serializers.IntegerField()
+    payment_type = serializers.ChoiceField(
+        choices=[PaymentType.PAYMENT], default=PaymentType.PAYMENT
+    )
+
+
+class PaymentListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    booking = serializers.SlugRelatedField(read_only=True, slug_field="id")
+
+    class Meta:
+        model = Payment
+        fields = (
+            "id",
+            "status",
+            "payment_type",
+            "booking",
+            "amount",
+        )
+        expandable_fields = {"booking": BookingSerializer}
+
+
+class PaymentDetailSerializer(PaymentSerializer):
+    booking = BookingSerializer(read_only=True)
@@ -1,80 +1,187 @@
-from decimal import Decimal
-from typing import Any, Optional
-
-import stripe
-from django.conf import settings
-from django.http import HttpRequest
-from django.urls import reverse
-
-from bookings.models import Booking
-from payments.models import PaymentType
-
-stripe.api_key = settings.STRIPE_SECRET_KEY
-
-
-def create_stripe_session(
-    booking: Booking,
-    payment_type: str = PaymentType.PAYMENT,
-    request: Optional[HttpRequest] = None,
-    fine_amount: Optional[Decimal] = None,
-) -> dict[str, Any]:
-    """
-    Create a Stripe checkout session for a booking.
-
-    Args:
-        booking: Booking instance
-        payment_type: PaymentType (PAYMENT or FINE)
-        request: Django request object for building absolute URIs
-        fine_amount: Decimal amount for FINE payments (required for FINE)
-
-    Returns:
-        dict: Contains session_id, session_url, and amount
-    """
-    if payment_type == PaymentType.PAYMENT:
-        days = (booking.check_out - booking.check_in).days
-        if days <= 0:
-            days = 1
-        total_price = booking.room.price * Decimal(days)
-        description = f"Room rental for {days} days"
-        product_name = (
-            f"Room: {booking.room.number} " f"in {booking.room.hotel.name}"
-        )
-    elif payment_type == PaymentType.FINE:
-        if fine_amount is None:
-            raise ValueError("fine_amount is required for FINE payments")
-        total_price = fine_amount
-        description = f"Fine for booking #{booking.id}"
-        product_name = f"Fine: Room {booking.room.number}"
-    else:
-        raise ValueError(f"Unsupported payment_type: {payment_type}")
-
-    amount_in_cents = int(total_price * 100)
-
-    try:
-        session = stripe.checkout.Session.create(
-            payment_method_types=["card"],
-            line_items=[
-                {
-                    "price_data": {
-                        "currency": "usd",
-                        "product_data": {
-                            "name": product_name,
-                            "description": description,
-                        },
-                        "unit_amount": amount_in_cents,
-                    },
-                    "quantity": 1,
-                }
-            ],
-            mode="payment",
-            success_url=request.build_absolute_uri(reverse("payments:success"))
-            + "?session_id={CHECKOUT_SESSION_ID}",
-            cancel_url=request.build_absolute_uri(reverse("payments:cancel")),
-        )
-        return {
-            "session_id": session.id,
-            "session_url": session.url,
-            "amount": total_price,
-        }
-    except stripe.error.StripeError as e:
-        raise Exception(f"Stripe error: {str(e)}")
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Optional
+
+import stripe
+from django.conf import settings
+from django.http import HttpRequest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from bookings.models import Booking
+from payments.models import PaymentType
+
+stripe.api_key = settings.STRIPE_SECRET_KEY
+
+
+class PaymentGatewayError(APIException):
+    status_code = status.HTTP_502_BAD_GATEWAY
+    default_detail = "The payment gateway could not process the request."
+    default_code = "payment_gateway_error"
+
+
+# Stripe accepts session expiries from 30 minutes to 24 hours ahead; the
+# extra minute covers the request's way to Stripe.
+SESSION_MIN_LIFETIME = timedelta(minutes=31)
+SESSION_MAX_LIFETIME = timedelta(hours=23)
+
+
+def session_expires_at(booking: Booking) -> int:
+    """
+    Expiry of a booking's checkout session: the end of its hold, within
+    the limits Stripe accepts. A session outliving the hold can still be
+    paid; the success callback refunds it.
+    """
+    now = timezone.now()
+    expires_at = booking.expires_at or now + SESSION_MAX_LIFETIME
+    expires_at = min(
+        max(expires_at, now + SESSION_MIN_LIFETIME),
+        now + SESSION_MAX_LIFETIME,
+    )
+    return int(expires_at.timestamp())
+
+
+def checkout_session_params(
+    booking: Booking,
+    payment_type: str = PaymentType.PAYMENT,
+    request: Optional[HttpRequest] = None,
+    fine_amount: Optional[Decimal] = None,
+) -> tuple[dict[str, Any], Decimal]:
+    """
+    Build the Stripe checkout session parameters for a booking.
+
+    Args:
+        booking: Booking instance with its room and hotel loaded
+        payment_type: PaymentType (PAYMENT or FINE)
+        request: Django request object for building absolute URIs
+        fine_amount: Decimal amount for FINE payments (required for FINE)
+
+    Returns:
+        tuple: Session parameters and the total price
+    """
+    if payment_type == PaymentType.PAYMENT:
+        days = (booking.check_out - booking.check_in).days
+        if days <= 0:
+            days = 1
+        total_price = booking.room.price * Decimal(days)
+        description = f"Room rental for {days} days"
+        product_name = (
+            f"Room: {booking.room.number} " f"in {booking.room.hotel.name}"
+        )
+    elif payment_type == PaymentType.FINE:
+        if fine_amount is None:
+            raise ValueError("fine_amount is required for FINE payments")
+        total_price = fine_amount
+        description = f"Fine for booking #{booking.id}"
+        product_name = f"Fine: Room {booking.room.number}"
+    else:
+        raise ValueError(f"Unsupported payment_type: {payment_type}")
+
+    amount_in_cents = int(total_price * 100)
+
+    params = {
+        "payment_method_types": ["card"],
+        "line_items": [
+            {
+                "price_data": {
+                    "currency": "usd",
+                    "product_data": {
+                        "name": product_name,
+                        "description": description,
+                    },
+                    "unit_amount": amount_in_cents,
+                },
+                "quantity": 1,
+            }
+        ],
+        "mode": "payment",
+        "success_url": request.build_absolute_uri(reverse("payments:success"))
+        + "?session_id={CHECKOUT_SESSION_ID}",
+        "cancel_url": request.build_absolute_uri(reverse("payments:cancel")),
+    }
+    if payment_type == PaymentType.PAYMENT:
+        params["expires_at"] = session_expires_at(booking)
+    return params, total_price
+
+
+def create_stripe_session(
+    booking: Booking,
+    payment_type: str = PaymentType.PAYMENT,
+    request: Optional[HttpRequest] = None,
+    fine_amount: Optional[Decimal] = None,
+) -> dict[str, Any]:
+    """
+    Create a Stripe checkout session for a booking.
+
+    Returns:
+        dict: Contains session_id, session_url, and amount
+    """
+    params, total_price = checkout_session_params(
+        booking, payment_type, request, fine_amount
+    )
+    try:
+        session = stripe.checkout.Session.create(**params)
+        return {
+            "session_id": session.id,
+            "session_url": session.url,
+            "amount": total_price,
+        }
+    except stripe.error.StripeError as e:
+        raise Exception(f"Stripe error: {str(e)}")
+
+
+async def acreate_stripe_session(
+    booking: Booking,
+    payment_type: str = PaymentType.PAYMENT,
+    request: Optional[HttpRequest] = None,
+    fine_amount: Optional[Decimal] = None,
+) -> dict[str, Any]:
+    """
+    Async version of create_stripe_session. The gateway is called with the
+    async HTTP client, so the event loop keeps serving other requests while
+    Stripe responds.
+    """
+    params, total_price = checkout_session_params(
+        booking, payment_type, request, fine_amount
+    )
+    try:
+        session = await stripe.checkout.Session.create_async(**params)
+        return {
+            "session_id": session.id,
+            "session_url": session.url,
+            "amount": total_price,
+        }
+    except stripe.error.StripeError as e:
+        raise Exception(f"Stripe error: {str(e)}")
+
+
+async def aretrieve_stripe_session(session_id: str) -> Any:
+    """The checkout session ``session_id``, with its payment status."""
+    try:
+        return await stripe.checkout.Session.retrieve_async(session_id)
+    except stripe.error.StripeError as e:
+        raise PaymentGatewayError(f"Stripe error: {str(e)}")
+
+
+async def arefund_stripe_session(session: Any) -> None:
+    """
+    Refund the payment of a paid checkout session. Refunding the same
+    session again within Stripe's idempotency window is a no-op.
+    """
+    try:
+        await stripe.Refund.create_async(
+            payment_intent=session.payment_intent,
+            idempotency_key=f"refund-{session.id}",
+        )
+    except stripe.error.StripeError as e:
+        raise PaymentGatewayError(f"Stripe error: {str(e)}")
+
+
+async def aexpire_stripe_session(session_id: str) -> None:
+    """Expire an unpaid checkout session, so it can no longer be paid."""
+    try:
+        await stripe.checkout.Session.expire_async(session_id)
+    except stripe.error.StripeError as e:
+        raise PaymentGatewayError(f"Stripe error: {str(e)}")
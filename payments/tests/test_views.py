@@ -1,59 +1,303 @@
-from unittest.mock import patch
-
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
-from django.utils import timezone
-from rest_framework.test import APIClient
-
-from bookings.models import Booking
-from hotels.models import Hotel, Room, RoomType, Location
-from payments.models import PaymentStatus, PaymentType
-
-
-class PaymentViewMockTest(TestCase):
-    def setUp(self):
-        self.owner = get_user_model().objects.create_user(
-            username="owneruser", password="pass", role="owner"
-        )
-        self.guest = get_user_model().objects.create_user(
-            username="guestuser", password="pass", role="guest"
-        )
-        self.location = Location.objects.create(country="UA", city="Kyiv")
-        self.hotel = Hotel.objects.create(
-            name="Test Hotel", location=self.location, owner=self.owner
-        )
-        self.room_type = RoomType.objects.create(
-            name="Standard", description="", max_guests=2, size=20, bed_count=1
-        )
-        self.room = Room.objects.create(
-            hotel=self.hotel, number="1", room_type=self.room_type, price=100
-        )
-        self.booking = Booking.objects.create(
-            user=self.guest,
-            room=self.room,
-            check_in=timezone.now().date(),
-            check_out=timezone.now().date() + timezone.timedelta(days=1),
-        )
-        self.client = APIClient()
-        self.client.force_authenticate(user=self.guest)
-
-    @patch("payments.views.create_stripe_session")
-    def test_create_payment_api(self, mock_create_stripe_session):
-        mock_create_stripe_session.return_value = {
-            "session_id": "sess_123",
-            "session_url": "https://stripe.com/session/123",
-            "amount": 100,
-        }
-        url = reverse("payments:payment-list")
-        data = {
-            "booking": self.booking.id,
-            "payment_type": PaymentType.PAYMENT,
-        }
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data["status"], PaymentStatus.PENDING)
-        self.assertEqual(response.data["session_id"], "sess_123")
-        self.assertEqual(
-            response.data["session_url"], "https://stripe.com/session/123"
-        )
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from booking_clone.queries import assert_no_repeated_queries
+from bookings.models import Booking
+from hotels.models import Hotel, Room, RoomType, Location
+from payments.models import Payment, PaymentStatus, PaymentType
+from payments.stripe_service import checkout_session_params
+
+
+def checkout_session(payment_status="paid"):
+    return SimpleNamespace(
+        id="sess_123", payment_status=payment_status, payment_intent="pi_123"
+    )
+
+
+class PaymentViewMockTest(TestCase):
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.hotel = Hotel.objects.create(
+            name="Test Hotel", location=self.location, owner=self.owner
+        )
+        self.room_type = RoomType.objects.create(
+            name="Standard", description="", max_guests=2, size=20, bed_count=1
+        )
+        self.room = Room.objects.create(
+            hotel=self.hotel, number="1", room_type=self.room_type, price=100
+        )
+        self.booking = Booking.objects.create(
+            user=self.guest,
+            room=self.room,
+            check_in=timezone.now().date(),
+            check_out=timezone.now().date() + timezone.timedelta(days=1),
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.guest)
+
+    @patch("payments.views.create_stripe_session")
+    def test_create_payment_api(self, mock_create_stripe_session):
+        mock_create_stripe_session.return_value = {
+            "session_id": "sess_123",
+            "session_url": "https://stripe.com/session/123",
+            "amount": 100,
+        }
+        url = reverse("payments:payment-list")
+        data = {
+            "booking": self.booking.id,
+            "payment_type": PaymentType.PAYMENT,
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], PaymentStatus.PENDING)
+        self.assertEqual(response.data["session_id"], "sess_123")
+        self.assertEqual(
+            response.data["session_url"], "https://stripe.com/session/123"
+        )
+
+    @patch("payments.views.acreate_stripe_session", new_callable=AsyncMock)
+    def test_checkout_creates_payment(self, mock_acreate_stripe_session):
+        mock_acreate_stripe_session.return_value = {
+            "session_id": "sess_123",
+            "session_url": "https://stripe.com/session/123",
+            "amount": 100,
+        }
+        url = reverse("payments:checkout")
+        response = self.client.post(url, {"booking": self.booking.id})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["session_id"], "sess_123")
+        self.assertEqual(response.data["booking"], self.booking.id)
+        self.assertTrue(
+            Payment.objects.filter(
+                booking=self.booking, status=PaymentStatus.PENDING
+            ).exists()
+        )
+
+        response = self.client.post(url, {"booking": self.booking.id})
+        self.assertEqual(response.status_code, 400)
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.post(url, {"booking": self.booking.id})
+        self.assertEqual(response.status_code, 404)
+        mock_acreate_stripe_session.assert_awaited_once()
+
+    @patch("payments.views.aexpire_stripe_session", new_callable=AsyncMock)
+    @patch("payments.views.acreate_stripe_session", new_callable=AsyncMock)
+    def test_concurrent_checkout_is_rejected(
+        self, mock_acreate_stripe_session, mock_expire
+    ):
+        async def create_session(*args, **kwargs):
+            # Another checkout of the booking completes meanwhile.
+            await Payment.objects.acreate(booking=self.booking, amount=100)
+            return {
+                "session_id": "sess_123",
+                "session_url": "https://stripe.com/session/123",
+                "amount": 100,
+            }
+
+        mock_acreate_stripe_session.side_effect = create_session
+        response = self.client.post(
+            reverse("payments:checkout"), {"booking": self.booking.id}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        mock_expire.assert_awaited_once_with("sess_123")
+        self.assertEqual(Payment.objects.count(), 1)
+
+    @patch("payments.views.aretrieve_stripe_session", new_callable=AsyncMock)
+    def test_success_callback_confirms_booking(self, mock_retrieve):
+        mock_retrieve.return_value = checkout_session()
+        Payment.objects.create(
+            booking=self.booking, amount=100, session_id="sess_123"
+        )
+        response = self.client.get(
+            reverse("payments:success"), {"session_id": "sess_123"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "CONFIRMED")
+        self.assertEqual(self.booking.payment.status, PaymentStatus.PAID)
+
+        response = self.client.get(
+            reverse("payments:cancel"), {"session_id": "sess_missing"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    @patch("payments.views.arefund_stripe_session", new_callable=AsyncMock)
+    @patch("payments.views.aretrieve_stripe_session", new_callable=AsyncMock)
+    def test_success_callback_refunds_expired_hold(
+        self, mock_retrieve, mock_refund
+    ):
+        mock_retrieve.return_value = checkout_session()
+        self.booking.expires_at = timezone.now() - timezone.timedelta(
+            minutes=1
+        )
+        self.booking.save()
+        Payment.objects.create(
+            booking=self.booking, amount=100, session_id="sess_123"
+        )
+
+        response = self.client.get(
+            reverse("payments:success"), {"session_id": "sess_123"}
+        )
+
+        self.assertEqual(response.status_code, 409)
+        mock_refund.assert_awaited_once_with(mock_retrieve.return_value)
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.status, "PENDING")
+        self.assertEqual(self.booking.payment.status, PaymentStatus.REFUNDED)
+
+    @patch("payments.views.arefund_stripe_session", new_callable=AsyncMock)
+    @patch("payments.views.aretrieve_stripe_session", new_callable=AsyncMock)
+    def test_success_callback_ignores_unpaid_session(
+        self, mock_retrieve, mock_refund
+    ):
+        mock_retrieve.return_value = checkout_session(payment_status="unpaid")
+        self.booking.expires_at = timezone.now() - timezone.timedelta(
+            minutes=1
+        )
+        self.booking.save()
+        Payment.objects.create(
+            booking=self.booking, amount=100, session_id="sess_123"
+        )
+
+        response = self.client.get(
+            reverse("payments:success"), {"session_id": "sess_123"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        mock_refund.assert_not_awaited()
+        self.assertEqual(Payment.objects.get().status, PaymentStatus.PENDING)
+
+    @patch("payments.views.acreate_stripe_session", new_callable=AsyncMock)
+    def test_checkout_needs_live_hold(self, mock_acreate_stripe_session):
+        url = reverse("payments:checkout")
+        expired = timezone.now() - timezone.timedelta(minutes=1)
+        for status, expires_at in [
+            ("PENDING", expired),
+            ("EXPIRED", None),
+            ("CONFIRMED", None),
+        ]:
+            with self.subTest(status=status):
+                Booking.objects.filter(pk=self.booking.pk).update(
+                    status=status, expires_at=expires_at
+                )
+                response = self.client.post(url, {"booking": self.booking.id})
+                self.assertEqual(response.status_code, 400)
+        mock_acreate_stripe_session.assert_not_awaited()
+
+    def test_checkout_session_expires_with_hold(self):
+        request = RequestFactory().get("/")
+        now = timezone.now()
+        for hold, lifetime in [(120, 120), (10, 31)]:
+            with self.subTest(hold=hold):
+                self.booking.expires_at = now + timezone.timedelta(
+                    minutes=hold
+                )
+                params, _ = checkout_session_params(
+                    self.booking, request=request
+                )
+                self.assertAlmostEqual(
+                    params["expires_at"],
+                    (now + timezone.timedelta(minutes=lifetime)).timestamp(),
+                    delta=5,
+                )
+
+    def test_export_payments(self):
+        Payment.objects.create(
+            booking=self.booking,
+            amount=100,
+            status=PaymentStatus.PAID,
+            paid_at=timezone.now(),
+        )
+        url = reverse("payments:payment-export")
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(url, {"export_format": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("100.00", lines[1])
+
+
+class PaymentQueryPatternTest(TestCase):
+    """Payment endpoints run the same number of queries per page."""
+
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.guest = get_user_model().objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        room_type = RoomType.objects.create(
+            name="Standard", max_guests=2, size=20, bed_count=1
+        )
+        today = timezone.localdate()
+        for index in range(5):
+            hotel = Hotel.objects.create(
+                name=f"Hotel {index}",
+                location=Location.objects.create(
+                    country="UA", city=f"City {index}"
+                ),
+                owner=self.owner,
+            )
+            room = Room.objects.create(
+                hotel=hotel, number="1", room_type=room_type, price=100
+            )
+            booking = Booking.objects.create(
+                user=self.guest,
+                room=room,
+                check_in=today,
+                check_out=today + timezone.timedelta(days=1),
+            )
+            self.payment = Payment.objects.create(
+                booking=booking,
+                amount=100,
+                session_id=f"sess_{index}",
+                payment_type=PaymentType.PAYMENT,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.guest)
+        retrieve = patch(
+            "payments.views.aretrieve_stripe_session",
+            new_callable=AsyncMock,
+            return_value=checkout_session(),
+        )
+        retrieve.start()
+        self.addCleanup(retrieve.stop)
+
+    def test_read_endpoints(self):
+        urls = [
+            reverse("payments:payment-list"),
+            reverse("payments:payment-list") + "?expand=booking",
+            reverse("payments:payment-detail", args=[self.payment.id]),
+            reverse("payments:success") + "?session_id=sess_0",
+            reverse("payments:cancel") + "?session_id=sess_1",
+        ]
+        for url in urls:
+            with self.subTest(url=url), assert_no_repeated_queries():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+    def test_export(self):
+        self.client.force_authenticate(user=self.owner)
+        with assert_no_repeated_queries():
+            response = self.client.get(reverse("payments:payment-export"))
+            self.assertEqual(response.status_code, 200)
+            b"".join(response.streaming_content)
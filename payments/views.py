@@ -1,122 +1,286 @@
-from django.db import transaction
-from django.utils import timezone
-from drf_spectacular.utils import extend_schema, OpenApiParameter
-from rest_framework import viewsets, mixins, status
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.response import Response
-from rest_framework.views import APIView
-
-from bookings.models import Booking
-from payments.models import Payment, PaymentStatus, PaymentType
-from payments.serializers import (
-    PaymentSerializer,
-    PaymentListSerializer,
-    PaymentDetailSerializer,
-)
-from payments.stripe_service import create_stripe_session
-
-
-@extend_schema(
-    tags=["Payments"],
-    summary="API for managing payments.",
-    description="""
-    API for creating, viewing, and listing payments for hotel bookings.
-    - Only authenticated users can access this API.
-    - Payment is created for a booking and a Stripe session is generated.
-    - Payment status can be PENDING, PAID, CANCELLED, EXPIRED, or FAILED.
-    - Payment type can be PAYMENT or FINE.
-    - The session_url is a Stripe link for payment.
-    """,
-)
-class PaymentViewSet(
-    mixins.ListModelMixin,
-    mixins.CreateModelMixin,
-    mixins.RetrieveModelMixin,
-    viewsets.GenericViewSet,
-):
-    queryset = Payment.objects.select_related("booking").all().order_by("-id")
-    serializer_class = PaymentSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_serializer_class(self):
-        if self.action == "list":
-            return PaymentListSerializer
-        if self.action == "retrieve":
-            return PaymentDetailSerializer
-        return PaymentSerializer
-
-    @extend_schema(
-        summary="List payments",
-        description="Returns a list of payments for the authenticated user.",
-        parameters=[
-            OpenApiParameter("status", type=str, description="Payment status"),
-            OpenApiParameter(
-                "payment_type", type=str, description="Payment type"
-            ),
-        ],
-        responses={200: PaymentListSerializer(many=True)},
-    )
-    def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
-
-    @extend_schema(
-        summary="Retrieve payment",
-        description="Returns detailed information about a payment.",
-        responses={200: PaymentDetailSerializer},
-    )
-    def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
-    
-    @extend_schema(
-        summary="Create payment",
-        description="""
-        Create a new payment for a booking. Generates a Stripe session for
-        payment. Returns payment data including session_url for payment.
-        """,
-        request=PaymentSerializer,
-        responses={201: PaymentSerializer},
-    )
-    @transaction.atomic
-    def create(self, request, *args, **kwargs):
-        booking_id = request.data.get("booking")
-        payment_type = request.data.get("payment_type", PaymentType.PAYMENT)
-        booking = Booking.objects.get(id=booking_id)
-        session_data = create_stripe_session(booking, payment_type, request)
-        payment = Payment.objects.create(
-            booking=booking,
-            amount=session_data["amount"],
-            status=PaymentStatus.PENDING,
-            payment_type=payment_type,
-            session_url=session_data["session_url"],
-            session_id=session_data["session_id"],
-        )
-        serializer = self.get_serializer(payment)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-
-
-@extend_schema(tags=["Payments"])
-class PaymentSuccessView(APIView):
-    def get(self, request, *args, **kwargs):
-        session_id = request.GET.get("session_id")
-        payment = Payment.objects.filter(session_id=session_id).first()
-        if payment:
-            payment.status = PaymentStatus.PAID
-            payment.paid_at = timezone.now()
-            payment.save()
-            if payment.booking:
-                payment.booking.status = "CONFIRMED"
-                payment.booking.save()
-            return Response({"status": "success"})
-        return Response({"status": "not found"}, status=404)
-
-
-@extend_schema(tags=["Payments"])
-class PaymentCancelView(APIView):
-    def get(self, request, *args, **kwargs):
-        session_id = request.GET.get("session_id")
-        payment = Payment.objects.filter(session_id=session_id).first()
-        if payment:
-            payment.status = PaymentStatus.CANCELLED
-            payment.save()
-            return Response({"status": "cancelled"})
-        return Response({"status": "not found"}, status=404)
+from adrf.views import APIView
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from rest_framework import viewsets, mixins, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from booking_clone.mixins import ExportMixin, SparseFieldsetMixin
+from bookings.models import Booking
+from hotels.permissions import IsStaffOrHotelOwner
+from payments.models import Payment, PaymentStatus, PaymentType
+from payments.serializers import (
+    PaymentCheckoutSerializer,
+    PaymentSerializer,
+    PaymentListSerializer,
+    PaymentDetailSerializer,
+)
+from payments.stripe_service import (
+    acreate_stripe_session,
+    aexpire_stripe_session,
+    arefund_stripe_session,
+    aretrieve_stripe_session,
+    create_stripe_session,
+)
+
+
+@transaction.atomic
+def settle_payment(session_id):
+    """
+    Record the payment of a paid checkout session. The booking is
+    locked, as the expiry sweeper locks it, and confirmed only while it is
+    PENDING, its hold has not run out and no other booking holds the room;
+    otherwise the payment is marked REFUNDED for the caller to refund.
+    Returns the payment, or None for an unknown session.
+    """
+    payment = Payment.objects.filter(session_id=session_id).first()
+    if payment is None:
+        return None
+    booking = Booking.objects.select_for_update().get(pk=payment.booking_id)
+    payment = Payment.objects.select_for_update().get(pk=payment.pk)
+    if payment.status in (PaymentStatus.PAID, PaymentStatus.REFUNDED):
+        return payment
+
+    if payment.payment_type == PaymentType.PAYMENT:
+        confirmable = (
+            booking.is_held()
+            and not Booking.objects.overlapping(
+                booking.room_id, booking.check_in, booking.check_out
+            )
+            .exclude(pk=booking.pk)
+            .exists()
+        )
+        if not confirmable:
+            payment.status = PaymentStatus.REFUNDED
+            payment.save(update_fields=["status"])
+            return payment
+        booking.status = "CONFIRMED"
+        booking.save(update_fields=["status"])
+
+    payment.status = PaymentStatus.PAID
+    payment.paid_at = timezone.now()
+    payment.save(update_fields=["status", "paid_at"])
+    return payment
+
+
+def create_payment(**fields):
+    # A savepoint, so a duplicate payment leaves the transaction usable.
+    with transaction.atomic():
+        return Payment.objects.create(**fields)
+
+
+@extend_schema(
+    tags=["Payments"],
+    summary="API for managing payments.",
+    description="""
+    API for creating, viewing, and listing payments for hotel bookings.
+    - Only authenticated users can access this API.
+    - Payment is created for a booking and a Stripe session is generated.
+    - Payment status can be PENDING, PAID, CANCELLED, EXPIRED, or FAILED.
+    - Payment type can be PAYMENT or FINE.
+    - The session_url is a Stripe link for payment.
+    """,
+)
+class PaymentViewSet(
+    ExportMixin,
+    SparseFieldsetMixin,
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Payment.objects.select_related("booking").all().order_by("-id")
+    serializer_class = PaymentSerializer
+    permission_classes = [IsAuthenticated]
+    export_fields = {
+        "id": "id",
+        "status": "status",
+        "payment_type": "payment_type",
+        "amount": "amount",
+        "paid_at": "paid_at",
+        "session_id": "session_id",
+        "booking_id": "booking_id",
+        "check_in": "booking__check_in",
+        "check_out": "booking__check_out",
+        "user_id": "booking__user_id",
+        "hotel_id": "booking__room__hotel_id",
+        "hotel": "booking__room__hotel__name",
+    }
+    export_date_field = "paid_at__date"
+    export_owner_field = "booking__room__hotel__owner"
+    export_filename = "payments"
+    export_permission_classes = [IsStaffOrHotelOwner]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "retrieve" or self.field_expanded("booking"):
+            queryset = queryset.select_related(
+                "booking__user", "booking__room__room_type"
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == "list":
+            return PaymentListSerializer
+        if self.action == "retrieve":
+            return PaymentDetailSerializer
+        return PaymentSerializer
+
+    @extend_schema(
+        summary="List payments",
+        description="Returns a list of payments for the authenticated user.",
+        parameters=[
+            OpenApiParameter("status", type=str, description="Payment status"),
+            OpenApiParameter(
+                "payment_type", type=str, description="Payment type"
+            ),
+        ],
+        responses={200: PaymentListSerializer(many=True)},
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Retrieve payment",
+        description="Returns detailed information about a payment.",
+        responses={200: PaymentDetailSerializer},
+    )
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @extend_schema(
+        summary="Create payment",
+        description="""
+        Create a new payment for a booking. Generates a Stripe session for
+        payment. Returns payment data including session_url for payment.
+        """,
+        request=PaymentSerializer,
+        responses={201: PaymentSerializer},
+    )
+    @transaction.atomic
+    def create(self, request, *args, **kwargs):
+        booking_id = request.data.get("booking")
+        payment_type = request.data.get("payment_type", PaymentType.PAYMENT)
+        booking = Booking.objects.get(id=booking_id)
+        session_data = create_stripe_session(booking, payment_type, request)
+        payment = Payment.objects.create(
+            booking=booking,
+            amount=session_data["amount"],
+            status=PaymentStatus.PENDING,
+            payment_type=payment_type,
+            session_url=session_data["session_url"],
+            session_id=session_data["session_id"],
+        )
+        serializer = self.get_serializer(payment)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+@extend_schema(tags=["Payments"])
+class PaymentCheckoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Create payment (async)",
+        description="""
+        Async variant of payment creation for ASGI deployments: the worker
+        keeps serving other requests while the Stripe session is created.
+        Only the booking's guest or staff can pay for a booking.
+        """,
+        request=PaymentCheckoutSerializer,
+        responses={201: PaymentSerializer},
+    )
+    async def post(self, request, *args, **kwargs):
+        serializer = PaymentCheckoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        bookings = Booking.objects.select_related("room__hotel")
+        if not request.user.is_staff:
+            bookings = bookings.filter(user_id=request.user.id)
+        booking = await bookings.filter(
+            pk=serializer.validated_data["booking"]
+        ).afirst()
+        if booking is None:
+            return Response(
+                {"detail": "Booking not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        payment_type = serializer.validated_data["payment_type"]
+        if payment_type == PaymentType.PAYMENT and not booking.is_held():
+            return Response(
+                {"booking": ["Only bookings on a live hold can be paid."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if await Payment.objects.filter(booking=booking).aexists():
+            return Response(
+                {"booking": ["This booking already has a payment."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        session_data = await acreate_stripe_session(
+            booking, payment_type, request
+        )
+        try:
+            payment = await sync_to_async(create_payment)(
+                booking=booking,
+                amount=session_data["amount"],
+                status=PaymentStatus.PENDING,
+                payment_type=payment_type,
+                session_url=session_data["session_url"],
+                session_id=session_data["session_id"],
+            )
+        except IntegrityError:
+            # A concurrent checkout created the booking's payment first.
+            await aexpire_stripe_session(session_data["session_id"])
+            return Response(
+                {"booking": ["This booking already has a payment."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        data = PaymentSerializer(payment, context={"request": request}).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+@extend_schema(tags=["Payments"])
+class PaymentSuccessView(APIView):
+    async def get(self, request, *args, **kwargs):
+        session_id = request.GET.get("session_id")
+        if (
+            not session_id
+            or not await Payment.objects.filter(
+                session_id=session_id
+            ).aexists()
+        ):
+            return Response({"status": "not found"}, status=404)
+        # Anyone can call this URL: only Stripe can tell it was paid.
+        session = await aretrieve_stripe_session(session_id)
+        if session.payment_status != "paid":
+            return Response(
+                {"status": "unpaid"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        payment = await sync_to_async(settle_payment)(session_id)
+        if payment is None:
+            return Response({"status": "not found"}, status=404)
+        if payment.status == PaymentStatus.REFUNDED:
+            # Retrying after a gateway error refunds it once.
+            await arefund_stripe_session(session)
+            return Response(
+                {
+                    "status": "refunded",
+                    "detail": "The booking's hold ran out before payment.",
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({"status": "success"})
+
+
+@extend_schema(tags=["Payments"])
+class PaymentCancelView(APIView):
+    async def get(self, request, *args, **kwargs):
+        session_id = request.GET.get("session_id")
+        payment = await Payment.objects.filter(session_id=session_id).afirst()
+        if payment:
+            payment.status = PaymentStatus.CANCELLED
+            await payment.asave()
+            return Response({"status": "cancelled"})
+        return Response({"status": "not found"}, status=404)
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-19 14:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hotels", "0006_query_indexes"),
+        ("reviews", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["hotel", "-created_at"], name="review_hotel_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["user", "-created_at"], name="review_user_created_idx"
+            ),
+        ),
+    ]
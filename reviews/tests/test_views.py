@@ -1,41 +1,97 @@
-from django.contrib.auth import get_user_model
-from django.test import TestCase
-from django.urls import reverse
-from rest_framework.test import APIClient
-
-from hotels.models import Hotel, Location
-
-
-class ReviewViewSimpleTest(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
-            username="guestuser", password="pass", role="guest"
-        )
-        self.location = Location.objects.create(country="UA", city="Kyiv")
-        self.hotel = Hotel.objects.create(
-            name="Test Hotel", location=self.location, owner=self.user
-        )
-        self.client = APIClient()
-    
-    def test_review_create_authenticated(self):
-        self.client.force_authenticate(user=self.user)
-        url = reverse("reviews:review-list")
-        data = {"hotel_id": self.hotel.id, "rating": 5, "comment": "Super!"}
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 201)
-        self.assertEqual(response.data["rating"], 5)
-        self.assertEqual(response.data["comment"], "Super!")
-    
-    def test_review_create_unauthenticated(self):
-        url = reverse("reviews:review-list")
-        data = {"hotel_id": self.hotel.id, "rating": 4, "comment": "Nice!"}
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 401)
-    
-    def test_review_unique_per_user_hotel(self):
-        self.client.force_authenticate(user=self.user)
-        url = reverse("reviews:review-list")
-        data = {"hotel_id": self.hotel.id, "rating": 5, "comment": "First!"}
-        self.client.post(url, data)
-        response = self.client.post(url, data)
-        self.assertEqual(response.status_code, 400)
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from booking_clone.queries import assert_no_repeated_queries
+from hotels.models import Hotel, Location
+from reviews.models import Review
+
+
+class ReviewViewSimpleTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="guestuser", password="pass", role="guest"
+        )
+        self.location = Location.objects.create(country="UA", city="Kyiv")
+        self.hotel = Hotel.objects.create(
+            name="Test Hotel", location=self.location, owner=self.user
+        )
+        self.client = APIClient()
+    
+    def test_review_create_authenticated(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("reviews:review-list")
+        data = {"hotel_id": self.hotel.id, "rating": 5, "comment": "Super!"}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["rating"], 5)
+        self.assertEqual(response.data["comment"], "Super!")
+    
+    def test_review_create_unauthenticated(self):
+        url = reverse("reviews:review-list")
+        data = {"hotel_id": self.hotel.id, "rating": 4, "comment": "Nice!"}
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 401)
+    
+    def test_review_unique_per_user_hotel(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("reviews:review-list")
+        data = {"hotel_id": self.hotel.id, "rating": 5, "comment": "First!"}
+        self.client.post(url, data)
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 400)
+
+
+class ReviewQueryPatternTest(TestCase):
+    """Review endpoints run the same number of queries per page."""
+
+    def setUp(self):
+        self.owner = get_user_model().objects.create_user(
+            username="owneruser", password="pass", role="owner"
+        )
+        self.staff = get_user_model().objects.create_user(
+            username="staffuser", password="pass", is_staff=True
+        )
+        self.hotels = [
+            Hotel.objects.create(
+                name=f"Hotel {index}",
+                location=Location.objects.create(
+                    country="UA", city=f"City {index}"
+                ),
+                owner=self.owner,
+            )
+            for index in range(5)
+        ]
+        for index, hotel in enumerate(self.hotels[:4]):
+            guest = get_user_model().objects.create_user(
+                username=f"guest{index}", password="pass"
+            )
+            self.review = Review.objects.create(
+                hotel=hotel, user=guest, rating=4, comment="Fine"
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def test_read_endpoints(self):
+        urls = [
+            reverse("reviews:review-list"),
+            reverse("reviews:review-detail", args=[self.review.id]),
+        ]
+        for url in urls:
+            with self.subTest(url=url), assert_no_repeated_queries():
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+    def test_write_endpoints(self):
+        with assert_no_repeated_queries():
+            response = self.client.post(
+                reverse("reviews:review-list"),
+                {"hotel_id": self.hotels[4].id, "rating": 5, "comment": "!"},
+            )
+            self.assertEqual(response.status_code, 201)
+            response = self.client.patch(
+                reverse("reviews:review-detail", args=[self.review.id]),
+                {"rating": 2},
+            )
+            self.assertEqual(response.status_code, 200)
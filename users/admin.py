@@ -1,12 +1,14 @@
-from django.contrib import admin
-from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-
-from users.models import User
-
-
-@admin.register(User)
-class UserAdmin(BaseUserAdmin):
-    list_display = ("id", "username", "email", "role", "is_active", "is_staff")
-    list_filter = ("role", "is_active", "is_staff")
-    search_fields = ("username", "email")
-    fieldsets = BaseUserAdmin.fieldsets + (("Role", {"fields": ("role",)}),)
+from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+
+from booking_clone.admin import LargeTableAdmin
+
+from users.models import User
+
+
+@admin.register(User)
+class UserAdmin(LargeTableAdmin, BaseUserAdmin):
+    list_display = ("id", "username", "email", "role", "is_active", "is_staff")
+    list_filter = ("role", "is_active", "is_staff")
+    search_fields = ("username", "email")
+    fieldsets = BaseUserAdmin.fieldsets + (("Role", {"fields": ("role",)}),)
@@ -0,0 +1,156 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+# Claims added to tokens by ClaimsTokenObtainPairSerializer.
+USER_CLAIMS = ("role", "is_staff")
+
+_users = OrderedDict()
+_users_lock = threading.Lock()
+
+
+def user_id_value(value):
+    """Token user ids are strings, convert them to the user id's type."""
+    field = get_user_model()._meta.get_field(api_settings.USER_ID_FIELD)
+    return field.to_python(value)
+
+
+def cached_user(user_id):
+    """
+    The user ``user_id`` or None, read through an in-process cache of
+    AUTH_USER_CACHE_SIZE users kept for AUTH_USER_CACHE_SECONDS. Saving or
+    deleting a user evicts it from the cache of the current process only,
+    other processes see the change once their entry expires.
+    """
+    user_id = user_id_value(user_id)
+    now = time.monotonic()
+    with _users_lock:
+        entry = _users.get(user_id)
+        if entry is not None and entry[0] > now:
+            _users.move_to_end(user_id)
+            return copy.copy(entry[1])
+
+    user = (
+        get_user_model()
+        ._default_manager.filter(**{api_settings.USER_ID_FIELD: user_id})
+        .first()
+    )
+    if user is not None:
+        with _users_lock:
+            _users[user_id] = (now + settings.AUTH_USER_CACHE_SECONDS, user)
+            _users.move_to_end(user_id)
+            while len(_users) > settings.AUTH_USER_CACHE_SIZE:
+                _users.popitem(last=False)
+        user = copy.copy(user)
+    return user
+
+
+def forget_user(user_id):
+    with _users_lock:
+        _users.pop(user_id_value(user_id), None)
+
+
+def load_user(user):
+    """The User row of ``request.user``, which may be a ClaimsUser."""
+    if isinstance(user, ClaimsUser):
+        return user.instance
+    return user
+
+
+class ClaimsUser(TokenUser):
+    """
+    Request user of safe requests, built from the claims of the access
+    token without a query: it has the user's id, role and staff status.
+    ``instance`` loads the User row when a view needs anything else.
+    """
+
+    @cached_property
+    def id(self):
+        return user_id_value(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def pk(self):
+        return self.id
+
+    @cached_property
+    def role(self):
+        return self.token["role"]
+
+    @cached_property
+    def instance(self):
+        user = cached_user(self.id)
+        if user is None:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+        return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication trusting the role and staff claims of the token for
+    safe requests, so reads run no user query. Other requests, and tokens
+    issued without these claims, get the User row, read through
+    cached_user().
+
+    A role or staff change, or a deactivation, reaches reads once the
+    user's tokens are reissued; AUTH_TRUST_TOKEN_CLAIMS turns the claims
+    path off.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+
+        if (
+            settings.AUTH_TRUST_TOKEN_CLAIMS
+            and request.method in SAFE_METHODS
+            and api_settings.USER_ID_CLAIM in validated_token
+            and all(claim in validated_token for claim in USER_CLAIMS)
+        ):
+            return ClaimsUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        user = cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(
+                _("User not found"), code="user_not_found"
+            )
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(
+                _("User is inactive"), code="user_inactive"
+            )
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."),
+                code="password_changed",
+            )
+        return user
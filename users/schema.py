@@ -0,0 +1,7 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    """Documents ClaimsJWTAuthentication as the bearer scheme ``jwtAuth``."""
+
+    target_class = "users.authentication.ClaimsJWTAuthentication"
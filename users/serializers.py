@@ -1,45 +1,95 @@
-from rest_framework import serializers
-
-from users.models import User
-
-
-class UserRegisterSerializer(serializers.ModelSerializer):
-    password = serializers.CharField(
-        write_only=True, style={"input_type": "password"}
-    )
-    password2 = serializers.CharField(
-        write_only=True, style={"input_type": "password"}
-    )
-
-    class Meta:
-        model = User
-        fields = [
-            "id",
-            "username",
-            "email",
-            "first_name",
-            "last_name",
-            "role",
-            "password",
-            "password2",
-        ]
-
-    def validate(self, attrs):
-        if attrs["password"] != attrs["password2"]:
-            raise serializers.ValidationError(
-                {"password": "Password must match."}
-            )
-        return attrs
-
-    def create(self, validated_data):
-        validated_data.pop("password2")
-        user = User(
-            username=validated_data["username"],
-            email=validated_data["email"],
-            first_name=validated_data.get("first_name", ""),
-            last_name=validated_data.get("last_name", ""),
-            role=validated_data.get("role", "guest"),
-        )
-        user.set_password(validated_data["password"])
-        user.save()
-        return user
+from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from users.models import User
+
+
+class UserRegisterSerializer(serializers.ModelSerializer):
+    password = serializers.CharField(
+        write_only=True, style={"input_type": "password"}
+    )
+    password2 = serializers.CharField(
+        write_only=True, style={"input_type": "password"}
+    )
+
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "username",
+            "email",
+            "first_name",
+            "last_name",
+            "role",
+            "password",
+            "password2",
+        ]
+
+    def validate(self, attrs):
+        if attrs["password"] != attrs["password2"]:
+            raise serializers.ValidationError(
+                {"password": "Password must match."}
+            )
+        return attrs
+
+    def create(self, validated_data):
+        validated_data.pop("password2")
+        user = User(
+            username=validated_data["username"],
+            email=validated_data["email"],
+            first_name=validated_data.get("first_name", ""),
+            last_name=validated_data.get("last_name", ""),
+            role=validated_data.get("role", "guest"),
+        )
+        user.set_password(validated_data["password"])
+        user.save()
+        return user
+
+
+def set_user_claims(token, user):
+    """Set the claims ClaimsJWTAuthentication trusts on reads."""
+    token["role"] = user.role
+    token["is_staff"] = user.is_staff
+    return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return set_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Reissues the claims of the access token from the user's row instead of
+    copying them from the refresh token, so a role or staff change reaches
+    reads with the next refresh. Deleted users and, with CHECK_REVOKE_TOKEN,
+    users whose password changed get no new token.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.get(api_settings.USER_ID_CLAIM)
+        users = User._default_manager.filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        )
+        user = users.first() if user_id else None
+        if user is None or (
+            api_settings.CHECK_REVOKE_TOKEN
+            and refresh.get(api_settings.REVOKE_TOKEN_CLAIM)
+            != get_md5_hash_password(user.password)
+        ):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"], "no_active_account"
+            )
+
+        data = super().validate(attrs)
+        access = refresh.access_token_class(data["access"])
+        data["access"] = str(set_user_claims(access, user))
+        return data
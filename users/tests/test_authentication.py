@@ -0,0 +1,129 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from hotels.models import Hotel
+from users.authentication import forget_user
+from users.models import User
+
+
+class ClaimsJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="owneruser", password="pass1234", role="owner"
+        )
+        self.hotel = Hotel.objects.create(name="Hotel", owner=self.user)
+        self.client = APIClient()
+        self.addCleanup(forget_user, self.user.pk)
+
+    def authenticate(self):
+        response = self.client.post(
+            reverse("users:token_obtain_pair"),
+            {"username": "owneruser", "password": "pass1234"},
+        )
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+        )
+
+    def user_queries(self, method, url, **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+        table = connection.ops.quote_name(User._meta.db_table)
+        count = sum(
+            query["sql"].split(" WHERE ")[0].endswith(f"FROM {table}")
+            for query in queries
+        )
+        return response, count
+
+    def test_reads_trust_token_claims(self):
+        self.authenticate()
+
+        response, count = self.user_queries(
+            "get", reverse("hotels:hotel-my-hotels")
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["name"], "Hotel")
+        self.assertEqual(count, 0)
+
+    def test_profile_loads_user(self):
+        self.authenticate()
+
+        response = self.client.get(reverse("users:user-profile"))
+
+        self.assertEqual(response.data["username"], "owneruser")
+
+    def test_writes_read_cached_user(self):
+        self.authenticate()
+        url = reverse("hotels:hotel-detail", args=[self.hotel.id])
+
+        response, count = self.user_queries(
+            "patch", url, data={"address": "1 Main St"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count, 1)
+
+        response, count = self.user_queries(
+            "patch", url, data={"address": "2 Main St"}
+        )
+        self.assertEqual(count, 0)
+
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.patch(url, {"address": "3 Main St"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_tokens_without_claims_load_user(self):
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        response, count = self.user_queries(
+            "get", reverse("hotels:hotel-my-hotels")
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(count, 1)
+
+    def test_refresh_reissues_claims_from_user(self):
+        self.user.is_staff = True
+        self.user.save()
+        refresh = self.client.post(
+            reverse("users:token_obtain_pair"),
+            {"username": "owneruser", "password": "pass1234"},
+        ).data["refresh"]
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.post(
+            reverse("users:token_refresh"), {"refresh": refresh}
+        )
+
+        self.assertFalse(AccessToken(response.data["access"])["is_staff"])
+        self.user.delete()
+        response = self.client.post(
+            reverse("users:token_refresh"), {"refresh": refresh}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_claims_user_matches_ids(self):
+        self.authenticate()
+
+        response = self.client.get(
+            reverse("hotels:hotel-analytics", args=[self.hotel.id])
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_schema_declares_bearer_scheme(self):
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+
+        self.assertEqual(
+            schema["components"]["securitySchemes"]["jwtAuth"]["scheme"],
+            "bearer",
+        )
+        operation = schema["paths"]["/hotels/"]["post"]
+        self.assertIn({"jwtAuth": []}, operation["security"])